@@ -1,8 +1,11 @@
 import os
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify, abort
 from config import config
-from extensions import db, migrate, cors
+from extensions import db, migrate, cors, jobs, ai_cache, ids, response_cache, recommender, metrics, query_guard, changes
 from models import Employee, Project, Task
+from services.database import engine_options, init_engine
+from services.json_provider import FastJSONProvider
+from services.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
 
 def create_app(config_name=None):
     """Application factory pattern"""
@@ -13,9 +16,29 @@ def create_app(config_name=None):
     app = Flask(__name__)
     app.config.from_object(config[config_name])
     
+    # JSON: orjson (kuruluysa) ve config'e göre girintisiz çıktı
+    app.json = FastJSONProvider(app)
+    app.json.compact = app.config['JSON_COMPACT']
+    app.json.use_orjson = app.json.use_orjson and app.config['JSON_USE_ORJSON']
+    
+    # Bağlantı havuzu (PostgreSQL) ve SQLite PRAGMA'ları
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config)
+    
     # Initialize extensions
     db.init_app(app)
+    init_engine(app, db)
     migrate.init_app(app, db)
+    jobs.init_app(app)
+    ai_cache.init_app(app)
+    ids.init_app(app)
+    response_cache.init_app(app, db)
+    # Olaylar önbellek geçersiz kılındıktan sonra yayınlanır (after_commit sırası)
+    changes.init_app(app, db)
+    recommender.init_app(app)
+    if app.config['METRICS_ENABLED']:
+        metrics.init_app(app)
+    if app.config['QUERY_GUARD_ENABLED']:
+        query_guard.init_app(app)
     cors.init_app(app, resources={
         r"/api/*": {
             "origins": app.config['CORS_ORIGINS'],
@@ -28,10 +51,16 @@ def create_app(config_name=None):
     from routes.employees import employees_bp
     from routes.projects import projects_bp
     from routes.tasks import tasks_bp
+    from routes.events import events_bp
     
     app.register_blueprint(employees_bp)
     app.register_blueprint(projects_bp)
     app.register_blueprint(tasks_bp)
+    app.register_blueprint(events_bp)
+    
+    # CLI commands (flask reconcile-counters, ...)
+    from commands import register_commands
+    register_commands(app)
     
     # Root endpoint
     @app.route('/')
@@ -42,7 +71,8 @@ def create_app(config_name=None):
             'endpoints': {
                 'employees': '/api/employees',
                 'projects': '/api/projects',
-                'tasks': '/api/tasks'
+                'tasks': '/api/tasks',
+                'events': '/api/events'
             }
         })
     
@@ -51,6 +81,18 @@ def create_app(config_name=None):
     def health():
         return jsonify({'status': 'healthy'})
     
+    # Response cache hit rates per endpoint
+    @app.route('/api/cache/stats')
+    def response_cache_stats():
+        return jsonify(response_cache.stats())
+    
+    # Prometheus metrics: per-route latency, SQL count/time, in-flight requests
+    @app.route('/metrics')
+    def prometheus_metrics():
+        if not app.config['METRICS_ENABLED']:
+            abort(404)
+        return Response(metrics.render(), content_type=METRICS_CONTENT_TYPE)
+    
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
@@ -73,10 +115,10 @@ def create_app(config_name=None):
     
     return app
 
-# Create app instance
-app = create_app()
-
+# Uygulama import sırasında oluşturulmaz: `flask` CLI create_app() fabrikasını,
+# production wsgi.py'yi kullanır (gunicorn -c gunicorn.conf.py wsgi:app)
 if __name__ == '__main__':
+    app = create_app()
     port = int(os.environ.get('PORT', 5000))
-    debug = os.environ.get('DEBUG', 'True') == 'True'
+    debug = os.environ.get('DEBUG', str(app.debug)) == 'True'
     app.run(host='0.0.0.0', port=port, debug=debug)
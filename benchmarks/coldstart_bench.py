@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Cold start of the production entry point (wsgi.py)
+Each run is a fresh Python process that imports wsgi (like the gunicorn
+master with preload_app), runs the per-worker init_worker() and then sends
+requests. Compares the first call of every request with its steady-state
+median, with and without the warm-up (WARMUP_ENABLED)
+
+The response cache is turned off in the measured process, so the numbers
+show the one-time costs (imports, mapper configuration, SQL compilation,
+assignee matrix) rather than cache hits.
+
+Usage:
+    python -m benchmarks.coldstart_bench           # 20k tasks
+    python -m benchmarks.coldstart_bench 100000
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+REQUESTS = [
+    ('GET', '/api/tasks?limit=50&status=Pending', None),
+    ('GET', '/api/projects/p1/stats', None),
+    ('GET', '/api/employees/e1/workload', None),
+    ('GET', '/api/employees/capacity-forecast?weeks=8', None),
+    ('POST', '/api/tasks/recommend-assignee',
+     {'required_skills': [{'name': 'python', 'level': 3}, {'name': 'docker', 'level': 2}], 'estimated_hours': 8}),
+]
+
+
+def child(repeat):
+    """Runs in the measured process; prints one JSON report"""
+    started = time.perf_counter()
+    from wsgi import app, startup
+    import_ms = (time.perf_counter() - started) * 1000
+    from extensions import db
+    from services.warmup import init_worker
+
+    worker = init_worker(app, db)
+    client = app.test_client()
+    results = []
+    for method, path, body in REQUESTS:
+        samples = []
+        for _ in range(repeat + 1):
+            start = time.perf_counter()
+            response = client.open(path, method=method, json=body)
+            samples.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, (path, response.status_code)
+        steady = sorted(samples[1:])
+        results.append({'request': f'{method} {path.split("?")[0]}', 'first_ms': samples[0],
+                        'steady_ms': steady[len(steady) // 2]})
+    print(json.dumps({'import_ms': import_ms, 'startup': startup, 'worker': worker, 'requests': results}))
+
+
+def measure(db_path, warmup, repeat):
+    env = dict(os.environ, FLASK_ENV='production', DATABASE_URL=f'sqlite:///{db_path}',
+               WARMUP_ENABLED=str(warmup), RESPONSE_CACHE_ENABLED='False', METRICS_ENABLED='True')
+    output = subprocess.run([sys.executable, '-m', 'benchmarks.coldstart_bench', '--child', str(repeat)],
+                            env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(size, repeat=20):
+    from benchmarks.common import make_app, populate
+
+    app, db_path = make_app()
+    try:
+        with app.app_context():
+            populate(size)
+        reports = {warmup: measure(db_path, warmup, repeat) for warmup in (False, True)}
+    finally:
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+    print(f"\n{size:,} tasks")
+    for warmup, report in reports.items():
+        print(f"warm-up {'on ' if warmup else 'off'}: import wsgi {report['import_ms']:.0f} ms "
+              f"(startup {report['startup']}), worker connect {report['worker']['connect_ms']} ms")
+    print(f"\n{'request':<42} | {'steady (ms)':>11} | {'first, cold':>11} | {'first, warm':>11}")
+    print('-' * 84)
+    for cold, warm in zip(reports[False]['requests'], reports[True]['requests']):
+        print(f"{cold['request']:<42} | {warm['steady_ms']:>11.1f} | {cold['first_ms']:>11.1f} | "
+              f"{warm['first_ms']:>11.1f}")
+    cold_total = sum(item['first_ms'] for item in reports[False]['requests'])
+    warm_total = sum(item['first_ms'] for item in reports[True]['requests'])
+    steady_total = sum(item['steady_ms'] for item in reports[True]['requests'])
+    print(f"{'total':<42} | {steady_total:>11.1f} | {cold_total:>11.1f} | {warm_total:>11.1f}")
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(int(sys.argv[2]))
+    else:
+        sizes = [int(arg) for arg in sys.argv[1:]] or [20000]
+        for size in sizes:
+            run(size)
@@ -0,0 +1,137 @@
+"""
+Shared helpers for benchmark scripts
+Builds a throwaway SQLite database and fills it with synthetic data
+shaped like seed.py
+"""
+import os
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+STATUSES = ['Pending', 'In Progress', 'Completed', 'Blocked']
+PRIORITIES = ['low', 'medium', 'high', 'critical']
+SKILLS = ['python', 'fastapi', 'postgresql', 'redis', 'docker', 'react',
+          'typescript', 'figma', 'kubernetes', 'aws', 'agile', 'scrum']
+LANGUAGES = ['en', 'tr', 'es', 'fr', 'de', 'zh']
+
+
+def make_app(db_path=None):
+    """Create a testing app bound to a fresh SQLite file.
+
+    Returns:
+        (app, db_path) tuple; the caller removes db_path when done
+    """
+    if db_path is None:
+        fd, db_path = tempfile.mkstemp(prefix='planllama_bench_', suffix='.db')
+        os.close(fd)
+    os.environ['TEST_DATABASE_URL'] = f'sqlite:///{db_path}'
+    # Ölçümler query guard'ın sorgu başına yükü olmadan yapılır
+    os.environ.setdefault('QUERY_GUARD_ENABLED', 'False')
+
+    # config okunmadan önce TEST_DATABASE_URL ayarlanmış olmalı
+    from app import create_app
+    from extensions import db
+
+    app = create_app('testing')
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    return app, db_path
+
+
+def _chunks(rows, size=5000):
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+def populate(n_tasks, n_employees=None, n_projects=None, seed=42):
+    """Insert synthetic employees, projects and tasks with bulk inserts.
+
+    Must be called inside an app context.
+    """
+    from extensions import db
+    from models import Employee, Project, Task, IdSequence
+    from services.counters import reconcile_project_counters
+    from services.ids import DEFAULT_START
+    from services.skills import rebuild_skill_index
+
+    rng = random.Random(seed)
+    n_employees = n_employees or max(10, n_tasks // 50)
+    n_projects = n_projects or max(5, n_tasks // 200)
+    now = datetime.utcnow()
+    today = date.today()
+
+    employees = []
+    for i in range(n_employees):
+        skills = rng.sample(SKILLS, 4)
+        employees.append({
+            'employee_id': f'e{i}',
+            'name': f'Employee {i}',
+            'role': 'Backend Engineer',
+            'user_role': 'pm' if i % 10 == 0 else 'executor',
+            'avatar': f'E{i % 100}',
+            'capacity_hours_per_week': 40,
+            'current_load_hours': 0,
+            'integrations': {'email': f'employee{i}@codelllama.ai'},
+            'languages': rng.sample(LANGUAGES, 2),
+            'skills': [{'name': s, 'level': rng.randint(1, 5)} for s in skills],
+            'timezone': 'UTC',
+            'created_at': now,
+            'updated_at': now
+        })
+
+    projects = [{
+        'project_id': f'p{i}',
+        'name': f'Project {i}',
+        'description': f'Synthetic project {i}',
+        'status': rng.choice(['Planning', 'In Progress', 'On Hold', 'Completed']),
+        'budget': rng.randint(1, 100) * 1000,
+        'priority': rng.choice(PRIORITIES),
+        'due_date': today + timedelta(days=rng.randint(7, 180)),
+        'created_at': now,
+        'updated_at': now
+    } for i in range(n_projects)]
+
+    tasks = []
+    for i in range(n_tasks):
+        status = rng.choice(STATUSES)
+        tasks.append({
+            'task_id': f't{i}',
+            'title': f'Task {i}',
+            'description': 'Synthetic task generated for benchmarking',
+            'status': status,
+            'priority': rng.choice(PRIORITIES),
+            'assignee_id': f'e{rng.randrange(n_employees)}',
+            'project_id': f'p{rng.randrange(n_projects)}',
+            'estimated_hours': float(rng.randint(1, 40)),
+            'due_date': today + timedelta(days=rng.randint(0, 120)),
+            'created_at': now,
+            'completed_at': now if status == 'Completed' else None,
+            'updated_at': now
+        })
+
+    for model, rows in ((Employee, employees), (Project, projects), (Task, tasks)):
+        for chunk in _chunks(rows):
+            db.session.execute(db.insert(model), chunk)
+    # Sentetik ID'ler (t0, p0, ...) sequence'ten alınmadı; yeni ID'ler bunların üstünden başlasın
+    db.session.execute(db.insert(IdSequence), [
+        {'name': 'task', 'next_value': max(DEFAULT_START, n_tasks)},
+        {'name': 'project', 'next_value': max(DEFAULT_START, n_projects)}
+    ])
+    reconcile_project_counters()
+    rebuild_skill_index()
+    db.session.commit()
+
+    return {'employees': n_employees, 'projects': n_projects, 'tasks': n_tasks}
+
+
+def timeit(func, repeat=5):
+    """Run func `repeat` times and return (best, median) in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[0], samples[len(samples) // 2]
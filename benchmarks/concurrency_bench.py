@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""
+SQLite read throughput while writes are committing
+Reader threads page through tasks while one writer thread keeps changing
+the status of a batch of tasks (PATCH /api/tasks/bulk-status, one commit
+per request). Compares the old connection setup
+(rollback journal, synchronous=FULL, no mmap) with the configured PRAGMAs
+from services/database.py (WAL, synchronous=NORMAL, busy timeout, mmap)
+
+Usage:
+    python -m benchmarks.concurrency_bench                 # 20k tasks, 4 readers, 5 s, 100 tasks/write
+    python -m benchmarks.concurrency_bench 20000 8 10 500  # tasks, readers, seconds, batch
+"""
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from benchmarks.common import make_app, populate
+
+STATUSES = ['Pending', 'In Progress', 'Completed', 'Blocked']
+
+MODES = [
+    ('rollback journal', {'SQLITE_JOURNAL_MODE': 'DELETE', 'SQLITE_SYNCHRONOUS': 'FULL', 'SQLITE_MMAP_SIZE': 0}),
+    ('WAL (config)', {}),
+]
+
+
+@contextmanager
+def overridden(cls, values):
+    """Temporarily set config class attributes (read by create_app)"""
+    saved = {key: getattr(cls, key) for key in values}
+    for key, value in values.items():
+        setattr(cls, key, value)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            setattr(cls, key, value)
+
+
+def _percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def run_mode(name, overrides, size, readers, seconds, batch):
+    from config import TestingConfig
+    from extensions import db, response_cache
+
+    with overridden(TestingConfig, overrides):
+        app, db_path = make_app()
+    try:
+        with app.app_context():
+            counts = populate(size)
+            journal_mode = db.session.execute(db.text('PRAGMA journal_mode')).scalar()
+            db.session.remove()
+        # Her okuma veritabanına gitsin
+        response_cache.enabled = False
+
+        stop = threading.Event()
+        latencies = [[] for _ in range(readers)]
+        writes = [0]
+        errors = [0]
+
+        def reader(slot):
+            client = app.test_client()
+            samples = latencies[slot]
+            i = slot
+            while not stop.is_set():
+                project = f"p{i % counts['projects']}"
+                start = time.perf_counter()
+                try:
+                    response = client.get(f'/api/tasks?project_id={project}&limit=50')
+                    ok = response.status_code == 200
+                except Exception:
+                    ok = False
+                samples.append((time.perf_counter() - start) * 1000)
+                if not ok:
+                    errors[0] += 1
+                i += readers
+
+        def writer():
+            client = app.test_client()
+            i = 0
+            while not stop.is_set():
+                first = (i * batch) % counts['tasks']
+                task_ids = [f"t{(first + k) % counts['tasks']}" for k in range(batch)]
+                try:
+                    response = client.patch('/api/tasks/bulk-status',
+                                            json={'task_ids': task_ids, 'status': STATUSES[i % len(STATUSES)]})
+                    ok = response.status_code == 200
+                except Exception:
+                    ok = False
+                if ok:
+                    writes[0] += 1
+                else:
+                    errors[0] += 1
+                i += 1
+
+        threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(readers)]
+        threads.append(threading.Thread(target=writer))
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        samples = sorted(sample for slot in latencies for sample in slot)
+        print(f"{name:<18} | {journal_mode:>7} | {len(samples) / seconds:>8.0f} | "
+              f"{_percentile(samples, 0.5):>8.1f} | {_percentile(samples, 0.95):>8.1f} | "
+              f"{_percentile(samples, 0.99):>8.1f} | {writes[0] * batch / seconds:>8.0f} | {errors[0]:>6}")
+    finally:
+        with app.app_context():
+            db.engine.dispose()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+
+def run(size, readers, seconds, batch):
+    print(f"\n{size:,} tasks, {readers} reader threads + 1 writer ({batch} tasks per commit), {seconds} s per mode")
+    print(f"{'mode':<18} | {'journal':>7} | {'reads/s':>8} | {'p50 ms':>8} | {'p95 ms':>8} | "
+          f"{'p99 ms':>8} | {'rows/s':>8} | {'errors':>6}")
+    print('-' * 95)
+    for name, overrides in MODES:
+        run_mode(name, overrides, size, readers, seconds, batch)
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:]]
+    size, readers, seconds, batch = (args + [20000, 4, 5, 100][len(args):])[:4]
+    run(size, readers, seconds, batch)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+Change feed fan-out: many idle /api/events clients, then a burst of writes
+Measures per-client memory while idle, the delay from commit to delivery
+at every client, and compares with the list polling the feed replaces
+
+Usage:
+    python -m benchmarks.events_bench                # 500 clients, 20 writes
+    python -m benchmarks.events_bench 2000 50        # clients, writes
+"""
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from benchmarks.common import make_app, populate, timeit
+
+POLL_INTERVAL = 5  # saniye; ön yüzün liste yenileme aralığı
+STATUSES = ['Pending', 'In Progress', 'Completed', 'Blocked']
+
+
+def _percentile(samples, fraction):
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))] if samples else 0.0
+
+
+def subscribe(app, url, arrivals, ready, stop):
+    """Read one event stream until stop is set; arrivals[event id] = receive time"""
+    client = app.test_client()
+    response = client.get(url, buffered=False)
+    ready.release()
+    for chunk in response.response:
+        now = time.perf_counter()
+        for line in chunk.decode('utf-8').split('\n'):
+            if line.startswith('id: '):
+                arrivals[line[4:]] = now
+        if stop.is_set():
+            break
+    response.close()
+
+
+def run(clients, writes):
+    from extensions import changes, response_cache
+
+    app, db_path = make_app()
+    try:
+        with app.app_context():
+            populate(10000)
+        changes.heartbeat = 30
+        changes.max_stream_seconds = 600
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        ready, stop = threading.Semaphore(0), threading.Event()
+        results = [{} for _ in range(clients)]
+        threads = []
+        start = time.perf_counter()
+        for i in range(clients):
+            # Yarısı tüm olayları, yarısı tek projeyi dinler
+            url = '/api/events' if i % 2 == 0 else f'/api/events?project_id=p{i % 50}'
+            thread = threading.Thread(target=subscribe, args=(app, url, results[i], ready, stop), daemon=True)
+            thread.start()
+            threads.append(thread)
+        for _ in range(clients):
+            ready.acquire()
+        connect_s = time.perf_counter() - start
+        time.sleep(0.5)
+        idle_bytes = (tracemalloc.get_traced_memory()[0] - before) / clients
+        tracemalloc.stop()
+
+        # Yayın anı: commit sonrası olay tampona eklendiğinde
+        published = {}
+        append = changes.buffer.append
+
+        def timed_append(event_id, entity, data):
+            published[event_id] = time.perf_counter()
+            append(event_id, entity, data)
+        changes.buffer.append = timed_append
+
+        writer = app.test_client()
+        for i in range(writes):
+            response = writer.patch(f'/api/tasks/t{i * 37}/status', json={'status': STATUSES[i % len(STATUSES)]})
+            assert response.status_code == 200
+            time.sleep(0.02)
+        time.sleep(1.0)
+
+        delays, complete = [], []
+        for event_id, at in published.items():
+            received = [arrivals[event_id] - at for arrivals in results if event_id in arrivals]
+            delays += received
+            if received:
+                complete.append(max(received))
+        delays.sort()
+        complete.sort()
+        delivered = len(delays)
+
+        # Bekleyen akışlar uyandırılır; sonraki heartbeat ile okuyucular bağlantıyı kapatır
+        stop.set()
+        changes.heartbeat = 0.1
+        append('0-0', 'task', {'action': 'shutdown'})
+        for thread in threads:
+            thread.join(timeout=10)
+
+        response_cache.enabled = False
+        poll = app.test_client()
+        _, poll_ms = timeit(lambda: poll.get('/api/tasks?project_id=p1&limit=100'), 10)
+
+        print(f"\n{clients:,} idle clients (half unfiltered, half ?project_id=), {writes} task writes")
+        print(f"connect all clients        {connect_s * 1000:>10.0f} ms")
+        print(f"Python heap per client     {idle_bytes / 1024:>10.1f} KB (idle, excluding thread stack)")
+        print(f"deliveries                 {delivered:>10,}")
+        print(f"commit -> client p50       {_percentile(delays, 0.5) * 1000:>10.2f} ms")
+        print(f"commit -> client p99       {_percentile(delays, 0.99) * 1000:>10.2f} ms")
+        print(f"commit -> all clients p50  {_percentile(complete, 0.5) * 1000:>10.2f} ms")
+        print(f"SQL per delivery           {0:>10}")
+        print(f"polling instead, every {POLL_INTERVAL} s: {clients / POLL_INTERVAL:,.0f} list requests/s "
+              f"x {poll_ms:.1f} ms = {clients / POLL_INTERVAL * poll_ms / 1000:.1f} CPU-s per second "
+              f"(response cache off)")
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:]]
+    clients, writes = (args + [500, 20][len(args):])[:2]
+    run(clients, writes)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Benchmark for GET /api/employees/capacity-forecast
+Compares spreading open task hours over weeks with a per-task Python loop
+against the vectorized NumPy version, and times the endpoint
+
+Usage:
+    python -m benchmarks.forecast_bench              # 5k employees, 100k tasks
+    python -m benchmarks.forecast_bench 5000:250000
+"""
+import os
+import sys
+from datetime import date
+from benchmarks.common import make_app, populate, timeit
+
+WEEKS = 12
+
+
+def legacy_forecast(weeks):
+    """Per-task loop over the ORM rows, one dict row per employee"""
+    from models import Employee, Task
+    from services.forecast import week_start
+
+    start = week_start(date.today())
+    load = {employee.employee_id: [0.0] * weeks for employee in Employee.query.all()}
+    for task in Task.query.filter(Task.assignee_id.isnot(None), Task.status != 'Completed'):
+        due_week = max((task.due_date - start).days // 7, 0)
+        per_week = (task.estimated_hours or 0) / (due_week + 1)
+        for week in range(min(due_week, weeks - 1) + 1):
+            load[task.assignee_id][week] += per_week
+    return load
+
+
+def run(n_employees, n_tasks):
+    from extensions import db, response_cache
+    from services.forecast import capacity_forecast
+
+    app, db_path = make_app()
+    response_cache.enabled = False
+    try:
+        with app.app_context():
+            populate(n_tasks, n_employees=n_employees)
+
+            def legacy():
+                result = legacy_forecast(WEEKS)
+                db.session.expunge_all()
+                return result
+
+            expected = legacy()
+            result = capacity_forecast(WEEKS)
+            assert all(abs(a - b) < 0.01 for row in result['employees']
+                       for a, b in zip(row['load_hours'], expected[row['employee_id']]))
+
+            legacy_ms = timeit(legacy, 3)
+            vectorized_ms = timeit(lambda: capacity_forecast(WEEKS), 5)
+
+        client = app.test_client()
+        endpoint_ms = timeit(lambda: client.get(f'/api/employees/capacity-forecast?weeks={WEEKS}'), 5)
+
+        print(f"{n_employees:>9,} | {n_tasks:>9,} | {legacy_ms[1]:>11.1f} | {vectorized_ms[1]:>15.1f} | "
+              f"{endpoint_ms[1]:>13.1f}")
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    sizes = [tuple(int(n) for n in arg.split(':')) for arg in sys.argv[1:]] or [(5000, 100000)]
+    print(f"{'employees':>9} | {'tasks':>9} | {'legacy (ms)':>11} | {'vectorized (ms)':>15} | {'endpoint (ms)':>13}")
+    print('-' * 70)
+    for n_employees, n_tasks in sizes:
+        run(n_employees, n_tasks)
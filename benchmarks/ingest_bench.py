@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Benchmark for ingesting LLM-generated tasks in /api/projects/generate-tasks
+Compares the old per-row path (ID retry loop, Employee.query.get and
+session.add per task) with the bulk ingestion path
+
+Usage:
+    python -m benchmarks.ingest_bench              # 50, 200 and 500 task plans
+    python -m benchmarks.ingest_bench 200 800
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+from sqlalchemy import event
+from benchmarks.common import make_app, populate, timeit
+
+
+def legacy_ingest(data, project_id, tasks_from_llm):
+    """Old implementation of the ingestion loop (before the bulk path)"""
+    from extensions import db
+    from models import Project, Task, Employee
+    from services.generation import parse_estimate
+
+    project = Project(project_id=project_id, name=data['project_title'], status='Planning',
+                      priority='high', due_date=date.today() + timedelta(weeks=3))
+    db.session.add(project)
+
+    for t in tasks_from_llm:
+        f = t["fields"]
+        assignee_id = f.get("assignee", {}).get("accountId")
+
+        task_id = f"t{random.randint(100, 999)}"
+        while Task.query.get(task_id):
+            task_id = f"t{random.randint(100, 999)}"
+
+        task = Task(
+            task_id=task_id,
+            title=f.get("summary"),
+            estimated_hours=parse_estimate(f.get("timetracking", {}).get("originalEstimate", "0d")),
+            priority=f.get("priority", {}).get("name", "Medium").lower(),
+            status="Pending",
+            assignee_id=assignee_id,
+            project_id=project_id,
+            due_date=datetime.strptime(f.get("duedate"), "%Y-%m-%d").date(),
+            created_at=datetime.utcnow()
+        )
+        db.session.add(task)
+        task.to_dict()
+
+        if assignee_id:
+            emp = Employee.query.get(assignee_id)
+            if emp:
+                emp.current_load_hours = (emp.current_load_hours or 0) + task.estimated_hours
+
+    db.session.commit()
+
+
+def run(plan_size):
+    from extensions import db
+    from models import Project, Task
+    from services.generation import create_project_with_tasks
+    from fake_ai_server import build_jira_json
+
+    app, db_path = make_app()
+    try:
+        with app.app_context():
+            populate(0, n_employees=20, n_projects=1)
+            team = [{'employee_id': f'e{i}', 'name': f'Employee {i}'} for i in range(20)]
+            data = {'project_title': 'Bench', 'metadata': {}, 'team': team}
+            tasks = build_jira_json({'json_input': data}, plan_size)['tasks']
+
+            statements = [0]
+            event.listen(db.engine, 'before_cursor_execute',
+                         lambda *args: statements.__setitem__(0, statements[0] + 1))
+
+            def reset():
+                db.session.execute(db.delete(Task).where(Task.project_id == 'pbench'))
+                db.session.execute(db.delete(Project).where(Project.project_id == 'pbench'))
+                db.session.commit()
+                db.session.expunge_all()
+
+            results = {}
+            for name, ingest in (('legacy', legacy_ingest), ('bulk', create_project_with_tasks)):
+                def once():
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        ingest(data, 'pbench', tasks)
+                    reset()
+
+                reset()
+                statements[0] = 0
+                once()
+                # reset() 3 ifade çalıştırır
+                count = statements[0] - 3
+                results[name] = (timeit(once, 5)[1], count)
+
+        print(f"{plan_size:>6} | {results['legacy'][0]:>12.1f} | {results['legacy'][1]:>12} | "
+              f"{results['bulk'][0]:>10.1f} | {results['bulk'][1]:>10}")
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [50, 200, 500]
+    print(f"{'tasks':>6} | {'legacy (ms)':>12} | {'legacy SQL':>12} | {'bulk (ms)':>10} | {'bulk SQL':>10}")
+    print('-' * 64)
+    for size in sizes:
+        run(size)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Serialization micro-benchmark for task lists
+Compares Flask's stdlib JSON provider (indented and compact) with
+services/json_provider.FastJSONProvider (orjson and stdlib fallback)
+
+Usage:
+    python -m benchmarks.json_bench              # 10k tasks
+    python -m benchmarks.json_bench 10000 50000
+"""
+import os
+import sys
+from flask.json.provider import DefaultJSONProvider
+from benchmarks.common import make_app, populate, timeit
+
+
+def legacy_to_dict(task):
+    """Old Task.to_dict(enrich=True): every date converted with isoformat()"""
+    return {
+        'task_id': task.task_id,
+        'title': task.title,
+        'description': task.description,
+        'status': task.status,
+        'priority': task.priority,
+        'assignee_id': task.assignee_id,
+        'project_id': task.project_id,
+        'estimatedHours': task.estimated_hours,
+        'dueDate': task.due_date.isoformat() if task.due_date else None,
+        'createdAt': task.created_at.date().isoformat() if task.created_at else None,
+        'completedAt': task.completed_at.isoformat() if task.completed_at else None,
+        'assignee': task.assignee.name if task.assignee else 'Unassigned',
+        'project': task.project.name if task.project else 'Unknown Project'
+    }
+
+
+def run(size):
+    from models import Task
+    from services.json_provider import FastJSONProvider, orjson
+
+    app, db_path = make_app()
+    try:
+        with app.test_request_context():
+            populate(size)
+            tasks = Task.query.options(*Task.enrich_options()).all()
+            legacy_rows = [legacy_to_dict(task) for task in tasks]
+            rows = [task.to_dict(enrich=True) for task in tasks]
+
+            stdlib = DefaultJSONProvider(app)
+            fallback = FastJSONProvider(app)
+            fallback.use_orjson = False
+            fallback.compact = True
+            fast = FastJSONProvider(app)
+            fast.compact = True
+            fast_pretty = FastJSONProvider(app)
+            fast_pretty.compact = False
+
+            cases = [
+                ('to_dict + isoformat()', lambda: [legacy_to_dict(task) for task in tasks]),
+                ('to_dict, native dates', lambda: [task.to_dict(enrich=True) for task in tasks]),
+                ('stdlib indent=2 (old dev)', lambda: stdlib.dumps(legacy_rows, indent=2)),
+                ('stdlib compact (old prod)', lambda: stdlib.dumps(legacy_rows, separators=(',', ':'))),
+                ('fast, stdlib fallback', lambda: fallback.response(rows).get_data()),
+            ]
+            if orjson is not None:
+                cases += [
+                    ('fast, orjson indent', lambda: fast_pretty.response(rows).get_data()),
+                    ('fast, orjson compact', lambda: fast.response(rows).get_data()),
+                ]
+            else:
+                print('orjson is not installed; only the stdlib fallback is measured')
+
+            print(f"\n{size:,} tasks")
+            print(f"{'case':<28} | {'best (ms)':>10} | {'median (ms)':>12} | {'bytes':>10}")
+            print('-' * 70)
+            for name, func in cases:
+                best, median = timeit(func, 7)
+                result = func()
+                size_bytes = len(result) if isinstance(result, (str, bytes)) else ''
+                print(f"{name:<28} | {best:>10.1f} | {median:>12.1f} | {size_bytes:>10}")
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000]
+    for size in sizes:
+        run(size)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Benchmark for POST /api/tasks/recommend-assignee
+Measures building the employee x skill matrix, the incremental refresh after
+a task write, vectorized scoring, and compares scoring with a per-employee
+Python loop over the JSON columns
+
+Usage:
+    python -m benchmarks.recommend_bench              # 10k and 50k employees
+    python -m benchmarks.recommend_bench 100000
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+import numpy as np
+from benchmarks.common import make_app, populate, timeit
+
+REQUIREMENTS = {'python': 4, 'postgresql': 3, 'docker': 2}
+HOURS = 16
+
+
+def legacy_recommend(requirements, hours, top_k=5):
+    """Per-employee Python scoring straight from the Employee rows"""
+    from models import Employee
+
+    scored = []
+    for employee in Employee.query.all():
+        levels = {skill['name'].lower(): max(skill.get('level', 0), 1) for skill in employee.skills or []}
+        skill_match = sum(min(levels.get(name, 0) / max(level, 1), 1) for name, level in requirements.items())
+        capacity = employee.capacity_hours_per_week or 1
+        free = capacity - (employee.current_load_hours or 0)
+        availability = min(max((free - hours) / capacity, 0), 1)
+        scored.append((0.6 * skill_match / len(requirements) + 0.3 * availability) / 0.9)
+    return sorted(scored, reverse=True)[:top_k]
+
+
+def run(size):
+    from sqlalchemy import update
+    from extensions import db, recommender
+    from models import Employee
+    from services.recommend import build_matrix, refresh_employee_columns, score_employees
+    from services.workload import apply_load_deltas
+
+    app, db_path = make_app()
+    try:
+        with app.app_context():
+            populate(0, n_employees=size, n_projects=1)
+
+            # Seed verisi eski olsun; refresh yalnızca aşağıdaki yazmadan etkilenenleri okumalı
+            db.session.execute(update(Employee).values(updated_at=datetime.utcnow() - timedelta(hours=1)))
+            db.session.commit()
+
+            build_ms = timeit(build_matrix, 3)
+            matrix = build_matrix()
+            apply_load_deltas({employee_id: HOURS for employee_id in matrix.employee_ids[:10]})
+            db.session.commit()
+            refresh_ms = timeit(lambda: refresh_employee_columns(matrix), 5)
+            refreshed, rebuilt = refresh_employee_columns(matrix), build_matrix()
+            assert np.array_equal(refreshed.load, rebuilt.load)
+            matrix = rebuilt
+            score_ms = timeit(lambda: score_employees(matrix, REQUIREMENTS, HOURS, language='en'), 20)
+
+            def legacy():
+                legacy_recommend(REQUIREMENTS, HOURS)
+                db.session.expunge_all()
+
+            legacy_ms = timeit(legacy, 3)
+
+        client = app.test_client()
+        body = {'required_skills': [f'{name}:{level}' for name, level in REQUIREMENTS.items()],
+                'estimated_hours': HOURS, 'language': 'en'}
+        client.post('/api/tasks/recommend-assignee', json=body)
+        endpoint_ms = timeit(lambda: client.post('/api/tasks/recommend-assignee', json=body), 20)
+
+        print(f"{size:>9,} | {legacy_ms[1]:>11.1f} | {build_ms[1]:>10.1f} | {refresh_ms[1]:>12.1f} | "
+              f"{score_ms[1]:>10.2f} | {endpoint_ms[1]:>13.2f}")
+        assert recommender.stats()['builds'] == 1
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 50000]
+    print(f"{'employees':>9} | {'legacy (ms)':>11} | {'build (ms)':>10} | {'refresh (ms)':>12} | "
+          f"{'score (ms)':>10} | {'endpoint (ms)':>13}")
+    print('-' * 82)
+    for size in sizes:
+        run(size)
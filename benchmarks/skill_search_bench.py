@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Benchmark for GET /api/employees/search
+Compares scanning every employee's skills/languages JSON in Python with the
+indexed employee_skills/employee_languages query
+
+Usage:
+    python -m benchmarks.skill_search_bench              # 50k employees
+    python -m benchmarks.skill_search_bench 10000 100000
+"""
+import os
+import sys
+from benchmarks.common import make_app, populate, timeit
+
+REQUIREMENTS = {'python': 4, 'postgresql': 3}
+LANGUAGES = ['en']
+
+
+def legacy_search(requirements, languages):
+    """Old approach: load all employees and filter the JSON columns in Python"""
+    from models import Employee
+
+    matches = []
+    for employee in Employee.query.all():
+        levels = {skill['name'].lower(): skill.get('level', 0) for skill in employee.skills or []}
+        spoken = {code.lower() for code in employee.languages or []}
+        if (all(levels.get(name, -1) >= level for name, level in requirements.items())
+                and all(code in spoken for code in languages)):
+            matches.append(employee)
+    return matches
+
+
+def run(size):
+    from extensions import db, response_cache
+    from services.skills import search_query
+
+    app, db_path = make_app()
+    response_cache.enabled = False
+    try:
+        with app.app_context():
+            populate(0, n_employees=size, n_projects=1)
+
+            def legacy():
+                result = legacy_search(REQUIREMENTS, LANGUAGES)
+                db.session.expunge_all()
+                return result
+
+            def indexed():
+                result = search_query(REQUIREMENTS, LANGUAGES).all()
+                db.session.expunge_all()
+                return result
+
+            expected = sorted(e.employee_id for e in legacy())
+            assert sorted(e.employee_id for e in indexed()) == expected
+
+            legacy_ms = timeit(legacy, 5)
+            indexed_ms = timeit(indexed, 5)
+
+        client = app.test_client()
+        url = '/api/employees/search?skill=python:4&skill=postgresql:3&language=en'
+        endpoint_ms = timeit(lambda: client.get(url), 5)
+
+        print(f"{size:>9,} | {len(expected):>7} | {legacy_ms[1]:>12.1f} | {indexed_ms[1]:>12.1f} | "
+              f"{endpoint_ms[1]:>13.1f}")
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [50000]
+    print(f"{'employees':>9} | {'matches':>7} | {'legacy (ms)':>12} | {'index (ms)':>12} | {'endpoint (ms)':>13}")
+    print('-' * 66)
+    for size in sizes:
+        run(size)
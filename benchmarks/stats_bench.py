@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Benchmark for /api/tasks/stats and /api/projects/<id>/stats
+Compares the old in-Python aggregation with the SQL aggregate query
+
+Usage:
+    python -m benchmarks.stats_bench                 # 10k, 100k, 1M tasks
+    python -m benchmarks.stats_bench 10000 50000     # custom sizes
+"""
+import os
+import sys
+from benchmarks.common import make_app, populate, timeit
+
+
+def legacy_stats(tasks):
+    """Old implementation: hydrate every Task and filter in Python"""
+    return {
+        'total': len(tasks),
+        'by_status': {s: len([t for t in tasks if t.status == s])
+                      for s in ('Pending', 'In Progress', 'Completed', 'Blocked')},
+        'by_priority': {p: len([t for t in tasks if t.priority == p])
+                        for p in ('critical', 'high', 'medium', 'low')},
+        'estimated_hours': {
+            'total': sum(t.estimated_hours for t in tasks),
+            'completed': sum(t.estimated_hours for t in tasks if t.status == 'Completed'),
+            'remaining': sum(t.estimated_hours for t in tasks if t.status != 'Completed')
+        }
+    }
+
+
+def run(size):
+    app, db_path = make_app()
+    try:
+        from extensions import db
+        from models import Task
+        from services.stats import task_aggregates
+
+        with app.app_context():
+            populate(size)
+            repeat = 3 if size >= 1000000 else 5
+
+            def legacy():
+                legacy_stats(Task.query.all())
+                db.session.expunge_all()
+
+            legacy_ms = timeit(legacy, repeat)
+            sql_ms = timeit(task_aggregates, repeat)
+            project_ms = timeit(lambda: task_aggregates(Task.project_id == 'p0'), repeat)
+
+        client = app.test_client()
+        endpoint_ms = timeit(lambda: client.get('/api/tasks/stats'), repeat)
+
+        print(f"{size:>10,} | {legacy_ms[1]:>12.1f} | {sql_ms[1]:>10.1f} | "
+              f"{project_ms[1]:>12.1f} | {endpoint_ms[1]:>12.1f}")
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]
+    print(f"{'tasks':>10} | {'python (ms)':>12} | {'sql (ms)':>10} | "
+          f"{'project (ms)':>12} | {'GET (ms)':>12}")
+    print('-' * 68)
+    for size in sizes:
+        run(size)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Time to first task: blocking generate-tasks vs the SSE stream
+The fake AI service waits `delay` seconds before the first task and
+`task-delay` seconds per task. The blocking endpoint answers once the whole
+document is generated and stored; the stream sends every task as soon as it
+is committed. Also checks that a stream failing halfway leaves no project,
+tasks or assignee load behind
+
+Usage:
+    python -m benchmarks.stream_bench                  # 20 tasks, 0.5 s + 0.1 s/task
+    python -m benchmarks.stream_bench 50 1.0 0.2       # tasks, delay, task delay
+"""
+import contextlib
+import json
+import os
+import sys
+import time
+from benchmarks.common import make_app, populate
+from benchmarks.suite import fake_ai_server
+
+
+def read_events(response):
+    """Yield (event, data) from an unbuffered text/event-stream test response"""
+    buffer = ''
+    for chunk in response.response:
+        buffer += chunk.decode('utf-8') if isinstance(chunk, bytes) else chunk
+        while '\n\n' in buffer:
+            message, buffer = buffer.split('\n\n', 1)
+            fields = dict(line.split(': ', 1) for line in message.split('\n') if not line.startswith(':'))
+            yield fields.get('event'), json.loads(fields['data'])
+
+
+def brief(i, team):
+    return {'project_title': f'Streamed project {i}', 'metadata': {}, 'team': team}
+
+
+def total_load(team_ids):
+    from models import Employee
+    return sum(e.current_load_hours or 0 for e in Employee.query.filter(Employee.employee_id.in_(team_ids)))
+
+
+def run(task_count, delay, task_delay):
+    from models import Project, Task
+
+    app, db_path = make_app()
+    try:
+        with app.app_context():
+            populate(2000)
+        team = [{'employee_id': f'e{i}', 'name': f'Employee {i}'} for i in range(5)]
+        client = app.test_client()
+
+        print(f"\n{task_count} tasks, first task after {delay} s, {task_delay} s per task")
+        print(f"{'endpoint':<36} | {'first task (ms)':>15} | {'all tasks (ms)':>15}")
+        print('-' * 73)
+        with fake_ai_server(task_count, delay=delay, task_delay=task_delay), \
+                open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            response = client.post('/api/projects/generate-tasks?cache=false', json=brief(0, team))
+            blocking_ms = (time.perf_counter() - start) * 1000
+            assert response.status_code == 201, response.get_json()
+
+            start = time.perf_counter()
+            response = client.post('/api/projects/generate-tasks/stream?cache=false', json=brief(1, team),
+                                   buffered=False)
+            assert response.status_code == 200 and response.mimetype == 'text/event-stream'
+            first_ms, events = None, []
+            for event, data in read_events(response):
+                events.append(event)
+                if event == 'task' and first_ms is None:
+                    first_ms = (time.perf_counter() - start) * 1000
+            stream_ms = (time.perf_counter() - start) * 1000
+            response.close()
+
+        print(f"{'POST generate-tasks':<36} | {blocking_ms:>15.0f} | {blocking_ms:>15.0f}")
+        print(f"{'POST generate-tasks/stream (SSE)':<36} | {first_ms:>15.0f} | {stream_ms:>15.0f}")
+        assert events == ['project'] + ['task'] * task_count + ['done'], events
+
+        with app.app_context():
+            project = Project.query.filter_by(name='Streamed project 1').one()
+            assert project.tasks_count == task_count == Task.query.filter_by(project_id=project.project_id).count()
+            load_before = total_load([member['employee_id'] for member in team])
+
+        # Yarıda kesilen akış: proje, görevler ve çalışan yükü geri alınmalı
+        with fake_ai_server(task_count, fail_after=task_count // 2), \
+                open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            response = client.post('/api/projects/generate-tasks/stream?cache=false', json=brief(2, team),
+                                   buffered=False)
+            events = [event for event, _ in read_events(response)]
+            response.close()
+        assert events == ['project'] + ['task'] * (task_count // 2) + ['error'], events
+        with app.app_context():
+            assert Project.query.filter_by(name='Streamed project 2').first() is None
+            assert total_load([member['employee_id'] for member in team]) == load_before
+        print('failed stream rolled back: ok')
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    run(int(args[0]) if args else 20,
+        float(args[1]) if len(args) > 1 else 0.5,
+        float(args[2]) if len(args) > 2 else 0.1)
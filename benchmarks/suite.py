@@ -0,0 +1,385 @@
+#!/usr/bin/env python
+"""
+Endpoint benchmark suite
+Builds a synthetic dataset shaped like seed.py, drives every blueprint
+route through the Flask test client and writes a JSON report with latency
+percentiles, SQL statement counts and peak memory per case. Two reports
+can be compared to catch regressions between commits.
+
+The response cache is disabled unless --with-cache is given, so every
+request measures the view itself.
+
+Usage:
+    python -m benchmarks.suite                                  # small scale
+    python -m benchmarks.suite --scale medium --repeat 50 -o output/bench/medium.json
+    python -m benchmarks.suite --employees 500 --projects 100 --tasks 20000
+    python -m benchmarks.suite --compare output/bench/base.json output/bench/new.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from benchmarks.common import make_app, populate
+
+# employees, projects, tasks
+SCALES = {
+    'small': (200, 50, 5000),
+    'medium': (1000, 200, 50000),
+    'large': (5000, 1000, 250000)
+}
+
+# Compare: p50/p95 için izin verilen artış oranı ve gürültü sayılan mutlak fark
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_MS = 1.0
+
+# path/body may be callables taking the context dict; setup(client, ctx)
+# runs untimed before every request and may add keys to ctx (e.g. an ID to delete)
+Case = namedtuple('Case', ['name', 'method', 'path', 'body', 'setup'], defaults=(None, None))
+
+DUE = (date.today() + timedelta(days=30)).isoformat()
+TEAM = [{'employee_id': 'e1', 'name': 'Employee 1', 'skills': ['python']},
+        {'employee_id': 'e2', 'name': 'Employee 2', 'skills': ['react']}]
+
+
+def _created_id(client, path, body, key):
+    response = client.post(path, json=body)
+    assert response.status_code == 201, (path, response.status_code, response.get_data(as_text=True))
+    return response.get_json()[key]
+
+
+def _new_task(client, ctx):
+    ctx['task_id'] = _created_id(client, '/api/tasks', {
+        'title': f"Disposable {ctx['i']}", 'project_id': 'p1', 'assignee_id': 'e1',
+        'estimated_hours': 2, 'due_date': DUE}, 'task_id')
+
+
+def _new_project(client, ctx):
+    ctx['project_id'] = _created_id(client, '/api/projects', {
+        'name': f"Disposable project {ctx['i']}", 'dueDate': DUE}, 'project_id')
+
+
+def _new_employee(client, ctx):
+    ctx['employee_id'] = _created_id(client, '/api/employees', {
+        'employee_id': f"bd{ctx['i']}", 'name': 'Disposable', 'role': 'Engineer',
+        'user_role': 'executor', 'avatar': 'DE'}, 'employee_id')
+
+
+def _finished_job(client, ctx):
+    if 'job_id' not in ctx:
+        response = client.post('/api/projects/generate-tasks?async=true',
+                               json={'project_title': 'Bench async', 'metadata': {}, 'team': TEAM})
+        ctx['job_id'] = response.get_json()['job_id']
+        while client.get(f"/api/projects/generate-tasks/jobs/{ctx['job_id']}").get_json()['status'] in (
+                'queued', 'running'):
+            time.sleep(0.01)
+
+
+STATUSES = ['Pending', 'In Progress', 'Blocked']
+
+# Okumalar önce, silmeler en sonda; yazmalar veri kümesini çok az değiştirir
+CASES = [
+    Case('GET /', 'GET', '/'),
+    Case('GET /health', 'GET', '/health'),
+    Case('GET /api/cache/stats', 'GET', '/api/cache/stats'),
+
+    Case('GET /api/employees', 'GET', '/api/employees'),
+    Case('GET /api/employees?limit=100', 'GET', '/api/employees?limit=100'),
+    Case('GET /api/employees/<id>', 'GET', '/api/employees/e1'),
+    Case('GET /api/employees/<id>/workload', 'GET', '/api/employees/e1/workload'),
+    Case('GET /api/employees/search', 'GET', '/api/employees/search?skill=python:3&language=en'),
+    Case('GET /api/employees/capacity-forecast', 'GET', '/api/employees/capacity-forecast?weeks=12'),
+
+    Case('GET /api/projects', 'GET', '/api/projects'),
+    Case('GET /api/projects/<id>', 'GET', '/api/projects/p1'),
+    Case('GET /api/projects/<id>?include_tasks=true', 'GET', '/api/projects/p1?include_tasks=true'),
+    Case('GET /api/projects/<id>/tasks', 'GET', '/api/projects/p1/tasks'),
+    Case('GET /api/projects/<id>/members', 'GET', '/api/projects/p1/members'),
+    Case('GET /api/projects/<id>/stats', 'GET', '/api/projects/p1/stats'),
+    Case('GET /api/projects/generate-tasks/cache', 'GET', '/api/projects/generate-tasks/cache'),
+
+    Case('GET /api/tasks', 'GET', '/api/tasks'),
+    Case('GET /api/tasks?enrich=true', 'GET', '/api/tasks?enrich=true'),
+    Case('GET /api/tasks?limit=100', 'GET', '/api/tasks?limit=100&enrich=true'),
+    Case('GET /api/tasks?fields=', 'GET', '/api/tasks?fields=task_id,title,status'),
+    Case('GET /api/tasks?stream=true', 'GET', '/api/tasks?stream=true'),
+    Case('GET /api/tasks/<id>', 'GET', '/api/tasks/t1'),
+    Case('GET /api/tasks/stats', 'GET', '/api/tasks/stats'),
+    Case('GET /api/tasks/by-assignee/<id>', 'GET', '/api/tasks/by-assignee/e1'),
+    Case('GET /api/tasks/by-project/<id>', 'GET', '/api/tasks/by-project/p1'),
+    Case('POST /api/tasks/recommend-assignee', 'POST', '/api/tasks/recommend-assignee',
+         {'required_skills': ['python:3', 'docker:2'], 'estimated_hours': 8, 'language': 'en'}),
+
+    Case('POST /api/employees', 'POST', '/api/employees', lambda ctx: {
+        'employee_id': f"bc{ctx['i']}", 'name': f"Bench {ctx['i']}", 'role': 'Engineer',
+        'user_role': 'executor', 'avatar': 'BE', 'skills': [{'name': 'python', 'level': 3}]}),
+    Case('PUT /api/employees/<id>', 'PUT', '/api/employees/e2', lambda ctx: {
+        'name': f"Employee 2 ({ctx['i']})"}),
+    Case('POST /api/employees/reconcile-workload', 'POST', '/api/employees/reconcile-workload?dry_run=true'),
+
+    Case('POST /api/projects', 'POST', '/api/projects', lambda ctx: {
+        'name': f"Bench project {ctx['i']}", 'dueDate': DUE}),
+    Case('PUT /api/projects/<id>', 'PUT', '/api/projects/p2', lambda ctx: {
+        'description': f"Updated {ctx['i']}"}),
+    Case('POST /api/projects/generate-tasks', 'POST', '/api/projects/generate-tasks', lambda ctx: {
+        'project_title': f"Bench generated {ctx['i']}", 'metadata': {}, 'team': TEAM}),
+    Case('POST /api/projects/generate-tasks/stream', 'POST', '/api/projects/generate-tasks/stream', lambda ctx: {
+        'project_title': f"Bench streamed {ctx['i']}", 'metadata': {}, 'team': TEAM}),
+    Case('GET /api/projects/generate-tasks/jobs/<id>', 'GET',
+         lambda ctx: f"/api/projects/generate-tasks/jobs/{ctx['job_id']}", setup=_finished_job),
+    Case('DELETE /api/projects/generate-tasks/cache', 'DELETE', '/api/projects/generate-tasks/cache'),
+
+    Case('POST /api/tasks', 'POST', '/api/tasks', lambda ctx: {
+        'title': f"Bench task {ctx['i']}", 'project_id': 'p1', 'assignee_id': 'e1',
+        'estimated_hours': 4, 'due_date': DUE}),
+    Case('PUT /api/tasks/<id>', 'PUT', '/api/tasks/t2', lambda ctx: {
+        'priority': ['low', 'medium', 'high'][ctx['i'] % 3]}),
+    Case('PATCH /api/tasks/<id>/status', 'PATCH', '/api/tasks/t3/status', lambda ctx: {
+        'status': STATUSES[ctx['i'] % 3]}),
+    Case('POST /api/tasks/bulk', 'POST', '/api/tasks/bulk', lambda ctx: {'tasks': [{
+        'title': f"Bulk {ctx['i']}-{n}", 'project_id': 'p1', 'assignee_id': f'e{n}',
+        'estimated_hours': 1, 'due_date': DUE} for n in range(50)]}),
+    Case('PATCH /api/tasks/bulk', 'PATCH', '/api/tasks/bulk', lambda ctx: {'tasks': [{
+        'task_id': f't{n}', 'priority': ['low', 'high'][ctx['i'] % 2]} for n in range(10, 60)]}),
+    Case('PATCH /api/tasks/bulk-status', 'PATCH', '/api/tasks/bulk-status', lambda ctx: {
+        'task_ids': [f't{n}' for n in range(60, 110)], 'status': STATUSES[ctx['i'] % 3]}),
+
+    Case('DELETE /api/tasks/<id>', 'DELETE', lambda ctx: f"/api/tasks/{ctx['task_id']}", setup=_new_task),
+    Case('DELETE /api/projects/<id>', 'DELETE', lambda ctx: f"/api/projects/{ctx['project_id']}",
+         setup=_new_project),
+    Case('DELETE /api/employees/<id>', 'DELETE', lambda ctx: f"/api/employees/{ctx['employee_id']}",
+         setup=_new_employee),
+]
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a sorted list"""
+    index = max(0, min(len(samples) - 1, int(round(pct / 100 * len(samples))) - 1))
+    return samples[index]
+
+
+@contextlib.contextmanager
+def fake_ai_server(task_count=10, **options):
+    """Run fake_ai_server.py on a free local port and point AI_API_URL at it
+
+    options go to create_fake_server (delay, task_delay, fail_after)
+    """
+    from werkzeug.serving import make_server, WSGIRequestHandler
+    from fake_ai_server import create_fake_server
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    server = make_server('127.0.0.1', 0, create_fake_server(task_count=task_count, **options), threaded=True,
+                         request_handler=QuietHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    previous = os.environ.get('AI_API_URL')
+    os.environ['AI_API_URL'] = f'http://127.0.0.1:{server.server_port}'
+    try:
+        yield
+    finally:
+        server.shutdown()
+        if previous is None:
+            os.environ.pop('AI_API_URL', None)
+        else:
+            os.environ['AI_API_URL'] = previous
+
+
+def run_case(client, case, repeat, statements):
+    """Time `repeat` requests of one case
+
+    Returns:
+        (result dict, endpoint name)
+    """
+    ctx = {}
+    samples, sql_counts, status_codes = [], [], set()
+    peak_memory = 0
+
+    # Son tur tracemalloc altında: bellek ölçümü gecikme örneklerini bozmasın
+    for i in range(repeat + 1):
+        ctx['i'] = i
+        if case.setup:
+            case.setup(client, ctx)
+        path = case.path(ctx) if callable(case.path) else case.path
+        body = case.body(ctx) if callable(case.body) else case.body
+        measure_memory = i == repeat
+
+        if measure_memory:
+            tracemalloc.start()
+        statements[0] = 0
+        start = time.perf_counter()
+        response = client.open(path, method=case.method, json=body)
+        response.get_data()
+        elapsed = (time.perf_counter() - start) * 1000
+        if measure_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        else:
+            samples.append(elapsed)
+            sql_counts.append(statements[0])
+        status_codes.add(response.status_code)
+
+    samples.sort()
+    sql_counts.sort()
+    endpoint = client.application.url_map.bind('localhost').match(path.split('?')[0], method=case.method)[0]
+    return {
+        'method': case.method,
+        'endpoint': endpoint,
+        'status': sorted(status_codes),
+        'requests': repeat,
+        'p50_ms': round(percentile(samples, 50), 3),
+        'p90_ms': round(percentile(samples, 90), 3),
+        'p95_ms': round(percentile(samples, 95), 3),
+        'p99_ms': round(percentile(samples, 99), 3),
+        'max_ms': round(samples[-1], 3),
+        'mean_ms': round(sum(samples) / len(samples), 3),
+        'sql_statements': sql_counts[len(sql_counts) // 2],
+        'sql_statements_max': sql_counts[-1],
+        'peak_memory_kb': round(peak_memory / 1024, 1)
+    }, endpoint
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(n_employees, n_projects, n_tasks, repeat, with_cache=False, only=None):
+    """Build the dataset, run every case and return the report dict"""
+    from sqlalchemy import event
+    from extensions import db, response_cache
+
+    app, db_path = make_app()
+    response_cache.enabled = with_cache
+    try:
+        with app.app_context():
+            start = time.perf_counter()
+            dataset = populate(n_tasks, n_employees=n_employees, n_projects=n_projects)
+            populate_s = time.perf_counter() - start
+
+            statements = [0]
+            event.listen(db.engine, 'before_cursor_execute',
+                         lambda *args: statements.__setitem__(0, statements[0] + 1))
+
+        client = app.test_client()
+        results, covered = {}, set()
+        # generation.py ham AI cevabını print ediyor; rapor çıktısı okunur kalsın
+        with fake_ai_server(), open(os.devnull, 'w') as devnull:
+            for case in CASES:
+                if only and not any(part in case.name for part in only):
+                    continue
+                with contextlib.redirect_stdout(devnull):
+                    result, endpoint = run_case(client, case, repeat, statements)
+                results[case.name] = result
+                covered.add(endpoint)
+                print(f"{case.name:<52} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+                      f"{result['sql_statements']:>5} {result['peak_memory_kb']:>10.1f}  {result['status']}")
+
+        routes = {rule.endpoint for rule in app.url_map.iter_rules() if '.' in rule.endpoint}
+        return {
+            'meta': {
+                'commit': git_commit(),
+                'created_at': datetime.utcnow().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'database': 'sqlite',
+                'repeat': repeat,
+                'response_cache': with_cache,
+                'populate_s': round(populate_s, 2)
+            },
+            'dataset': dataset,
+            'cases': results,
+            'uncovered_routes': sorted(routes - covered)
+        }
+    finally:
+        os.remove(db_path)
+
+
+def compare(base, new, threshold=DEFAULT_THRESHOLD, min_delta_ms=DEFAULT_MIN_DELTA_MS):
+    """Print per-case changes between two reports
+
+    Returns:
+        list of regression messages: p50/p95 slower by more than `threshold`
+        (and at least min_delta_ms), or more SQL statements
+    """
+    regressions = []
+    print(f"{'case':<52} {'p50 base':>9} {'p50 new':>9} {'p95 base':>9} {'p95 new':>9} {'sql':>9}")
+    print('-' * 103)
+    for name, after in new['cases'].items():
+        before = base['cases'].get(name)
+        if before is None:
+            print(f"{name:<52} {'new case':>9}")
+            continue
+        sql = f"{before['sql_statements']}->{after['sql_statements']}"
+        print(f"{name:<52} {before['p50_ms']:>9.2f} {after['p50_ms']:>9.2f} "
+              f"{before['p95_ms']:>9.2f} {after['p95_ms']:>9.2f} {sql:>9}")
+        for key in ('p50_ms', 'p95_ms'):
+            if (after[key] > before[key] * (1 + threshold)
+                    and after[key] - before[key] >= min_delta_ms):
+                regressions.append(f"{name}: {key} {before[key]} -> {after[key]}")
+        if after['sql_statements'] > before['sql_statements']:
+            regressions.append(f"{name}: sql_statements {before['sql_statements']} -> {after['sql_statements']}")
+    for name in sorted(set(base['cases']) - set(new['cases'])):
+        print(f"{name:<52} {'removed':>9}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark every API route on a synthetic dataset')
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small')
+    parser.add_argument('--employees', type=int, help='Override the employee count of --scale')
+    parser.add_argument('--projects', type=int, help='Override the project count of --scale')
+    parser.add_argument('--tasks', type=int, help='Override the task count of --scale')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed requests per case')
+    parser.add_argument('--with-cache', action='store_true', help='Keep the response cache enabled')
+    parser.add_argument('--only', nargs='*', help='Run only cases whose name contains one of these')
+    parser.add_argument('-o', '--output', help='Write the JSON report to this file')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'), help='Compare two reports and exit')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed p50/p95 slowdown ratio for --compare (default 0.25)')
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help='Ignore slowdowns smaller than this in --compare (default 1.0)')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f_base, open(args.compare[1]) as f_new:
+            regressions = compare(json.load(f_base), json.load(f_new), args.threshold, args.min_delta_ms)
+        for message in regressions:
+            print(f'REGRESSION {message}')
+        return 1 if regressions else 0
+
+    n_employees, n_projects, n_tasks = SCALES[args.scale]
+    n_employees = args.employees or n_employees
+    n_projects = args.projects or n_projects
+    n_tasks = args.tasks or n_tasks
+
+    print(f"{n_employees:,} employees, {n_projects:,} projects, {n_tasks:,} tasks, {args.repeat} requests per case")
+    print(f"{'case':<52} {'p50 (ms)':>9} {'p95 (ms)':>9} {'sql':>5} {'peak (KB)':>10}  status")
+    print('-' * 100)
+    report = run_suite(n_employees, n_projects, n_tasks, args.repeat, args.with_cache, args.only)
+    report['meta']['scale'] = args.scale
+
+    if report['uncovered_routes'] and not args.only:
+        print(f"Routes without a case: {', '.join(report['uncovered_routes'])}")
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
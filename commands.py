@@ -0,0 +1,44 @@
+import click
+from extensions import db
+
+
+def register_commands(app):
+    """Register custom `flask` CLI commands"""
+
+    @app.cli.command('reconcile-counters')
+    def reconcile_counters():
+        """Recompute denormalized project task counters after bulk loads."""
+        from services.counters import reconcile_project_counters
+
+        drift = reconcile_project_counters()
+        db.session.commit()
+
+        for item in drift:
+            click.echo(f"{item['project_id']}: {item['before']} -> {item['after']}")
+        click.echo(f"Reconciled project counters ({len(drift)} project(s) updated)")
+
+    @app.cli.command('reconcile-workload')
+    @click.option('--dry-run', is_flag=True, help='Only report drift, do not write.')
+    def reconcile_workload_command(dry_run):
+        """Recompute employees' current_load_hours from non-completed tasks."""
+        from services.workload import reconcile_workload
+
+        drift = reconcile_workload(dry_run=dry_run)
+        if not dry_run:
+            db.session.commit()
+
+        for item in drift:
+            click.echo(f"{item['employee_id']}: {item['before']} -> {item['after']} (drift {item['drift']:+g})")
+        action = 'would be updated' if dry_run else 'updated'
+        click.echo(f"Reconciled workload ({len(drift)} employee(s) {action})")
+
+    @app.cli.command('rebuild-skill-index')
+    def rebuild_skill_index_command():
+        """Rebuild employee_skills/employee_languages from employees' JSON columns."""
+        from services.skills import rebuild_skill_index
+
+        counts = rebuild_skill_index()
+        db.session.commit()
+
+        click.echo(f"Indexed {counts['skills']} skill(s) and {counts['languages']} language(s) "
+                   f"for {counts['employees']} employee(s)")
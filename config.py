@@ -10,28 +10,119 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///planllama.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = os.environ.get('DEBUG', 'False') == 'True'
+    SQLALCHEMY_ENGINE_OPTIONS = {}  # explicit overrides (services/database.py)
+    
+    # Connection pool for server databases (PostgreSQL); ignored for SQLite
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 20))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'True') == 'True'
+    # PostgreSQL statement_timeout in ms (0 = no limit)
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 0))
+    
+    # SQLite PRAGMAs applied on every connection (empty value = SQLite default).
+    # WAL lets readers run while a write transaction commits.
+    SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+    
+    # Processes serving the app; gunicorn.conf.py exports its worker count here.
+    # Per-process backends (memory cache, memory change feed) refuse to start when > 1.
+    WORKER_PROCESSES = int(os.environ.get('WEB_CONCURRENCY', 1))
+    
+    # Assignee recommendation matrix (services/recommend.py): writes from other
+    # workers are detected every RECOMMEND_CHECK_SECONDS; full rebuild after the TTL
+    RECOMMEND_CHECK_SECONDS = int(os.environ.get('RECOMMEND_CHECK_SECONDS', 5))
+    RECOMMEND_MATRIX_TTL = int(os.environ.get('RECOMMEND_MATRIX_TTL', 300))
     
     # CORS settings
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', 'http://localhost:3000').split(',')
     
-    # JSON settings
-    JSON_SORT_KEYS = False
-    JSONIFY_PRETTYPRINT_REGULAR = True
+    # Background jobs (async /api/projects/generate-tasks)
+    JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 4))
+    JOB_MAX_PENDING = int(os.environ.get('JOB_MAX_PENDING', 32))
+    JOB_RETENTION_SECONDS = int(os.environ.get('JOB_RETENTION_SECONDS', 3600))
+    
+    # IDs reserved per process from id_sequences in one round trip
+    ID_BLOCK_SIZE = int(os.environ.get('ID_BLOCK_SIZE', 50))
+    
+    # AI response cache (memory LRU + disk, keyed by payload hash)
+    AI_CACHE_ENABLED = os.environ.get('AI_CACHE_ENABLED', 'True') == 'True'
+    AI_CACHE_TTL = int(os.environ.get('AI_CACHE_TTL', 24 * 3600))
+    AI_CACHE_MEMORY_SIZE = int(os.environ.get('AI_CACHE_MEMORY_SIZE', 128))
+    AI_CACHE_DIR = os.environ.get('AI_CACHE_DIR', 'output/ai_cache')
+    AI_CACHE_DISK_MAX_ENTRIES = int(os.environ.get('AI_CACHE_DISK_MAX_ENTRIES', 1000))
+    
+    # GET response cache, invalidated after commits that touch the tables a view reads.
+    # 'memory' is per process; use 'redis' so all workers share entries and invalidations.
+    RESPONSE_CACHE_ENABLED = os.environ.get('RESPONSE_CACHE_ENABLED', 'True') == 'True'
+    RESPONSE_CACHE_BACKEND = os.environ.get('RESPONSE_CACHE_BACKEND', 'memory')
+    RESPONSE_CACHE_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', 30))
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 1024))
+    RESPONSE_CACHE_REDIS_URL = os.environ.get('RESPONSE_CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    
+    # JSON settings (services/json_provider.py)
+    # JSON_COMPACT: None -> indented only in debug mode
+    JSON_COMPACT = None
+    JSON_USE_ORJSON = os.environ.get('JSON_USE_ORJSON', 'True') == 'True'
+    
+    # Request metrics at /metrics (Prometheus text format); Server-Timing header optional
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True') == 'True'
+    METRICS_SERVER_TIMING = os.environ.get('METRICS_SERVER_TIMING', 'False') == 'True'
+    
+    # Query guard (services/query_guard.py): per-route SQL budgets and N+1 detection
+    QUERY_GUARD_ENABLED = False
+    QUERY_GUARD_ACTION = 'log'  # 'raise' or 'log'
+    QUERY_GUARD_REPEAT_THRESHOLD = 5
+    QUERY_GUARD_DEFAULT_BUDGET = None
+    
+    # Change feed at /api/events (Server-Sent Events, services/events.py).
+    # 'memory' reaches clients of the same process; use 'redis' with several workers.
+    # Off by default in production: it needs the redis backend and gevent workers.
+    EVENTS_ENABLED = os.environ.get('EVENTS_ENABLED', 'True') == 'True'
+    EVENTS_BACKEND = os.environ.get('EVENTS_BACKEND', 'memory')
+    EVENTS_REDIS_URL = os.environ.get('EVENTS_REDIS_URL', 'redis://localhost:6379/0')
+    EVENTS_BUFFER_SIZE = int(os.environ.get('EVENTS_BUFFER_SIZE', 1000))
+    EVENTS_HEARTBEAT_SECONDS = int(os.environ.get('EVENTS_HEARTBEAT_SECONDS', 15))
+    # Streams end after this long and the browser resumes with Last-Event-ID;
+    # keep it below GUNICORN_TIMEOUT with sync workers
+    EVENTS_MAX_STREAM_SECONDS = int(os.environ.get('EVENTS_MAX_STREAM_SECONDS', 50))
+    EVENTS_RETRY_MS = int(os.environ.get('EVENTS_RETRY_MS', 3000))
+    
+    # Warm-up run by wsgi.py before gunicorn forks its workers (services/warmup.py).
+    # Paths must be read-only GETs.
+    WARMUP_ENABLED = os.environ.get('WARMUP_ENABLED', 'True') == 'True'
+    WARMUP_PATHS = [path for path in os.environ.get(
+        'WARMUP_PATHS',
+        '/api/employees?limit=50,/api/projects?limit=50,/api/tasks?limit=50,'
+        '/api/tasks/stats,/api/employees/capacity-forecast'
+    ).split(',') if path]
 
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
     SQLALCHEMY_ECHO = True
+    METRICS_SERVER_TIMING = True
 
 class ProductionConfig(Config):
     """Production configuration"""
     DEBUG = False
     SQLALCHEMY_ECHO = False
+    JSON_COMPACT = True
+    # Çok worker'lı dağıtımda memory önbellek tutarsız kalır; redis ile açılır
+    RESPONSE_CACHE_ENABLED = os.environ.get('RESPONSE_CACHE_ENABLED', 'False') == 'True'
+    # Değişiklik akışı redis backend ve gevent worker ister (gunicorn.conf.py)
+    EVENTS_ENABLED = os.environ.get('EVENTS_ENABLED', 'False') == 'True'
 
 class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///test_planllama.db'
+    SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL') or 'sqlite:///test_planllama.db'
+    AI_CACHE_DIR = None  # sadece bellek katmanı
+    QUERY_GUARD_ENABLED = os.environ.get('QUERY_GUARD_ENABLED', 'True') == 'True'
+    QUERY_GUARD_ACTION = os.environ.get('QUERY_GUARD_ACTION', 'raise')
 
 # Configuration dictionary
 config = {
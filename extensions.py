@@ -1,8 +1,24 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
+from services.jobs import JobManager
+from services.ai_cache import AIResponseCache
+from services.ids import IdAllocator
+from services.cache import ResponseCache
+from services.recommend import AssigneeRecommender
+from services.metrics import RequestMetrics
+from services.query_guard import QueryGuard
+from services.events import ChangeFeed
 
 # Initialize extensions
 db = SQLAlchemy()
 migrate = Migrate()
 cors = CORS()
+jobs = JobManager()
+ai_cache = AIResponseCache()
+ids = IdAllocator()
+response_cache = ResponseCache()
+recommender = AssigneeRecommender()
+metrics = RequestMetrics()
+query_guard = QueryGuard()
+changes = ChangeFeed()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Local stand-in for the AI task-generation service
+Answers POST /api/generate with a jira_json document in the same shape as
+output/jira_*.json, assigning generated tasks round-robin to the team.
+POST /api/generate/stream sends the same tasks as NDJSON, one line per task
+as soon as it is "generated" (see services/generation.stream_tasks_from_ai)
+
+Usage:
+    python fake_ai_server.py --port 8001 --delay 2 --tasks 12
+    python fake_ai_server.py --delay 1 --task-delay 0.5 --fail-after 3
+    AI_API_URL=http://localhost:8001 python app.py
+"""
+import argparse
+import json
+import time
+from datetime import date, timedelta
+from flask import Flask, Response, request, jsonify
+
+PRIORITIES = ['Highest', 'High', 'Medium', 'Low']
+
+
+def build_task(index, project_title, member, project_key):
+    """One Jira issue in the format returned by the real service"""
+    return {
+        "epic_name": project_title,
+        "fields": {
+            "assignee": {
+                "accountId": member.get("employee_id"),
+                "name": member.get("name")
+            },
+            "description": {
+                "content": [{
+                    "content": [{"text": f"Generated task {index + 1} for {project_title}", "type": "text"}],
+                    "type": "paragraph"
+                }],
+                "type": "doc",
+                "version": 1
+            },
+            "duedate": (date.today() + timedelta(days=7 + index)).isoformat(),
+            "issuetype": {"name": "Task"},
+            "labels": member.get("skills", [])[:2],
+            "priority": {"name": PRIORITIES[index % len(PRIORITIES)]},
+            "project": {"key": project_key},
+            "summary": f"{project_title} - Task {index + 1}",
+            "timetracking": {"originalEstimate": f"{index % 5 + 1}d"}
+        }
+    }
+
+
+def build_jira_json(payload, task_count):
+    data = payload.get("json_input", {})
+    team = data.get("team") or [{}]
+    project_title = data.get("project_title", "Untitled")
+    project_key = payload.get("project_key", "INSIGHT")
+    return {
+        "tasks": [build_task(i, project_title, team[i % len(team)], project_key)
+                  for i in range(task_count)]
+    }
+
+
+def create_fake_server(delay=0.0, task_count=10, task_delay=0.0, fail_after=None):
+    """delay: seconds before the first task, task_delay: seconds per task,
+    fail_after: stream an error after this many tasks"""
+    app = Flask(__name__)
+    app.config['FAKE_DELAY'] = delay
+    app.config['FAKE_TASKS'] = task_count
+    app.config['FAKE_TASK_DELAY'] = task_delay
+    app.config['FAKE_FAIL_AFTER'] = fail_after
+    app.config['REQUEST_COUNT'] = 0
+
+    @app.route('/api/generate', methods=['POST'])
+    def generate():
+        app.config['REQUEST_COUNT'] += 1
+        payload = request.get_json()
+        # Tam cevap, tüm görevler üretildikten sonra döner
+        time.sleep(app.config['FAKE_DELAY'] + app.config['FAKE_TASK_DELAY'] * app.config['FAKE_TASKS'])
+        return jsonify({
+            "success": True,
+            "jira_json": build_jira_json(payload, app.config['FAKE_TASKS'])
+        })
+
+    @app.route('/api/generate/stream', methods=['POST'])
+    def generate_stream():
+        app.config['REQUEST_COUNT'] += 1
+        payload = request.get_json()
+        tasks = build_jira_json(payload, app.config['FAKE_TASKS'])['tasks']
+        fail_after = app.config['FAKE_FAIL_AFTER']
+
+        def lines():
+            time.sleep(app.config['FAKE_DELAY'])
+            for i, task in enumerate(tasks):
+                if fail_after is not None and i == fail_after:
+                    yield json.dumps({"type": "error", "message": "Model failed while generating"}) + "\n"
+                    return
+                time.sleep(app.config['FAKE_TASK_DELAY'])
+                yield json.dumps({"type": "task", "task": task}) + "\n"
+            yield json.dumps({"type": "done", "count": len(tasks)}) + "\n"
+
+        return Response(lines(), mimetype='application/x-ndjson')
+
+    return app
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Fake AI task-generation server')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--delay', type=float, default=0.0, help='Seconds to wait before answering')
+    parser.add_argument('--tasks', type=int, default=10, help='Number of tasks to generate')
+    parser.add_argument('--task-delay', type=float, default=0.0, help='Seconds to generate each task')
+    parser.add_argument('--fail-after', type=int, default=None, help='Stream an error after this many tasks')
+    args = parser.parse_args()
+
+    create_fake_server(args.delay, args.tasks, args.task_delay, args.fail_after).run(
+        host='127.0.0.1', port=args.port, threaded=True)
@@ -0,0 +1,54 @@
+"""
+Gunicorn settings for the production entry point (wsgi.py)
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Values can be overridden from the environment (PORT, WEB_CONCURRENCY, ...)
+or on the command line.
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+# Uygulama worker sayısını görsün (config.WORKER_PROCESSES): süreç içi backend'ler reddedilir
+os.environ['WEB_CONCURRENCY'] = str(workers)
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+# /api/events akışları bağlantıyı açık tutar; 'gevent' her boştaki istemci için
+# thread yerine bir greenlet kullanır. Akış açıkken varsayılan gevent'tir.
+events_enabled = os.environ.get('EVENTS_ENABLED', 'False') == 'True'  # ProductionConfig varsayılanı
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent' if events_enabled else 'sync')
+if events_enabled and worker_class == 'sync':
+    raise RuntimeError('EVENTS_ENABLED=True needs an async worker class (GUNICORN_WORKER_CLASS=gevent): '
+                       'every open /api/events stream would hold a whole sync worker')
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Uygulama ve ısınma master süreçte bir kez yapılır; worker'lar fork ile devralır
+preload_app = True
+
+if worker_class == 'gevent':
+    # Uygulama master'da yüklendiği için kilitler yüklemeden önce greenlet uyumlu olmalı
+    from gevent import monkey
+    monkey.patch_all()
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def post_fork(server, worker):
+    """Give every worker its own validated connection pool"""
+    from wsgi import app
+    from extensions import db
+    from services.warmup import init_worker
+
+    timings = init_worker(app, db)
+    server.log.info('Worker %s ready (db connect %.1f ms)', worker.pid, timings['connect_ms'])
+
+
+def when_ready(server):
+    from wsgi import startup
+    server.log.info('Application preloaded: %s', startup)
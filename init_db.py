@@ -4,17 +4,32 @@ Database initialization script
 Creates tables and optionally seeds data
 """
 import sys
-from app import app
+from flask_migrate import stamp
+from sqlalchemy import inspect
+from app import create_app
 from extensions import db
 from seed import seed_database
 
 def init_db(seed=False):
     """Initialize the database"""
+    app = create_app()
     with app.app_context():
+        existing = set(inspect(db.engine).get_table_names())
+        if existing and 'alembic_version' not in existing:
+            # Eski create_all şeması: yeni tablolar burada oluşturulursa migrasyonlar çakışır
+            print("Existing database without migration history. To adopt migrations run:")
+            print("  flask db stamp 3cd21f3db3d6 && flask db upgrade")
+            return
+        
         print("Creating database tables...")
         db.create_all()
         print("Database tables created successfully!")
         
+        if not existing:
+            # create_all güncel şemayı kurdu; migrasyonlar uygulanmış sayılır
+            stamp()
+            print("Database stamped at the latest migration (flask db upgrade is a no-op)")
+        
         if seed:
             print("\nSeeding database with initial data...")
             seed_database()
@@ -1,10 +1,69 @@
+from collections import namedtuple
 from datetime import datetime
+from operator import attrgetter
 from sqlalchemy import JSON
+from sqlalchemy.orm import joinedload, load_only
 from extensions import db
 
-class Employee(db.Model):
+# Snapshot of the task fields that feed project counters and employee workload
+TaskState = namedtuple('TaskState', ['project_id', 'assignee_id', 'status', 'estimated_hours'])
+
+
+def _column(name):
+    """Field spec for a column serialized as-is: (attributes it reads, getter or None)"""
+    return (name,), None
+
+
+class SparseFieldsMixin:
+    """Sparse fieldset support (?fields=a,b) for to_dict and queries
+    
+    Subclasses define FIELDS: output key -> (model attributes it reads, getter).
+    A None getter means the single attribute is returned as-is.
+    """
+    FIELDS = {}
+    
+    @classmethod
+    def load_fields(cls, fields):
+        """Loader option that SELECTs only the columns behind `fields`; the rest are deferred"""
+        attrs = {attr for key in fields if key in cls.FIELDS for attr in cls.FIELDS[key][0]}
+        attrs.update(column.key for column in cls.__mapper__.primary_key)
+        return load_only(*(getattr(cls, attr) for attr in sorted(attrs)))
+    
+    @classmethod
+    def _field_plan(cls, fields):
+        # Düz sütunlar tek bir attrgetter ile (C seviyesinde) okunur; plan alan kümesi başına önbelleklenir
+        plans = cls.__dict__.get('_field_plans')
+        if plans is None:
+            plans = {}
+            setattr(cls, '_field_plans', plans)
+        plan = plans.get(fields)
+        if plan is None:
+            selected = [(key, spec) for key, spec in cls.FIELDS.items() if fields is None or key in fields]
+            plain = [(key, attrs[0]) for key, (attrs, getter) in selected if getter is None]
+            keys = tuple(key for key, _ in plain)
+            getter = attrgetter(*(attr for _, attr in plain)) if len(plain) > 1 else None
+            if len(plain) == 1:
+                single = attrgetter(plain[0][1])
+                getter = lambda obj: (single(obj),)
+            computed = tuple((key, func) for key, (_, func) in selected if func is not None)
+            plan = plans[fields] = (keys, getter, computed)
+        return plan
+    
+    def serialize_fields(self, fields=None):
+        """Dict of FIELDS, limited to `fields` (a frozenset) when given"""
+        keys, getter, computed = self._field_plan(fields)
+        result = dict(zip(keys, getter(self))) if keys else {}
+        for key, func in computed:
+            result[key] = func(self)
+        return result
+
+
+class Employee(SparseFieldsMixin, db.Model):
     """Employee model - represents both PMs and Executors"""
     __tablename__ = 'employees'
+    __table_args__ = (
+        db.Index('ix_employees_user_role', 'user_role'),  # GET /api/employees?role=
+    )
     
     employee_id = db.Column(db.String(10), primary_key=True)  # e.g., 'e01'
     name = db.Column(db.String(100), nullable=False)
@@ -27,28 +86,61 @@ class Employee(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
-    def to_dict(self):
-        """Convert model to dictionary"""
-        return {
-            'employee_id': self.employee_id,
-            'name': self.name,
-            'role': self.role,
-            'user_role': self.user_role,
-            'avatar': self.avatar,
-            'capacity_hours_per_week': self.capacity_hours_per_week,
-            'current_load_hours': self.current_load_hours,
-            'integrations': self.integrations or {},
-            'languages': self.languages or [],
-            'skills': self.skills or [],
-            'timezone': self.timezone,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
-
-
-class Project(db.Model):
+    FIELDS = {
+        'employee_id': _column('employee_id'),
+        'name': _column('name'),
+        'role': _column('role'),
+        'user_role': _column('user_role'),
+        'avatar': _column('avatar'),
+        'capacity_hours_per_week': _column('capacity_hours_per_week'),
+        'current_load_hours': _column('current_load_hours'),
+        'integrations': (('integrations',), lambda e: e.integrations or {}),
+        'languages': (('languages',), lambda e: e.languages or []),
+        'skills': (('skills',), lambda e: e.skills or []),
+        'timezone': _column('timezone'),
+        'created_at': _column('created_at'),
+        'updated_at': _column('updated_at')
+    }
+    
+    def to_dict(self, fields=None):
+        """Convert model to dictionary
+        
+        Args:
+            fields: Optional set of keys to include (sparse fieldset)
+        """
+        return self.serialize_fields(fields)
+
+
+class EmployeeSkill(db.Model):
+    """Normalized copy of Employee.skills for indexed search (services/skills.py keeps it in sync)"""
+    __tablename__ = 'employee_skills'
+    __table_args__ = (
+        # name + level aralığı tek indeks taramasıyla, employee_id indeksten okunur
+        db.Index('ix_employee_skills_name_level', 'name', 'level', 'employee_id'),
+    )
+    
+    employee_id = db.Column(db.String(10), db.ForeignKey('employees.employee_id', ondelete='CASCADE'), primary_key=True)
+    name = db.Column(db.String(100), primary_key=True)  # lower-case, e.g. 'python'
+    level = db.Column(db.Integer, nullable=False, default=0)
+
+
+class EmployeeLanguage(db.Model):
+    """Normalized copy of Employee.languages for indexed search"""
+    __tablename__ = 'employee_languages'
+    __table_args__ = (
+        db.Index('ix_employee_languages_language', 'language', 'employee_id'),
+    )
+    
+    employee_id = db.Column(db.String(10), db.ForeignKey('employees.employee_id', ondelete='CASCADE'), primary_key=True)
+    language = db.Column(db.String(20), primary_key=True)  # lower-case, e.g. 'en'
+
+
+class Project(SparseFieldsMixin, db.Model):
     """Project model"""
     __tablename__ = 'projects'
+    __table_args__ = (
+        db.Index('ix_projects_status', 'status'),  # GET /api/projects?status=
+    )
     
     project_id = db.Column(db.String(10), primary_key=True)  # e.g., 'p01'
     name = db.Column(db.String(200), nullable=False, unique=True)
@@ -57,32 +149,41 @@ class Project(db.Model):
     budget = db.Column(db.Integer, default=0)
     priority = db.Column(db.String(20), default='medium')  # low, medium, high, critical
     
+    # Denormalized task counters (services/counters.py keeps them in sync)
+    tasks_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    completed_tasks_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    remaining_hours = db.Column(db.Float, nullable=False, default=0, server_default='0')
+    
     # Dates
     due_date = db.Column(db.Date, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    tasks = db.relationship('Task', back_populates='project', cascade='all, delete-orphan')
+    tasks = db.relationship('Task', back_populates='project', cascade='all, delete-orphan', order_by='[Task.created_at, Task.task_id]')
+    
+    FIELDS = {
+        'project_id': _column('project_id'),
+        'name': _column('name'),
+        'description': _column('description'),
+        'status': _column('status'),
+        'budget': _column('budget'),
+        'priority': _column('priority'),
+        'dueDate': _column('due_date'),
+        'createdAt': (('created_at',), lambda p: p.created_at.date() if p.created_at else None),
+        'tasksCount': (('tasks_count',), lambda p: p.tasks_count or 0),
+        'completedTasks': (('completed_tasks_count',), lambda p: p.completed_tasks_count or 0),
+        'remainingHours': (('remaining_hours',), lambda p: p.remaining_hours or 0)
+    }
     
-    def to_dict(self, include_tasks=False):
-        """Convert model to dictionary"""
-        # Calculate task counts
-        tasks_count = len(self.tasks)
-        completed_tasks = len([t for t in self.tasks if t.status == 'Completed'])
+    def to_dict(self, include_tasks=False, fields=None):
+        """Convert model to dictionary
         
-        result = {
-            'project_id': self.project_id,
-            'name': self.name,
-            'description': self.description,
-            'status': self.status,
-            'budget': self.budget,
-            'priority': self.priority,
-            'dueDate': self.due_date.isoformat() if self.due_date else None,
-            'createdAt': self.created_at.date().isoformat() if self.created_at else None,
-            'tasksCount': tasks_count,
-            'completedTasks': completed_tasks
-        }
+        Args:
+            include_tasks: If True, include the full task list
+            fields: Optional set of project keys to include (sparse fieldset)
+        """
+        result = self.serialize_fields(fields)
         
         if include_tasks:
             result['tasks'] = [task.to_dict() for task in self.tasks]
@@ -90,9 +191,15 @@ class Project(db.Model):
         return result
 
 
-class Task(db.Model):
+class Task(SparseFieldsMixin, db.Model):
     """Task model"""
     __tablename__ = 'tasks'
+    __table_args__ = (
+        # Filtre kombinasyonları: assignee/project + status, status + priority
+        db.Index('ix_tasks_assignee_status', 'assignee_id', 'status'),
+        db.Index('ix_tasks_project_status', 'project_id', 'status'),
+        db.Index('ix_tasks_status_priority', 'status', 'priority'),
+    )
     
     task_id = db.Column(db.String(10), primary_key=True)  # e.g., 't01'
     title = db.Column(db.String(200), nullable=False)
@@ -117,29 +224,78 @@ class Task(db.Model):
     assignee = db.relationship('Employee', back_populates='assigned_tasks', foreign_keys=[assignee_id])
     project = db.relationship('Project', back_populates='tasks')
     
-    def to_dict(self, enrich=False):
+    def state(self):
+        """TaskState snapshot used for counter/workload bookkeeping"""
+        return TaskState(self.project_id, self.assignee_id, self.status, self.estimated_hours or 0)
+    
+    FIELDS = {
+        'task_id': _column('task_id'),
+        'title': _column('title'),
+        'description': _column('description'),
+        'status': _column('status'),
+        'priority': _column('priority'),
+        'assignee_id': _column('assignee_id'),
+        'project_id': _column('project_id'),
+        'estimatedHours': _column('estimated_hours'),
+        'dueDate': _column('due_date'),
+        'createdAt': (('created_at',), lambda t: t.created_at.date() if t.created_at else None),
+        'completedAt': _column('completed_at')
+    }
+    
+    # Keys added by to_dict(enrich=True)
+    ENRICHED_FIELDS = ('assignee', 'project')
+    
+    @classmethod
+    def enrich_options(cls, fields=None):
+        """Loader options for to_dict(enrich=True)
+        
+        Joins assignee and project in the same SELECT, loading only their names,
+        so serializing N tasks does not trigger 2N lazy loads. With a sparse
+        fieldset only the requested names are joined.
+        """
+        options = []
+        if fields is None or 'assignee' in fields:
+            options.append(joinedload(cls.assignee).load_only(Employee.name))
+        if fields is None or 'project' in fields:
+            options.append(joinedload(cls.project).load_only(Project.name))
+        return tuple(options)
+    
+    def to_dict(self, enrich=False, fields=None):
         """Convert model to dictionary
         
         Args:
             enrich: If True, include assignee name and project name
+            fields: Optional set of keys to include (sparse fieldset)
         """
-        result = {
-            'task_id': self.task_id,
-            'title': self.title,
-            'description': self.description,
-            'status': self.status,
-            'priority': self.priority,
-            'assignee_id': self.assignee_id,
-            'project_id': self.project_id,
-            'estimatedHours': self.estimated_hours,
-            'dueDate': self.due_date.isoformat() if self.due_date else None,
-            'createdAt': self.created_at.date().isoformat() if self.created_at else None,
-            'completedAt': self.completed_at.isoformat() if self.completed_at else None
-        }
+        result = self.serialize_fields(fields)
         
         # Add enriched data (for frontend compatibility)
         if enrich:
-            result['assignee'] = self.assignee.name if self.assignee else 'Unassigned'
-            result['project'] = self.project.name if self.project else 'Unknown Project'
+            if fields is None or 'assignee' in fields:
+                result['assignee'] = self.assignee.name if self.assignee else 'Unassigned'
+            if fields is None or 'project' in fields:
+                result['project'] = self.project.name if self.project else 'Unknown Project'
         
         return result
+
+
+class IdSequence(db.Model):
+    """Counter row per ID sequence (e.g. 'task', 'project'), see services/ids.py"""
+    __tablename__ = 'id_sequences'
+    
+    name = db.Column(db.String(50), primary_key=True)
+    next_value = db.Column(db.BigInteger, nullable=False)
+
+
+class GenerationJob(db.Model):
+    """State of a background job (see services/jobs.py), shared by all worker processes"""
+    __tablename__ = 'generation_jobs'
+    
+    job_id = db.Column(db.String(32), primary_key=True)
+    kind = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='queued')
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    result = db.Column(JSON)
+    error = db.Column(JSON)
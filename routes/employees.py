@@ -1,29 +1,103 @@
-from flask import Blueprint, request, jsonify
-from models import Employee
+from datetime import datetime
+from flask import Blueprint, request, jsonify, abort
+from models import Employee, Task
 from extensions import db
+from services.pagination import list_response
+from services.cache import cached
+from services.query_guard import query_budget
+from services.fields import sparse_fields, with_fields
+from services.conditional import conditional, collection_validators, row_validators
+from services.workload import reconcile_workload
+from services.forecast import capacity_forecast, MAX_WEEKS
+from services.skills import (sync_employee_index, delete_employee_index,
+                             parse_skill_filters, search_query)
 
 employees_bp = Blueprint('employees', __name__, url_prefix='/api/employees')
 
 @employees_bp.route('', methods=['GET'])
+@query_budget(3)
+@cached('employees')
 def get_employees():
-    """Get all employees"""
+    """Get all employees, optionally paginated (limit/cursor) or streamed (stream=true)"""
     role = request.args.get('role')  # Filter by user_role (pm or executor)
+    fields, error = sparse_fields(Employee)
+    if error:
+        return error
     
     query = Employee.query
     
     if role:
         query = query.filter_by(user_role=role)
     
-    employees = query.all()
-    return jsonify([emp.to_dict() for emp in employees])
+    return conditional(collection_validators(query, Employee), lambda: list_response(
+        with_fields(query, Employee, fields), Employee.employee_id, lambda emp: emp.to_dict(fields=fields)))
+
+@employees_bp.route('/search', methods=['GET'])
+@query_budget(3)
+@cached('employees', 'employee_skills', 'employee_languages')
+def search_employees():
+    """Find employees by skill (skill=python:4, repeatable, all must match) and language (language=en)"""
+    try:
+        requirements = parse_skill_filters(request.args.getlist('skill'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    languages = sorted({code.strip().lower() for code in request.args.getlist('language') if code.strip()})
+    role = request.args.get('role')
+    fields, error = sparse_fields(Employee)
+    if error:
+        return error
+    
+    if not requirements and not languages:
+        return jsonify({'error': 'At least one skill or language filter is required'}), 400
+    
+    # Yetenek/dil filtreleri employee_skills / employee_languages indekslerinden tek sorguda
+    query = search_query(requirements, languages)
+    if role:
+        query = query.filter_by(user_role=role)
+    
+    return conditional(collection_validators(query, Employee), lambda: list_response(
+        with_fields(query, Employee, fields), Employee.employee_id, lambda emp: emp.to_dict(fields=fields)))
+
+@employees_bp.route('/capacity-forecast', methods=['GET'])
+@query_budget(3)
+@cached('employees', 'tasks')
+def get_capacity_forecast():
+    """Weekly load per employee and for the team (weeks=12, start=YYYY-MM-DD, role)"""
+    try:
+        weeks = int(request.args.get('weeks', 12))
+    except ValueError:
+        return jsonify({'error': 'weeks must be an integer'}), 400
+    if weeks < 1 or weeks > MAX_WEEKS:
+        return jsonify({'error': f'weeks must be between 1 and {MAX_WEEKS}'}), 400
+    
+    start = request.args.get('start')
+    if start:
+        try:
+            start = datetime.strptime(start, '%Y-%m-%d').date()
+        except ValueError:
+            return jsonify({'error': 'Invalid start date format. Use YYYY-MM-DD'}), 400
+    
+    # Açık görevlerin saatleri teslim tarihine kadarki haftalara yayılır (NumPy, tek sorgu)
+    return jsonify(capacity_forecast(weeks, start=start, role=request.args.get('role')))
 
 @employees_bp.route('/<employee_id>', methods=['GET'])
+@query_budget(3)
+@cached('employees')
 def get_employee(employee_id):
     """Get a specific employee"""
-    employee = Employee.query.get_or_404(employee_id)
-    return jsonify(employee.to_dict())
+    fields, error = sparse_fields(Employee)
+    if error:
+        return error
+    
+    validators = row_validators(db.session.query(Employee.updated_at).filter(Employee.employee_id == employee_id))
+    if validators is None:
+        abort(404)
+    
+    return conditional(validators, lambda: jsonify(
+        with_fields(Employee.query.filter_by(employee_id=employee_id), Employee, fields).first_or_404().to_dict(fields=fields)))
 
 @employees_bp.route('', methods=['POST'])
+@query_budget(8)
 def create_employee():
     """Create a new employee"""
     data = request.get_json()
@@ -54,11 +128,13 @@ def create_employee():
     )
     
     db.session.add(employee)
+    sync_employee_index(employee)
     db.session.commit()
     
     return jsonify(employee.to_dict()), 201
 
 @employees_bp.route('/<employee_id>', methods=['PUT'])
+@query_budget(8)
 def update_employee(employee_id):
     """Update an employee"""
     employee = Employee.query.get_or_404(employee_id)
@@ -72,11 +148,16 @@ def update_employee(employee_id):
         if field in data:
             setattr(employee, field, data[field])
     
+    # Arama indeksini güncel tut
+    if 'skills' in data or 'languages' in data:
+        sync_employee_index(employee)
+    
     db.session.commit()
     
     return jsonify(employee.to_dict())
 
 @employees_bp.route('/<employee_id>', methods=['DELETE'])
+@query_budget(6)
 def delete_employee(employee_id):
     """Delete an employee"""
     employee = Employee.query.get_or_404(employee_id)
@@ -85,18 +166,50 @@ def delete_employee(employee_id):
     if employee.assigned_tasks:
         return jsonify({'error': 'Cannot delete employee with assigned tasks'}), 400
     
+    delete_employee_index(employee_id)
     db.session.delete(employee)
     db.session.commit()
     
     return '', 204
 
+@employees_bp.route('/reconcile-workload', methods=['POST'])
+@query_budget(3)
+def reconcile_employee_workload():
+    """Recompute all employees' current_load_hours from non-completed tasks and report drift"""
+    dry_run = request.args.get('dry_run', 'false').lower() == 'true'
+    
+    drift = reconcile_workload(dry_run=dry_run)
+    if not dry_run:
+        db.session.commit()
+    
+    return jsonify({
+        'dry_run': dry_run,
+        'updated': 0 if dry_run else len(drift),
+        'drift': drift
+    })
+
 @employees_bp.route('/<employee_id>/workload', methods=['GET'])
+@query_budget(4)
+@cached('employees', 'tasks')
 def get_employee_workload(employee_id):
     """Get employee's workload information"""
+    # Çalışanın ve görevlerinin son değişikliği + görev sayısı (tek satırlık sorgu)
+    assigned = Task.assignee_id == Employee.employee_id
+    validators = row_validators(db.session.query(
+        Employee.updated_at,
+        db.select(db.func.max(Task.updated_at)).where(assigned).scalar_subquery(),
+        db.select(db.func.count(Task.task_id)).where(assigned).scalar_subquery()
+    ).filter(Employee.employee_id == employee_id))
+    if validators is None:
+        abort(404)
+    
+    return conditional(validators, lambda: _employee_workload(employee_id))
+
+def _employee_workload(employee_id):
+    """Build the workload response body"""
     employee = Employee.query.get_or_404(employee_id)
     
     # Calculate workload from tasks
-    from models import Task
     assigned_tasks = Task.query.filter_by(assignee_id=employee_id).all()
     
     total_estimated_hours = sum(task.estimated_hours for task in assigned_tasks if task.status != 'Completed')
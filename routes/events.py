@@ -0,0 +1,47 @@
+from flask import Blueprint, request, jsonify
+from extensions import changes
+from services.events import EVENT_TYPES, event_filter
+from services.query_guard import query_budget
+from services.sse import sse_response
+
+events_bp = Blueprint('events', __name__, url_prefix='/api/events')
+
+
+def _list_arg(name):
+    """Repeated or comma separated query parameter as a set"""
+    return {value.strip() for item in request.args.getlist(name) for value in item.split(',') if value.strip()}
+
+
+@events_bp.route('', methods=['GET'])
+@query_budget(0)
+def stream_events():
+    """Change feed (text/event-stream) replacing list polling.
+    
+    Events `task`, `project` and `employee` carry {"action": "created" | "updated"
+    | "deleted", <id>, project_id/assignee_id, "changed": [...], "previous": {...}}
+    and are sent after the change is committed; refetch what you show. Large
+    bulk writes arrive as one event with `count` instead of IDs.
+    
+    Filters: ?project_id=p1,p2  ?assignee_id=e1  ?types=task,project
+    Resume: Last-Event-ID header (EventSource sends it on reconnect) or
+    ?last_event_id=. A `reset` event means events were missed: refetch lists.
+    """
+    if not changes.enabled:
+        return jsonify({'error': 'Change feed is disabled'}), 404
+
+    types = _list_arg('types')
+    unknown = types - set(EVENT_TYPES)
+    if unknown:
+        return jsonify({'error': f"Unknown event types: {', '.join(sorted(unknown))}",
+                        'allowed': list(EVENT_TYPES)}), 400
+
+    match = event_filter(types, _list_arg('project_id'), _list_arg('assignee_id'))
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    return sse_response(changes.stream(match, last_event_id))
+
+
+@events_bp.route('/stats', methods=['GET'])
+@query_budget(0)
+def event_stats():
+    """Connected clients, published and buffered events of this process."""
+    return jsonify(changes.stats())
@@ -1,189 +1,172 @@
 # projects.py
-from flask import Blueprint, request, jsonify
-# 'datetime' importlarını temizledim ve 'timedelta'yı doğrudan ekledim
-from datetime import datetime, date, timedelta 
+from flask import Blueprint, request, jsonify, url_for, abort
+from datetime import datetime
+from sqlalchemy.orm import selectinload
 from models import Project, Task, Employee
-from extensions import db
-import random # Simülasyon için eklendi
-# Yeni import'lar
-import random 
-import requests 
-import json
-import re 
-import os
+from extensions import db, jobs, ai_cache, ids
+from services.stats import task_aggregates
+from services.pagination import list_response, insertion_order
+from services.cache import cached
+from services.query_guard import query_budget
+from services.fields import sparse_fields, with_fields
+from services.conditional import conditional, collection_validators, row_validators
+from services.generation import GenerationError, prepare_generation, generate_project, stream_project_generation
+from services.jobs import JobQueueFull
+from services.sse import format_event, sse_response
 projects_bp = Blueprint('projects', __name__, url_prefix='/api/projects')
 
 
-# --- YENİ ENDPOINT: Yapay Zeka ile Görev Üretme ve Proje Oluşturma ---@projects_bp.route('/generate-tasks', methods=['POST'])
+# --- YENİ ENDPOINT: Yapay Zeka ile Görev Üretme ve Proje Oluşturma ---
 @projects_bp.route('/generate-tasks', methods=['POST'])
+@query_budget(8, per_item=1)
 def generate_tasks_and_create_project():
     """
     Kullanıcıdan gelen proje detaylarını alır,
     LLM API’ye gönderir, gelen görevleri veritabanına işler.
+    
+    ?async=true ile istek hemen 202 + job_id döner; LLM çağrısı ve veritabanı
+    kaydı arka plandaki sınırlı worker havuzunda çalışır. Sonuç için:
+    GET /api/projects/generate-tasks/jobs/<job_id>
+    
+    Aynı payload için AI cevabı cache'ten gelir; ?cache=false ile atlanır.
     """
-    # Gerekli import'ların yapıldığını varsayıyoruz:
-    # from flask import request, jsonify, current_app
-    # import random, requests, json
-    # from datetime import date, timedelta, datetime
-    # from your_models import Project, Task, Employee, db
-
-    data = request.get_json()
-
-    required_fields = ['project_title', 'metadata', 'team']
-    for field in required_fields:
-        if field not in data:
-            return jsonify({'error': f'Missing required field: {field}'}), 400
-
-    project_title = data['project_title']
-    project_id = f"p{random.randint(100, 999)}"
-    while Project.query.get(project_id):
-        project_id = f"p{random.randint(100, 999)}"
-
-    if Project.query.filter_by(name=project_title).first():
-        return jsonify({'error': 'Project name already exists.'}), 400
-
-    # Ngrok URL veya sabit backend adresi
-    AI_API_URL = os.getenv("AI_API_URL")
-    AI_API_URL = AI_API_URL+"/api/generate"
-    
-    payload = {
-        "json_input": data,
-        "project_key": data.get("project_key", "INSIGHT"),
-        "use_model": True
-    }
+    data = request.get_json(silent=True)
+    run_async = request.args.get('async', 'false').lower() == 'true'
+    use_cache = request.args.get('cache', 'true').lower() == 'true'
 
     try:
-        # --- LLM API’ye istek at ---
-        response = requests.post(AI_API_URL, json=payload, timeout=120)
-        response.raise_for_status()
-        result = response.json()
-        
-        # --- LOGLAMA NOKTASI 1: LLM API'den Gelen Ham Cevap ---
-        # Eğer flask uygulamanız varsa current_app.logger kullanın, yoksa print() veya logging modülü kullanın.
-        print("--- LLM API Ham Cevabı ---")
-        print(json.dumps(result, indent=2))
-        print("--------------------------")
-
-
-        if not result.get("success", True):
-            return jsonify({'error': 'Model processing failed', 'details': result}), 500
-
-        jira_json = result.get("jira_json")
-        if not jira_json or "tasks" not in jira_json:
-            return jsonify({'error': 'No tasks found in response.'}), 500
-
-        tasks_from_llm = jira_json["tasks"]
+        project_id = prepare_generation(data)
+    except GenerationError as e:
+        return jsonify(e.to_dict()), e.status_code
 
-    except requests.exceptions.RequestException as e:
-        return jsonify({'error': 'Failed to reach AI API', 'details': str(e)}), 500
-
-    # --- Proje oluştur ---
-    due_date_obj = date.today() + timedelta(weeks=3)
-    project = Project(
-        project_id=project_id,
-        name=project_title,
-        description=data.get('metadata', {}).get('description', data.get('project_description', 'No description provided')),
-        status='Planning',
-        budget=data.get('budget', 0),
-        priority='high',
-        due_date=due_date_obj
-    )
-    db.session.add(project)
-
-    # --- Görevleri veritabanına kaydet ---
-    created_tasks = []
-
-    for i, t in enumerate(tasks_from_llm):
-        f = t["fields"]
-
-        # Assignee bilgisi
-        # Atanan kişi ID'sini çekmeye çalışırken kullanılan yol: f.get("assignee", {}).get("accountId")
-        assignee_id = f.get("assignee", {}).get("accountId")
-        
-        # --- LOGLAMA NOKTASI 2: Her Görev İçin Atanan Kişi Verisi ---
-        print(f"Task {i+1} Başlık: {f.get('summary')}")
-        print(f"Task {i+1} 'assignee' alanı (tam): {f.get('assignee')}")
-        print(f"Task {i+1} Çıkarılan assignee_id: {assignee_id}")
-        print("--------------------------")
-
-
-        # Estimated time (örnek: "4d" → saat cinsinden)
-        estimate_str = f.get("timetracking", {}).get("originalEstimate", "0d")
-        estimated_hours = 0
-        if "d" in estimate_str:
-            try:
-                estimated_hours = int(estimate_str.replace("d", "")) * 8
-            except:
-                estimated_hours = 0
-
-        # Task ID oluştur
-        task_id = f"t{random.randint(100, 999)}"
-        while Task.query.get(task_id):
-            task_id = f"t{random.randint(100, 999)}"
-
-        task = Task(
-            task_id=task_id,
-            title=f.get("summary"),
-            # Description çekme mantığı karmaşık görünüyor, hata vermediği varsayılmıştır.
-            description=f.get("description", {}).get("content", [{}])[0].get("content", [{}])[0].get("text", ""),
-            estimated_hours=estimated_hours,
-            priority=f.get("priority", {}).get("name", "Medium").lower(),
-            status="Pending",
-            # assignee_id, yukarıda LLM verisinden çekilen değerdir
-            assignee_id=assignee_id, 
-            project_id=project_id,
-            due_date=datetime.strptime(f.get("duedate"), "%Y-%m-%d") if f.get("duedate") else None,
-            created_at=datetime.utcnow()
-        )
-
-        db.session.add(task)
-        created_tasks.append(task.to_dict())
+    if run_async:
+        try:
+            job = jobs.submit('generate-tasks', generate_project, data, project_id, use_cache)
+        except JobQueueFull as e:
+            return jsonify({'error': 'Too many generation jobs in progress, try again later',
+                            'details': str(e)}), 503
 
-        # Çalışanın yükünü güncelle
-        if assignee_id:
-            emp = Employee.query.get(assignee_id)
-            if emp:
-                emp.current_load_hours = (emp.current_load_hours or 0) + task.estimated_hours
-            else:
-                # --- EK LOGLAMA: Atanan ID Veritabanında Bulunamadı ---
-                print(f"UYARI: {assignee_id} ID'li çalışan veritabanında bulunamadı!")
-                print("--------------------------")
+        response = jsonify(job)
+        response.status_code = 202
+        response.headers['Location'] = url_for('projects.get_generation_job', job_id=job['job_id'])
+        return response
 
-    db.session.commit()
+    try:
+        result = generate_project(data, project_id, use_cache)
+    except GenerationError as e:
+        return jsonify(e.to_dict()), e.status_code
+
+    return jsonify(result), 201
+
+@projects_bp.route('/generate-tasks/stream', methods=['POST'])
+@query_budget(4)
+def stream_generated_tasks():
+    """generate-tasks with Server-Sent Events progress.
+    
+    Tasks are stored and sent one by one while the AI service is still
+    generating (text/event-stream): `project` once the project row exists, one
+    `task` per stored task, then `done` or `error`. On `error` the project is
+    rolled back. Invalid requests get a JSON 400 before the stream starts.
+    Browsers read it with fetch() + ReadableStream (EventSource is GET-only).
+    """
+    data = request.get_json(silent=True)
+    use_cache = request.args.get('cache', 'true').lower() == 'true'
 
-    return jsonify({
-        "message": "Project and tasks generated successfully from LLM response.",
-        "project_id": project_id,
-        "project": project.to_dict(),
-        "generated_tasks": created_tasks
-    }), 201
+    try:
+        project_id = prepare_generation(data)
+    except GenerationError as e:
+        return jsonify(e.to_dict()), e.status_code
+
+    def events():
+        for event, payload in stream_project_generation(data, project_id, use_cache):
+            yield format_event(payload, event=event)
+
+    return sse_response(events())
+
+@projects_bp.route('/generate-tasks/jobs/<job_id>', methods=['GET'])
+@query_budget(1)
+def get_generation_job(job_id):
+    """Get status (queued, running, succeeded, failed) and result of an async generation job."""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+@projects_bp.route('/generate-tasks/cache', methods=['GET'])
+@query_budget(0)
+def get_generation_cache_stats():
+    """Hit/miss counters of the AI response cache."""
+    return jsonify(ai_cache.stats())
+
+@projects_bp.route('/generate-tasks/cache', methods=['DELETE'])
+@query_budget(0)
+def clear_generation_cache():
+    """Drop all cached AI responses."""
+    ai_cache.clear()
+    return '', 204
     
 # --- Mevcut Proje CRUD ve Listeleme Fonksiyonları ---
 
 @projects_bp.route('', methods=['GET'])
+@query_budget(3)
+@cached('projects', 'tasks')
 def get_projects():
-    """Get all projects with optional filtering by status."""
+    """Get all projects with optional filtering by status, pagination (limit/cursor) or streaming."""
     status = request.args.get('status')  # Filter by status
     include_tasks = request.args.get('include_tasks', 'false').lower() == 'true'
+    fields, error = sparse_fields(Project)
+    if error:
+        return error
     
     query = Project.query
     
     if status:
         query = query.filter_by(status=status)
     
-    projects = query.all()
-    return jsonify([project.to_dict(include_tasks=include_tasks) for project in projects])
+    validators = collection_validators(query, Project, *((Task,) if include_tasks else ()))
+    
+    query = with_fields(query, Project, fields)
+    if include_tasks and request.args.get('stream', 'false').lower() != 'true':
+        # Görevler proje başına ayrı sorgu yerine sayfa başına tek IN sorgusuyla yüklenir
+        # (akışta yield_per ile birlikte kullanılamaz; orada proje başına yüklenir)
+        query = query.options(selectinload(Project.tasks))
+    
+    return conditional(validators, lambda: list_response(
+        query, Project.project_id, lambda project: project.to_dict(include_tasks=include_tasks, fields=fields)))
 
 @projects_bp.route('/<project_id>', methods=['GET'])
+@query_budget(5)
+@cached('projects', 'tasks', 'employees')
 def get_project(project_id):
     """Get a specific project by ID."""
     include_tasks = request.args.get('include_tasks', 'false').lower() == 'true'
-    project = Project.query.get_or_404(project_id)
-    
-    result = project.to_dict(include_tasks=include_tasks)
+    include_members = include_tasks or request.args.get('include_members', 'false').lower() == 'true'
+    fields, error = sparse_fields(Project)
+    if error:
+        return error
+    
+    columns = [Project.updated_at]
+    if include_members:
+        in_project = Task.project_id == Project.project_id
+        columns += [
+            db.select(db.func.max(Task.updated_at)).where(in_project).scalar_subquery(),
+            db.select(db.func.count(Task.task_id)).where(in_project).scalar_subquery(),
+            db.select(db.func.max(Employee.updated_at)).scalar_subquery()
+        ]
+    validators = row_validators(db.session.query(*columns).filter(Project.project_id == project_id))
+    if validators is None:
+        abort(404)
+    
+    return conditional(validators, lambda: _project_detail(project_id, include_tasks, include_members, fields))
+
+def _project_detail(project_id, include_tasks, include_members, fields=None):
+    """Build the project detail response body"""
+    project = with_fields(Project.query.filter_by(project_id=project_id), Project, fields).first_or_404()
+    
+    result = project.to_dict(include_tasks=include_tasks, fields=fields)
     
     # Add team members (employees who have tasks in this project)
-    if include_tasks or request.args.get('include_members', 'false').lower() == 'true':
+    if include_members:
         task_assignee_ids = [task.assignee_id for task in project.tasks if task.assignee_id]
         unique_assignee_ids = list(set(task_assignee_ids))
         # employee_id'lerin string olduğunu varsayıyoruz (e01, e02 gibi)
@@ -193,18 +176,19 @@ def get_project(project_id):
     return jsonify(result)
 
 @projects_bp.route('', methods=['POST'])
+@query_budget(6)
 def create_project():
     """Create a new project (simple, without AI task generation)."""
     data = request.get_json()
     
     # Validate required fields
-    required_fields = ['project_id', 'name', 'dueDate']
+    required_fields = ['name', 'dueDate']
     for field in required_fields:
         if field not in data:
             return jsonify({'error': f'Missing required field: {field}'}), 400
     
-    # Check if project_id already exists
-    if Project.query.get(data['project_id']):
+    # Check if project_id already exists (project_id verilmezse sequence'ten alınır)
+    if data.get('project_id') and Project.query.get(data['project_id']):
         return jsonify({'error': 'Project ID already exists'}), 400
     
     # Check if project name already exists
@@ -220,7 +204,7 @@ def create_project():
     
     # Create new project
     project = Project(
-        project_id=data['project_id'],
+        project_id=data.get('project_id') or ids.next_id('project'),
         name=data['name'],
         description=data.get('description', ''),
         status=data.get('status', 'Planning'),
@@ -235,6 +219,7 @@ def create_project():
     return jsonify(project.to_dict()), 201
 
 @projects_bp.route('/<project_id>', methods=['PUT'])
+@query_budget(4)
 def update_project(project_id):
     """Update an existing project."""
     project = Project.query.get_or_404(project_id)
@@ -272,6 +257,7 @@ def update_project(project_id):
     return jsonify(project.to_dict())
 
 @projects_bp.route('/<project_id>', methods=['DELETE'])
+@query_budget(5)
 def delete_project(project_id):
     """Delete a project (and all its tasks via cascade delete)."""
     project = Project.query.get_or_404(project_id)
@@ -282,6 +268,8 @@ def delete_project(project_id):
     return '', 204
 
 @projects_bp.route('/<project_id>/tasks', methods=['GET'])
+@query_budget(3)
+@cached('tasks', 'projects', 'employees')
 def get_project_tasks(project_id):
     """Get all tasks for a specific project. Includes 'enrich=true' by default for frontend visibility."""
     # Proje ID'sinin varlığını kontrol et
@@ -289,13 +277,21 @@ def get_project_tasks(project_id):
     
     # 'enrich' parametresini al. Frontend'in görevleri düzgün göstermesi için varsayılanı 'true' yaptık.
     enrich = request.args.get('enrich', 'true').lower() == 'true' 
+    fields, error = sparse_fields(Task, *Task.ENRICHED_FIELDS)
+    if error:
+        return error
     
-    # Projenin tüm görevlerini getir
-    tasks = [task.to_dict(enrich=enrich) for task in project.tasks]
+    # Projenin tüm görevlerini getir (enrich için isimler aynı sorguda join edilir)
+    query = with_fields(Task.query.filter_by(project_id=project_id), Task, fields)
+    if enrich:
+        query = query.options(*Task.enrich_options(fields))
+    tasks = [task.to_dict(enrich=enrich, fields=fields) for task in query.order_by(*insertion_order(Task.task_id)).all()]
     
     return jsonify(tasks)
 
 @projects_bp.route('/<project_id>/members', methods=['GET'])
+@query_budget(4)
+@cached('projects', 'tasks', 'employees')
 def get_project_members(project_id):
     """Get all team members working on a project."""
     project = Project.query.get_or_404(project_id)
@@ -304,39 +300,36 @@ def get_project_members(project_id):
     task_assignee_ids = [task.assignee_id for task in project.tasks if task.assignee_id]
     unique_assignee_ids = list(set(task_assignee_ids))
     
+    fields, error = sparse_fields(Employee)
+    if error:
+        return error
+    
     # Get employee details
-    members = Employee.query.filter(Employee.employee_id.in_(unique_assignee_ids)).all()
+    members = with_fields(Employee.query.filter(Employee.employee_id.in_(unique_assignee_ids)), Employee, fields).all()
     
-    return jsonify([member.to_dict() for member in members])
+    return jsonify([member.to_dict(fields=fields) for member in members])
 
 @projects_bp.route('/<project_id>/stats', methods=['GET'])
+@query_budget(3)
+@cached('projects', 'tasks')
 def get_project_stats(project_id):
     """Get project statistics based on its tasks."""
     project = Project.query.get_or_404(project_id)
     
-    tasks = project.tasks
-    total_tasks = len(tasks)
+    # Sayımlar ve saat toplamları tek bir SQL sorgusunda hesaplanır
+    aggregates = task_aggregates(Task.project_id == project_id)
     
     stats = {
         'project': project.to_dict(),
         'tasks': {
-            'total': total_tasks,
-            'completed': len([t for t in tasks if t.status == 'Completed']),
-            'in_progress': len([t for t in tasks if t.status == 'In Progress']),
-            'pending': len([t for t in tasks if t.status == 'Pending']),
-            'blocked': len([t for t in tasks if t.status == 'Blocked'])
-        },
-        'priority': {
-            'critical': len([t for t in tasks if t.priority == 'critical']),
-            'high': len([t for t in tasks if t.priority == 'high']),
-            'medium': len([t for t in tasks if t.priority == 'medium']),
-            'low': len([t for t in tasks if t.priority == 'low'])
+            'total': aggregates['total'],
+            'completed': aggregates['by_status']['completed'],
+            'in_progress': aggregates['by_status']['in_progress'],
+            'pending': aggregates['by_status']['pending'],
+            'blocked': aggregates['by_status']['blocked']
         },
-        'estimated_hours': {
-            'total': sum(t.estimated_hours for t in tasks),
-            'completed': sum(t.estimated_hours for t in tasks if t.status == 'Completed'),
-            'remaining': sum(t.estimated_hours for t in tasks if t.status != 'Completed')
-        }
+        'priority': aggregates['by_priority'],
+        'estimated_hours': aggregates['estimated_hours']
     }
     
     return jsonify(stats)
\ No newline at end of file
@@ -1,7 +1,17 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, abort
 from datetime import datetime, date
 from models import Task, Project, Employee
-from extensions import db
+from extensions import db, ids, recommender
+from services.stats import task_aggregates
+from services.pagination import list_response, insertion_order
+from services.cache import cached
+from services.query_guard import query_budget, budget_items
+from services.fields import sparse_fields, with_fields
+from services.conditional import conditional, collection_validators, row_validators
+from services.counters import apply_task_change, apply_task_changes
+from services.workload import apply_workload_change, apply_workload_changes
+from services.skills import parse_skill_filters
+from services.recommend import MAX_TOP_K
 
 tasks_bp = Blueprint('tasks', __name__, url_prefix='/api/tasks')
 
@@ -17,15 +27,79 @@ def parse_date_string(date_str):
     except ValueError:
         return None # Hatalı format gelirse None dön
 
+def build_task(data, task_id):
+    """Build a new Task from request data. Returns (task, error_message)."""
+    # Due Date Ayrıştırma: SQLite'ın beklediği Python date objesine çevir
+    due_date_obj = parse_date_string(data.get('due_date'))
+    
+    # Zorunlu alan kontrolü (NOT NULL constraint'i için)
+    if not due_date_obj:
+        return None, 'Missing or invalid date format for due_date. Use YYYY-MM-DD'
+    if not data.get('title'):
+        return None, 'Missing required field: title'
+    if not data.get('project_id'):
+        return None, 'Missing required field: project_id'
+    
+    now = datetime.utcnow()
+    task = Task(
+        task_id=task_id,
+        title=data.get('title'),
+        description=data.get('description'),
+        status=data.get('status', 'Pending'),
+        priority=data.get('priority', 'medium'),
+        assignee_id=data.get('assignee_id'),
+        project_id=data.get('project_id'),
+        estimated_hours=data.get('estimated_hours', 0),
+        due_date=due_date_obj, # Ayrıştırılmış date objesi kullanılıyor
+        created_at=now,
+        updated_at=now
+    )
+    return task, None
+
+def apply_status_change(task, new_status):
+    """Set status, updated_at and completed_at"""
+    task.status = new_status
+    task.updated_at = datetime.utcnow()
+    
+    if new_status == 'Completed':
+        task.completed_at = datetime.utcnow()
+    else:
+        task.completed_at = None
+
+def apply_task_update(task, data):
+    """Apply PUT fields to a task. Returns an error message, or None on success."""
+    # Due Date'i önce ayrıştır; hatalıysa task'a dokunmadan dön
+    if 'due_date' in data:
+        new_due_date = parse_date_string(data['due_date'])
+        if not new_due_date:
+            return 'Invalid date format for due_date. Use YYYY-MM-DD'
+        task.due_date = new_due_date
+    
+    # Task'ı güncelle
+    task.title = data.get('title', task.title)
+    task.description = data.get('description', task.description)
+    task.priority = data.get('priority', task.priority)
+    task.assignee_id = data.get('assignee_id', task.assignee_id)
+    task.project_id = data.get('project_id', task.project_id)
+    task.estimated_hours = data.get('estimated_hours', task.estimated_hours) or 0
+    
+    apply_status_change(task, data.get('status', task.status))
+    return None
+
 @tasks_bp.route('', methods=['GET'])
+@query_budget(3)
+@cached('tasks', 'employees', 'projects')
 def get_tasks():
-    """Get all tasks with optional filtering"""
+    """Get all tasks with optional filtering, keyset pagination (limit/cursor) or streaming (stream=true)"""
     # Query parameters
     status = request.args.get('status')
     priority = request.args.get('priority')
     assignee_id = request.args.get('assignee_id')
     project_id = request.args.get('project_id')
     enrich = request.args.get('enrich', 'true').lower() == 'true'
+    fields, error = sparse_fields(Task, *Task.ENRICHED_FIELDS)
+    if error:
+        return error
     
     query = Task.query
     
@@ -39,129 +113,91 @@ def get_tasks():
     if project_id:
         query = query.filter_by(project_id=project_id)
     
-    tasks = query.all()
-    return jsonify([task.to_dict(enrich=enrich) for task in tasks])
+    # İsimler gömülü olduğu için enrich'te çalışan/proje değişiklikleri de versiyona girer
+    validators = collection_validators(query, Task, *((Employee, Project) if enrich else ()))
+    
+    query = with_fields(query, Task, fields)
+    if enrich:
+        query = query.options(*Task.enrich_options(fields))
+    
+    return conditional(validators, lambda: list_response(
+        query, Task.task_id, lambda task: task.to_dict(enrich=enrich, fields=fields)))
 
 @tasks_bp.route('/<task_id>', methods=['GET'])
+@query_budget(3)
+@cached('tasks', 'employees', 'projects')
 def get_task(task_id):
     """Get a specific task"""
     enrich = request.args.get('enrich', 'true').lower() == 'true'
-    task = Task.query.get_or_404(task_id)
-    return jsonify(task.to_dict(enrich=enrich))
+    fields, error = sparse_fields(Task, *Task.ENRICHED_FIELDS)
+    if error:
+        return error
+    
+    columns = [Task.updated_at]
+    if enrich:
+        columns += [
+            db.select(Employee.updated_at).where(Employee.employee_id == Task.assignee_id).scalar_subquery(),
+            db.select(Project.updated_at).where(Project.project_id == Task.project_id).scalar_subquery()
+        ]
+    validators = row_validators(db.session.query(*columns).filter(Task.task_id == task_id))
+    if validators is None:
+        abort(404)
+    
+    return conditional(validators, lambda: jsonify(_load_task(task_id, enrich, fields).to_dict(enrich=enrich, fields=fields)))
+
+def _load_task(task_id, enrich, fields):
+    """Load one task with only the columns/relations the response needs"""
+    query = with_fields(Task.query.filter_by(task_id=task_id), Task, fields)
+    if enrich:
+        query = query.options(*Task.enrich_options(fields))
+    return query.first_or_404()
 
 @tasks_bp.route('', methods=['POST'])
+@query_budget(7)
 def create_task():
     """Create a new task"""
     data = request.json
     
-    # Due Date Ayrıştırma: SQLite'ın beklediği Python date objesine çevir
-    due_date_obj = parse_date_string(data.get('due_date'))
-    
-    # Zorunlu alan kontrolü (NOT NULL constraint'i için)
-    if not due_date_obj:
-        return jsonify({'error': 'Missing or invalid date format for due_date. Use YYYY-MM-DD'}), 400
-    
-    # Yeni task oluştur
-    task = Task(
-        task_id=data.get('task_id') or f"t{int(datetime.utcnow().timestamp())}",
-        title=data.get('title'),
-        description=data.get('description'),
-        status=data.get('status', 'Pending'),
-        priority=data.get('priority', 'medium'),
-        assignee_id=data.get('assignee_id'),
-        project_id=data.get('project_id'),
-        estimated_hours=data.get('estimated_hours', 0),
-        due_date=due_date_obj, # Ayrıştırılmış date objesi kullanılıyor
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
-    )
-    
-    # Assignee varsa ve status completed değilse workload'a ekle
-    if task.assignee_id and task.status != 'Completed':
-        employee = Employee.query.get(task.assignee_id)
-        if employee:
-            employee.current_load_hours = employee.current_load_hours + (task.estimated_hours or 0)
+    # Yeni task oluştur (task_id verilmezse sequence'ten alınır)
+    task, error = build_task(data, data.get('task_id') or ids.next_id('task'))
+    if error:
+        return jsonify({'error': error}), 400
     
     db.session.add(task)
+    
+    # Assignee varsa ve status completed değilse workload'a ekle; proje sayaçlarını güncelle
+    apply_workload_change(new=task.state())
+    apply_task_change(new=task.state())
     db.session.commit()
     
     return jsonify(task.to_dict()), 201
 
 
 @tasks_bp.route('/<task_id>', methods=['PUT'])
+@query_budget(6)
 def update_task(task_id):
     """Update a task"""
     task = Task.query.get_or_404(task_id)
     data = request.json
     
-    old_assignee_id = task.assignee_id
-    old_estimated_hours = task.estimated_hours or 0
-    old_status = task.status
-    
-    new_assignee_id = data.get('assignee_id', task.assignee_id)
-    new_estimated_hours = data.get('estimated_hours', task.estimated_hours) or 0
-    new_status = data.get('status', task.status)
-    
-    # Workload hesaplaması - sadece completed olmayan task'lar için
-    if old_status != 'Completed' and new_status != 'Completed':
-        # Assignee veya estimated_hours değiştiyse
-        if old_assignee_id != new_assignee_id or old_estimated_hours != new_estimated_hours:
-            # Eski assignee'den çıkar
-            if old_assignee_id:
-                old_employee = Employee.query.get(old_assignee_id)
-                if old_employee:
-                    old_employee.current_load_hours = max(0, old_employee.current_load_hours - old_estimated_hours)
-            
-            # Yeni assignee'ye ekle
-            if new_assignee_id:
-                new_employee = Employee.query.get(new_assignee_id)
-                if new_employee:
-                    new_employee.current_load_hours = new_employee.current_load_hours + new_estimated_hours
-    
-    # Status değişimi kontrolü
-    if old_status != new_status:
-        if new_status == 'Completed' and old_status != 'Completed':
-            # Completed'a geçiş - workload'dan çıkar
-            if new_assignee_id:
-                employee = Employee.query.get(new_assignee_id)
-                if employee:
-                    employee.current_load_hours = max(0, employee.current_load_hours - new_estimated_hours)
-        
-        elif old_status == 'Completed' and new_status != 'Completed':
-            # Completed'dan çıkış - workload'a ekle
-            if new_assignee_id:
-                employee = Employee.query.get(new_assignee_id)
-                if employee:
-                    employee.current_load_hours = employee.current_load_hours + new_estimated_hours
-    
-    # Task'ı güncelle
-    task.title = data.get('title', task.title)
-    task.description = data.get('description', task.description)
-    task.status = new_status
-    task.priority = data.get('priority', task.priority)
-    task.assignee_id = new_assignee_id
-    task.project_id = data.get('project_id', task.project_id)
-    task.estimated_hours = new_estimated_hours
+    old_state = task.state()
     
-    # Due Date'i güncelle ve ayrıştır
-    if 'due_date' in data:
-        new_due_date = parse_date_string(data['due_date'])
-        if not new_due_date:
-            return jsonify({'error': 'Invalid date format for due_date. Use YYYY-MM-DD'}), 400
-        task.due_date = new_due_date
-        
-    task.updated_at = datetime.utcnow()
+    error = apply_task_update(task, data)
+    if error:
+        return jsonify({'error': error}), 400
     
-    if new_status == 'Completed':
-        task.completed_at = datetime.utcnow()
-    else:
-        task.completed_at = None
+    # Workload ve proje sayaçları: eski ve yeni durum arasındaki fark uygulanır
+    # (sadece completed olmayan task'lar workload'a sayılır)
+    new_state = task.state()
+    apply_workload_change(old=old_state, new=new_state)
+    apply_task_change(old=old_state, new=new_state)
     
     db.session.commit()
     
     return jsonify(task.to_dict()), 200
 
 @tasks_bp.route('/<task_id>/status', methods=['PATCH'])
+@query_budget(5)
 def update_task_status(task_id):
     """Update task status"""
     task = Task.query.get_or_404(task_id)
@@ -171,50 +207,299 @@ def update_task_status(task_id):
     if not new_status:
         return jsonify({'error': 'Status is required'}), 400
     
-    old_status = task.status
+    old_state = task.state()
+    apply_status_change(task, new_status)
     
-    # Status değiştiğinde workload güncelle
-    if task.assignee_id and old_status != new_status:
-        employee = Employee.query.get(task.assignee_id)
-        
-        if employee:
-            # Eğer completed'a geçtiyse, workload'dan çıkar
-            if new_status == 'Completed' and old_status != 'Completed':
-                employee.current_load_hours = max(0, employee.current_load_hours - (task.estimated_hours or 0))
-            
-            # Eğer completed'dan başka bir status'a geçtiyse, workload'a ekle
-            elif old_status == 'Completed' and new_status != 'Completed':
-                employee.current_load_hours = employee.current_load_hours + (task.estimated_hours or 0)
-    
-    task.status = new_status
-    task.updated_at = datetime.utcnow()
-    
-    if new_status == 'Completed':
-        task.completed_at = datetime.utcnow()
-    else:
-        task.completed_at = None
+    # Completed'a geçişte workload'dan çıkar, Completed'dan çıkışta geri ekle
+    new_state = task.state()
+    apply_workload_change(old=old_state, new=new_state)
+    apply_task_change(old=old_state, new=new_state)
     
     db.session.commit()
     
     return jsonify(task.to_dict()), 200
 
 @tasks_bp.route('/<task_id>', methods=['DELETE'])
+@query_budget(5)
 def delete_task(task_id):
     """Delete a task"""
     task = Task.query.get_or_404(task_id)
     
     # Task silinmeden önce assignee'nin workload'unu güncelle
     # Sadece completed olmayan task'lar workload'dan çıkarılır
-    if task.assignee_id and task.status != 'Completed':
-        employee = Employee.query.get(task.assignee_id)
-        if employee:
-            employee.current_load_hours = max(0, employee.current_load_hours - (task.estimated_hours or 0))
+    apply_workload_change(old=task.state())
+    apply_task_change(old=task.state())
     
     db.session.delete(task)
     db.session.commit()
     return '', 204
 
+MAX_BULK_ITEMS = 500
+
+def _bulk_items(data, key='tasks'):
+    """Extract the item list of a bulk request. Returns (items, error_message)."""
+    items = (data or {}).get(key)
+    if not isinstance(items, list) or not items:
+        return None, f'{key} must be a non-empty list'
+    if len(items) > MAX_BULK_ITEMS:
+        return None, f'At most {MAX_BULK_ITEMS} items per request'
+    if not all(isinstance(item, dict) for item in items):
+        return None, f'Every item in {key} must be an object'
+    # Toplu route'ların sorgu bütçesi öğe sayısıyla ölçeklenir (query_budget per_item)
+    budget_items(len(items))
+    return items, None
+
+def _id_type_error(item):
+    """Per-item error for an ID field that is given but not a string, else None"""
+    for field in ('task_id', 'project_id', 'assignee_id'):
+        value = item.get(field)
+        if value is not None and not isinstance(value, str):
+            return f'{field} must be a string'
+    return None
+
+def _existing_ids(column, values):
+    """Which of the given IDs exist (single IN query); non-string values are skipped"""
+    values = {value for value in values if value and isinstance(value, str)}
+    if not values:
+        return set()
+    return set(db.session.execute(db.select(column).where(column.in_(values))).scalars())
+
+def _load_tasks(task_ids):
+    """Fetch tasks by ID with a single IN query; non-string IDs are skipped"""
+    task_ids = {task_id for task_id in task_ids if isinstance(task_id, str)}
+    return {task.task_id: task for task in Task.query.filter(Task.task_id.in_(task_ids)).all()}
+
+def _finish_bulk(results, changes, success_code=200):
+    """Apply workload/counter deltas for all changes and commit once.
+    
+    With ?atomic=true nothing is written if any item failed.
+    """
+    failed = sum(1 for result in results if 'error' in result)
+    atomic = request.args.get('atomic', 'false').lower() == 'true'
+    done = [(result, result.pop('_task')) for result in results if '_task' in result]
+    
+    if atomic and failed:
+        db.session.rollback()
+        return jsonify({'error': 'No changes applied; some items are invalid',
+                        'succeeded': 0, 'failed': failed, 'results': results}), 400
+    
+    # Tek transaction: çalışan başına ve proje başına birer UPDATE
+    apply_workload_changes(changes)
+    apply_task_changes(changes)
+    
+    # Commit sonrası her task'ı yeniden yüklememek için sonuçlar commit'ten önce hazırlanır
+    for result, task in done:
+        result['task'] = task.to_dict()
+    
+    db.session.commit()
+    
+    return jsonify({
+        'succeeded': len(results) - failed,
+        'failed': failed,
+        'results': results
+    }), success_code if not failed else 200
+
+@tasks_bp.route('/bulk', methods=['POST'])
+@query_budget(8, per_item=2)
+def bulk_create_tasks():
+    """Create many tasks in one transaction. Body: {"tasks": [{...}, ...]}"""
+    items, error = _bulk_items(request.get_json(silent=True))
+    if error:
+        return jsonify({'error': error}), 400
+    
+    given_ids = [item.get('task_id') for item in items if item.get('task_id')]
+    taken_ids = _existing_ids(Task.task_id, given_ids)
+    known_projects = _existing_ids(Project.project_id, [item.get('project_id') for item in items])
+    known_employees = _existing_ids(Employee.employee_id, [item.get('assignee_id') for item in items])
+    
+    # ID'si verilmeyen görevler için tek seferde ID ayır (yazmalardan önce)
+    new_ids = iter(ids.allocate('task', len(items) - len(given_ids)) if len(items) > len(given_ids) else [])
+    
+    results, changes, seen_ids = [], [], set()
+    for index, item in enumerate(items):
+        result = {'index': index, 'task_id': item.get('task_id')}
+        results.append(result)
+        
+        # Liste/nesne gibi hashlenemeyen ID'ler küme kontrollerinden önce öğe hatası olur
+        error = _id_type_error(item)
+        if error:
+            result['error'] = error
+            continue
+        task_id = result['task_id'] = item.get('task_id') or next(new_ids)
+        
+        if task_id in taken_ids or task_id in seen_ids:
+            result['error'] = 'Task ID already exists'
+            continue
+        if item.get('project_id') and item['project_id'] not in known_projects:
+            result['error'] = 'Project not found'
+            continue
+        if item.get('assignee_id') and item['assignee_id'] not in known_employees:
+            result['error'] = 'Assignee not found'
+            continue
+        
+        task, error = build_task(item, task_id)
+        if error:
+            result['error'] = error
+            continue
+        
+        seen_ids.add(task_id)
+        db.session.add(task)
+        changes.append((None, task.state()))
+        result['_task'] = task
+    
+    return _finish_bulk(results, changes, success_code=201)
+
+@tasks_bp.route('/bulk', methods=['PATCH'])
+@query_budget(4, per_item=3)
+def bulk_update_tasks():
+    """Update many tasks in one transaction. Body: {"tasks": [{"task_id": ..., <PUT fields>}, ...]}"""
+    items, error = _bulk_items(request.get_json(silent=True))
+    if error:
+        return jsonify({'error': error}), 400
+    
+    tasks = _load_tasks(item.get('task_id') for item in items)
+    known_projects = _existing_ids(Project.project_id, [item.get('project_id') for item in items])
+    known_employees = _existing_ids(Employee.employee_id, [item.get('assignee_id') for item in items])
+    
+    results, changes = [], []
+    for index, item in enumerate(items):
+        result = {'index': index, 'task_id': item.get('task_id')}
+        results.append(result)
+        
+        error = _id_type_error(item)
+        if error:
+            result['error'] = error
+            continue
+        task = tasks.get(item.get('task_id'))
+        if task is None:
+            result['error'] = 'Task not found'
+            continue
+        if item.get('project_id') and item['project_id'] not in known_projects:
+            result['error'] = 'Project not found'
+            continue
+        if item.get('assignee_id') and item['assignee_id'] not in known_employees:
+            result['error'] = 'Assignee not found'
+            continue
+        
+        old_state = task.state()
+        error = apply_task_update(task, item)
+        if error:
+            result['error'] = error
+            continue
+        
+        changes.append((old_state, task.state()))
+        result['_task'] = task
+    
+    return _finish_bulk(results, changes)
+
+@tasks_bp.route('/bulk-status', methods=['PATCH'])
+@query_budget(4, per_item=3)
+def bulk_update_task_status():
+    """Change the status of many tasks in one transaction.
+    
+    Body: {"task_ids": [...], "status": "Completed"}
+       or {"tasks": [{"task_id": ..., "status": ...}, ...]}
+    """
+    data = request.get_json(silent=True) or {}
+    if 'task_ids' in data:
+        if not data.get('status'):
+            return jsonify({'error': 'Status is required'}), 400
+        if not isinstance(data['task_ids'], list) or not data['task_ids']:
+            return jsonify({'error': 'task_ids must be a non-empty list'}), 400
+        items, error = _bulk_items({'tasks': [{'task_id': task_id, 'status': data['status']}
+                                              for task_id in data['task_ids']]})
+    else:
+        items, error = _bulk_items(data)
+    if error:
+        return jsonify({'error': error}), 400
+    
+    tasks = _load_tasks(item.get('task_id') for item in items)
+    
+    results, changes = [], []
+    for index, item in enumerate(items):
+        result = {'index': index, 'task_id': item.get('task_id')}
+        results.append(result)
+        
+        error = _id_type_error(item)
+        if error:
+            result['error'] = error
+            continue
+        task = tasks.get(item.get('task_id'))
+        if task is None:
+            result['error'] = 'Task not found'
+            continue
+        if not item.get('status'):
+            result['error'] = 'Status is required'
+            continue
+        
+        old_state = task.state()
+        apply_status_change(task, item['status'])
+        changes.append((old_state, task.state()))
+        result['_task'] = task
+    
+    return _finish_bulk(results, changes)
+
+def _recommendation_options(data):
+    """Parse a recommend-assignee body into (requirements, options, error)"""
+    skills = data.get('required_skills', [])
+    if not isinstance(skills, list):
+        return None, None, (jsonify({'error': 'required_skills must be a list'}), 400)
+    
+    # {"name": "python", "level": 4} veya "python:4"
+    values = [f"{skill.get('name', '')}:{skill.get('level', 0) or 0}" if isinstance(skill, dict) else str(skill)
+              for skill in skills]
+    try:
+        requirements = parse_skill_filters(values)
+    except ValueError as e:
+        return None, None, (jsonify({'error': str(e)}), 400)
+    try:
+        estimated_hours = float(data.get('estimated_hours', 0) or 0)
+        top_k = int(data.get('top_k', 5))
+    except (TypeError, ValueError):
+        return None, None, (jsonify({'error': 'estimated_hours and top_k must be numbers'}), 400)
+    
+    exclude = data.get('exclude') or []
+    if not isinstance(exclude, list):
+        return None, None, (jsonify({'error': 'exclude must be a list of employee IDs'}), 400)
+    
+    if estimated_hours < 0:
+        return None, None, (jsonify({'error': 'estimated_hours must not be negative'}), 400)
+    if top_k < 1 or top_k > MAX_TOP_K:
+        return None, None, (jsonify({'error': f'top_k must be between 1 and {MAX_TOP_K}'}), 400)
+    
+    options = {
+        'estimated_hours': estimated_hours,
+        'top_k': top_k,
+        'language': (data.get('language') or '').strip().lower() or None,
+        'timezone': data.get('timezone') or None,
+        'user_role': data.get('user_role') or None,
+        'exclude': exclude,
+        'only_available': bool(data.get('only_available', False))
+    }
+    return requirements, options, None
+
+@tasks_bp.route('/recommend-assignee', methods=['POST'])
+@query_budget(5)
+def recommend_assignee():
+    """Rank employees for a new task by skill match, free capacity, language and timezone.
+    
+    Body: {"required_skills": [{"name": "python", "level": 4}], "estimated_hours": 16,
+           "language": "en", "timezone": "UTC", "user_role": "executor", "top_k": 5}
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    
+    requirements, options, error = _recommendation_options(data)
+    if error:
+        return error
+    
+    # Puanlama bellekteki çalışan x yetenek matrisi üzerinde (NumPy), SQL yok
+    return jsonify(recommender.recommend(requirements, **options))
+
 @tasks_bp.route('/by-assignee/<assignee_id>', methods=['GET'])
+@query_budget(3)
+@cached('tasks', 'employees', 'projects')
 def get_tasks_by_assignee(assignee_id):
     """Get all tasks assigned to a specific employee"""
     # Verify employee exists
@@ -222,20 +507,27 @@ def get_tasks_by_assignee(assignee_id):
     
     enrich = request.args.get('enrich', 'true').lower() == 'true'
     status = request.args.get('status')
+    fields, error = sparse_fields(Task, *Task.ENRICHED_FIELDS)
+    if error:
+        return error
     
-    query = Task.query.filter_by(assignee_id=assignee_id)
+    query = with_fields(Task.query.filter_by(assignee_id=assignee_id), Task, fields)
     
     if status:
         query = query.filter_by(status=status)
+    if enrich:
+        query = query.options(*Task.enrich_options(fields))
     
-    tasks = query.all()
+    tasks = query.order_by(*insertion_order(Task.task_id)).all()
     
     return jsonify({
         'employee': employee.to_dict(),
-        'tasks': [task.to_dict(enrich=enrich) for task in tasks]
+        'tasks': [task.to_dict(enrich=enrich, fields=fields) for task in tasks]
     })
 
 @tasks_bp.route('/by-project/<project_id>', methods=['GET'])
+@query_budget(3)
+@cached('tasks', 'employees', 'projects')
 def get_tasks_by_project(project_id):
     """Get all tasks for a specific project"""
     # Verify project exists
@@ -243,43 +535,30 @@ def get_tasks_by_project(project_id):
     
     enrich = request.args.get('enrich', 'true').lower() == 'true'
     status = request.args.get('status')
+    fields, error = sparse_fields(Task, *Task.ENRICHED_FIELDS)
+    if error:
+        return error
     
-    query = Task.query.filter_by(project_id=project_id)
+    query = with_fields(Task.query.filter_by(project_id=project_id), Task, fields)
     
     if status:
         query = query.filter_by(status=status)
+    if enrich:
+        query = query.options(*Task.enrich_options(fields))
     
-    tasks = query.all()
+    tasks = query.order_by(*insertion_order(Task.task_id)).all()
     
     return jsonify({
         'project': project.to_dict(),
-        'tasks': [task.to_dict(enrich=enrich) for task in tasks]
+        'tasks': [task.to_dict(enrich=enrich, fields=fields) for task in tasks]
     })
 
 @tasks_bp.route('/stats', methods=['GET'])
+@query_budget(2)
+@cached('tasks')
 def get_tasks_stats():
     """Get overall task statistics"""
-    all_tasks = Task.query.all()
-    
-    stats = {
-        'total': len(all_tasks),
-        'by_status': {
-            'pending': len([t for t in all_tasks if t.status == 'Pending']),
-            'in_progress': len([t for t in all_tasks if t.status == 'In Progress']),
-            'completed': len([t for t in all_tasks if t.status == 'Completed']),
-            'blocked': len([t for t in all_tasks if t.status == 'Blocked'])
-        },
-        'by_priority': {
-            'critical': len([t for t in all_tasks if t.priority == 'critical']),
-            'high': len([t for t in all_tasks if t.priority == 'high']),
-            'medium': len([t for t in all_tasks if t.priority == 'medium']),
-            'low': len([t for t in all_tasks if t.priority == 'low'])
-        },
-        'estimated_hours': {
-            'total': sum(t.estimated_hours for t in all_tasks),
-            'completed': sum(t.estimated_hours for t in all_tasks if t.status == 'Completed'),
-            'remaining': sum(t.estimated_hours for t in all_tasks if t.status != 'Completed')
-        }
-    }
+    # Tek sorguda SQL tarafında hesaplanır, Task satırları yüklenmez
+    stats = task_aggregates()
     
     return jsonify(stats)
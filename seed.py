@@ -1,6 +1,8 @@
 from datetime import datetime, date
 from extensions import db
 from models import Employee, Project, Task
+from services.counters import reconcile_project_counters
+from services.skills import rebuild_skill_index
 
 def seed_database():
     """Seed the database with initial data matching the frontend mock data"""
@@ -389,6 +391,13 @@ def seed_database():
     
     print(f"Added {len(tasks_data)} tasks")
     
+    # Proje sayaçlarını eklenen görevlerden hesapla
+    db.session.flush()
+    reconcile_project_counters()
+    
+    # Yetenek/dil arama indeksini çalışanların JSON alanlarından doldur
+    rebuild_skill_index()
+    
     # Commit all changes
     db.session.commit()
     
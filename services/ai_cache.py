@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+
+def payload_key(payload):
+    """Canonical SHA-256 of an AI request payload (key order and whitespace independent)"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class AIResponseCache:
+    """Two-tier (memory LRU + disk) cache for AI service responses.
+
+    Entries expire after `ttl` seconds. The memory tier keeps at most
+    `memory_size` entries; the disk tier keeps at most `disk_max_entries`
+    files in `disk_dir` (None disables the disk tier).
+    """
+
+    def __init__(self, app=None):
+        self.enabled = True
+        self.ttl = 24 * 3600
+        self.memory_size = 128
+        self.disk_dir = None
+        self.disk_max_entries = 1000
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0,
+                       'bypassed': 0, 'stores': 0, 'evictions': 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.enabled = app.config.get('AI_CACHE_ENABLED', self.enabled)
+        self.ttl = app.config.get('AI_CACHE_TTL', self.ttl)
+        self.memory_size = app.config.get('AI_CACHE_MEMORY_SIZE', self.memory_size)
+        self.disk_max_entries = app.config.get('AI_CACHE_DISK_MAX_ENTRIES', self.disk_max_entries)
+
+        disk_dir = app.config.get('AI_CACHE_DIR')
+        if disk_dir and not os.path.isabs(disk_dir):
+            disk_dir = os.path.join(app.root_path, disk_dir)
+        self.disk_dir = disk_dir
+
+        app.extensions['ai_cache'] = self
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f'{key}.json')
+
+    def _fresh(self, created_at):
+        return time.time() - created_at < self.ttl
+
+    def get(self, payload):
+        """Return the cached response for payload, or None on miss"""
+        if not self.enabled:
+            return None
+        key = payload_key(payload)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._fresh(entry[0]):
+                    self._memory.move_to_end(key)
+                    self._stats['memory_hits'] += 1
+                    return entry[1]
+                del self._memory[key]
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._remember(key, entry['created_at'], entry['response'])
+            self._count('disk_hits')
+            return entry['response']
+
+        self._count('misses')
+        return None
+
+    def set(self, payload, response):
+        """Store a successful AI response in both tiers"""
+        if not self.enabled:
+            return
+        key = payload_key(payload)
+        created_at = time.time()
+        self._remember(key, created_at, response)
+        self._write_disk(key, created_at, response)
+        self._count('stores')
+
+    def record_bypass(self):
+        self._count('bypassed')
+
+    def _remember(self, key, created_at, response):
+        with self._lock:
+            self._memory[key] = (created_at, response)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not self._fresh(entry.get('created_at', 0)):
+            self._remove(path)
+            return None
+        return entry
+
+    def _write_disk(self, key, created_at, response):
+        if not self.disk_dir:
+            return
+        os.makedirs(self.disk_dir, exist_ok=True)
+
+        # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yazıp taşıyoruz
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'created_at': created_at, 'response': response},
+                      f, ensure_ascii=False)
+        os.replace(tmp_path, self._disk_path(key))
+        self._evict_disk()
+
+    def _evict_disk(self):
+        entries = []
+        for name in os.listdir(self.disk_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.disk_dir, name)
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+
+        entries.sort()
+        cutoff = time.time() - self.ttl
+        overflow = len(entries) - self.disk_max_entries
+        for i, (mtime, path) in enumerate(entries):
+            if i < overflow or mtime < cutoff:
+                self._remove(path)
+                self._count('evictions')
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+        if self.disk_dir and os.path.isdir(self.disk_dir):
+            for name in os.listdir(self.disk_dir):
+                if name.endswith('.json'):
+                    self._remove(os.path.join(self.disk_dir, name))
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['memory_hits'] + stats['disk_hits']) / lookups, 4) if lookups else 0.0
+        stats['enabled'] = self.enabled
+        return stats
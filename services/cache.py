@@ -0,0 +1,263 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from functools import wraps
+from urllib.parse import urlencode
+from flask import request, current_app, make_response, Response
+from sqlalchemy import event
+from werkzeug.http import unquote_etag
+from services.conditional import is_not_modified
+
+
+class MemoryBackend:
+    """Process-local LRU store with per-entry TTL"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._counters = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def get_counters(self, names):
+        with self._lock:
+            return [self._counters[name] for name in names]
+
+    def incr(self, name):
+        with self._lock:
+            self._counters[name] += 1
+            return self._counters[name]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class RedisBackend:
+    """Shared store on Redis (optional `redis` package) so all workers see invalidations"""
+
+    def __init__(self, url, prefix='planllama:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND='redis' requires the 'redis' package")
+        self._redis = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key):
+        value = self._redis.get(self.prefix + key)
+        return pickle.loads(value) if value is not None else None
+
+    def set(self, key, value, ttl):
+        self._redis.setex(self.prefix + key, int(ttl), pickle.dumps(value))
+
+    def get_counters(self, names):
+        values = self._redis.mget([self.prefix + 'gen:' + name for name in names])
+        return [int(value or 0) for value in values]
+
+    def incr(self, name):
+        return self._redis.incr(self.prefix + 'gen:' + name)
+
+    def clear(self):
+        for key in self._redis.scan_iter(self.prefix + 'resp:*'):
+            self._redis.delete(key)
+
+    def __len__(self):
+        return sum(1 for _ in self._redis.scan_iter(self.prefix + 'resp:*'))
+
+
+class ResponseCache:
+    """Response cache for GET endpoints with commit-driven invalidation.
+
+    Every table has a generation counter in the backend. Cache keys embed the
+    generations of the tables a view reads, so bumping a counter after a
+    commit makes all dependent entries unreachable (also across processes
+    when the backend is shared). Tables touched by a transaction are collected
+    from SQLAlchemy session events, including ORM bulk INSERT/UPDATE/DELETE.
+    """
+
+    def __init__(self, app=None, db=None):
+        self.enabled = True
+        self.ttl = 30
+        self.backend = None
+        self._stats = defaultdict(lambda: {'hits': 0, 'misses': 0, 'stores': 0})
+        self._invalidations = defaultdict(int)
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app, db):
+        self.enabled = app.config.get('RESPONSE_CACHE_ENABLED', self.enabled)
+        self.ttl = app.config.get('RESPONSE_CACHE_TTL', self.ttl)
+
+        if app.config.get('RESPONSE_CACHE_BACKEND', 'memory') == 'redis':
+            self.backend = RedisBackend(app.config['RESPONSE_CACHE_REDIS_URL'])
+        else:
+            if self.enabled and app.config.get('WORKER_PROCESSES', 1) > 1:
+                # Sayaçlar süreç içinde kalır: başka worker'daki commit bu süreçteki girdileri geçersiz kılmaz
+                raise RuntimeError("RESPONSE_CACHE_BACKEND='memory' is per process; with several workers "
+                                   "use 'redis' or set RESPONSE_CACHE_ENABLED=False")
+            self.backend = MemoryBackend(app.config.get('RESPONSE_CACHE_MAX_ENTRIES', 1024))
+
+        # Aynı db için dinleyiciler bir kez kaydedilir
+        if not event.contains(db.session, 'after_commit', _after_commit):
+            event.listen(db.session, 'after_flush', _after_flush)
+            event.listen(db.session, 'do_orm_execute', _do_orm_execute)
+            event.listen(db.session, 'after_commit', _after_commit)
+            event.listen(db.session, 'after_rollback', _after_rollback)
+
+        app.extensions['response_cache'] = self
+
+    def invalidate(self, *tables):
+        """Make every cached response that depends on these tables stale"""
+        for table in tables:
+            self.backend.incr(table)
+            with self._lock:
+                self._invalidations[table] += 1
+
+    def generations(self, *tables):
+        """Current generation of each table; changes after every commit that writes it"""
+        return tuple(self.backend.get_counters(tables))
+
+    def clear(self):
+        self.backend.clear()
+
+    def _record(self, endpoint, name):
+        with self._lock:
+            self._stats[endpoint][name] += 1
+
+    def stats(self):
+        with self._lock:
+            endpoints = {}
+            for endpoint, counts in self._stats.items():
+                lookups = counts['hits'] + counts['misses']
+                endpoints[endpoint] = dict(counts, hit_rate=round(counts['hits'] / lookups, 4) if lookups else 0.0)
+            invalidations = dict(self._invalidations)
+
+        hits = sum(item['hits'] for item in endpoints.values())
+        lookups = hits + sum(item['misses'] for item in endpoints.values())
+        return {
+            'enabled': self.enabled,
+            'backend': type(self.backend).__name__,
+            'entries': len(self.backend),
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+            'endpoints': endpoints,
+            'invalidations': invalidations
+        }
+
+    def serve(self, tables, view, args, kwargs):
+        """Return the cached response for this request or call the view and store its result"""
+        if (not self.enabled or request.method != 'GET'
+                or request.args.get('stream', 'false').lower() == 'true'):
+            return view(*args, **kwargs)
+
+        generations = self.generations(*tables)
+        # Değerler kaçışlanır: '&' veya '=' içeren bir değer başka bir sorguyla aynı anahtarı üretemez
+        query = urlencode(sorted(request.args.items(multi=True)))
+        key = f"resp:{':'.join(map(str, generations))}:{request.path}?{query}"
+        endpoint = request.endpoint
+
+        entry = self.backend.get(key)
+        if entry is not None:
+            self._record(endpoint, 'hits')
+            return _entry_response(entry)
+
+        self._record(endpoint, 'misses')
+        response = make_response(view(*args, **kwargs))
+        if response.status_code == 200 and not response.is_streamed:
+            self.backend.set(key, {
+                'body': response.get_data(),
+                'mimetype': response.mimetype,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.last_modified
+            }, self.ttl)
+            self._record(endpoint, 'stores')
+        return response
+
+
+def _entry_response(entry):
+    """Rebuild a stored response, answering 304 when the client's validators match"""
+    etag, weak = unquote_etag(entry['etag']) if entry['etag'] else (None, False)
+    if etag and is_not_modified(etag, entry['last_modified']):
+        response = Response(status=304)
+    else:
+        response = Response(entry['body'], mimetype=entry['mimetype'])
+    if etag:
+        response.set_etag(etag, weak=weak)
+    if entry['last_modified'] is not None:
+        response.last_modified = entry['last_modified']
+    return response
+
+
+def cached(*tables):
+    """Cache a GET view; `tables` are the tables whose writes invalidate it."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cache = current_app.extensions.get('response_cache')
+            if cache is None:
+                return view(*args, **kwargs)
+            return cache.serve(tables, view, args, kwargs)
+        return wrapper
+    return decorator
+
+
+# --- SQLAlchemy session olayları: commit edilen tabloları topla ---
+
+def _touched(session):
+    return session.info.setdefault('response_cache_tables', set())
+
+
+def _after_flush(session, flush_context):
+    touched = _touched(session)
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(type(obj), '__tablename__', None)
+        if table:
+            touched.add(table)
+
+
+def _do_orm_execute(orm_execute_state):
+    # session.execute(update(Model)) / insert(Model) / delete(Model) flush'ta görünmez
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            _touched(orm_execute_state.session).add(mapper.persist_selectable.name)
+
+
+def _after_commit(session):
+    tables = session.info.pop('response_cache_tables', None)
+    if not tables:
+        return
+    try:
+        cache = current_app.extensions.get('response_cache')
+    except RuntimeError:
+        # app context dışında commit (ör. script); önbellek yok
+        return
+    if cache is not None:
+        cache.invalidate(*sorted(tables))
+
+
+def _after_rollback(session):
+    session.info.pop('response_cache_tables', None)
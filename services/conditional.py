@@ -0,0 +1,84 @@
+import hashlib
+from datetime import datetime, timezone
+from flask import request, make_response
+from sqlalchemy import func, select
+
+
+def _as_utc(value):
+    # updated_at sütunları naive UTC (datetime.utcnow) olarak saklanıyor
+    if value is None:
+        return None
+    return value.replace(tzinfo=timezone.utc, microsecond=0)
+
+
+def collection_validators(query, model, *related_models):
+    """Validators for a filtered collection from a single aggregate query.
+
+    The version combines max(updated_at) and count(*) of the filtered rows
+    (so deletions change it too) plus max(updated_at) of related tables whose
+    data is embedded in the representation (e.g. assignee/project names).
+
+    Returns:
+        (version tuple, last_modified datetime or None)
+    """
+    pk = model.__mapper__.primary_key[0]
+    columns = [func.max(model.updated_at), func.count(pk)]
+    columns += [select(func.max(related.updated_at)).scalar_subquery() for related in related_models]
+
+    row = query.with_entities(*columns).order_by(None).one()
+    timestamps = [row[0]] + list(row[2:])
+    return tuple(row), max((t for t in timestamps if t is not None), default=None)
+
+
+def row_validators(query):
+    """Validators for a single resource from a one-row query of timestamps/counts.
+
+    Returns:
+        (version tuple, last_modified) or None when the row does not exist
+    """
+    row = query.first()
+    if row is None:
+        return None
+    timestamps = [value for value in row if isinstance(value, datetime)]
+    return tuple(row), max(timestamps, default=None)
+
+
+def make_etag(version):
+    """Weak ETag over the data version and the full request path (query args change the body)"""
+    raw = f"{request.full_path}|{'|'.join(str(part) for part in version)}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def is_not_modified(etag, last_modified):
+    """True when the request's validators match; If-None-Match takes precedence (RFC 9110)"""
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def conditional(validators, build):
+    """Answer with 304 when the client's validators still match, else build the response.
+
+    Only successful (200) responses get ETag/Last-Modified headers.
+
+    Args:
+        validators: (version, last_modified) from collection/resource_validators
+        build: zero-argument callable returning the full response
+    """
+    version, last_modified = validators
+    etag = make_etag(version)
+    last_modified = _as_utc(last_modified)
+
+    if is_not_modified(etag, last_modified):
+        response = make_response('', 304)
+    else:
+        response = make_response(build())
+        if response.status_code != 200:
+            return response
+
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return response
@@ -0,0 +1,99 @@
+from collections import defaultdict
+from sqlalchemy import func, case, update
+from models import Project, Task
+from extensions import db
+
+
+def _contribution(status, estimated_hours):
+    """(tasks, completed, remaining_hours) a single task adds to its project"""
+    if status == 'Completed':
+        return 1, 1, 0
+    return 1, 0, estimated_hours or 0
+
+
+def apply_task_change(old=None, new=None):
+    """Update project task counters for one task change with atomic SQL updates.
+
+    Args:
+        old: TaskState before the change, None on create
+        new: TaskState after the change, None on delete
+    """
+    apply_task_changes([(old, new)])
+
+
+def apply_task_changes(changes):
+    """Batch version of apply_task_change: one UPDATE per affected project."""
+    deltas = defaultdict(lambda: [0, 0, 0])
+
+    for old, new in changes:
+        for state, sign in ((old, -1), (new, 1)):
+            if state is None or not state.project_id:
+                continue
+            for i, value in enumerate(_contribution(state.status, state.estimated_hours)):
+                deltas[state.project_id][i] += sign * value
+
+    for project_id, (tasks, completed, remaining) in deltas.items():
+        if not (tasks or completed or remaining):
+            continue
+        db.session.execute(
+            update(Project)
+            .where(Project.project_id == project_id)
+            .values(
+                tasks_count=Project.tasks_count + tasks,
+                completed_tasks_count=Project.completed_tasks_count + completed,
+                remaining_hours=Project.remaining_hours + remaining
+            )
+            .execution_options(synchronize_session='evaluate')
+        )
+
+
+def reconcile_project_counters():
+    """Recompute all project counters from the tasks table.
+
+    Reads current counters and the grouped task aggregates in one query and
+    writes back only the projects that drifted. Does not commit.
+
+    Returns:
+        list of {'project_id', 'before', 'after'} dicts for drifted projects
+    """
+    completed = Task.status == 'Completed'
+    aggregates = (
+        db.session.query(
+            Task.project_id.label('project_id'),
+            func.count(Task.task_id).label('tasks_count'),
+            func.sum(case((completed, 1), else_=0)).label('completed_tasks_count'),
+            func.sum(case((completed, 0), else_=func.coalesce(Task.estimated_hours, 0))).label('remaining_hours')
+        )
+        .group_by(Task.project_id)
+        .subquery()
+    )
+
+    rows = (
+        db.session.query(
+            Project.project_id,
+            Project.tasks_count,
+            Project.completed_tasks_count,
+            Project.remaining_hours,
+            func.coalesce(aggregates.c.tasks_count, 0),
+            func.coalesce(aggregates.c.completed_tasks_count, 0),
+            func.coalesce(aggregates.c.remaining_hours, 0)
+        )
+        .outerjoin(aggregates, aggregates.c.project_id == Project.project_id)
+        .all()
+    )
+
+    drift = []
+    for project_id, *values in rows:
+        before, after = tuple(values[:3]), tuple(values[3:])
+        if before != after:
+            drift.append({'project_id': project_id, 'before': before, 'after': after})
+
+    if drift:
+        db.session.execute(update(Project), [{
+            'project_id': item['project_id'],
+            'tasks_count': item['after'][0],
+            'completed_tasks_count': item['after'][1],
+            'remaining_hours': item['after'][2]
+        } for item in drift])
+
+    return drift
@@ -0,0 +1,84 @@
+from functools import partial
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+JOURNAL_MODES = {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'}
+SYNCHRONOUS_MODES = {'OFF', 'NORMAL', 'FULL', 'EXTRA'}
+
+
+def engine_options(config):
+    """SQLALCHEMY_ENGINE_OPTIONS for the configured database URL.
+
+    Server databases (PostgreSQL) get the DB_POOL_* settings and, on
+    PostgreSQL, a server-side statement_timeout. SQLite is tuned with PRAGMAs
+    on connect instead (see init_engine). Options set explicitly in
+    SQLALCHEMY_ENGINE_OPTIONS take precedence.
+    """
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    options = {}
+
+    if url.get_backend_name() != 'sqlite':
+        options.update(
+            pool_size=config['DB_POOL_SIZE'],
+            max_overflow=config['DB_MAX_OVERFLOW'],
+            pool_timeout=config['DB_POOL_TIMEOUT'],
+            pool_recycle=config['DB_POOL_RECYCLE'],
+            pool_pre_ping=config['DB_POOL_PRE_PING'],
+        )
+        timeout = config.get('DB_STATEMENT_TIMEOUT_MS')
+        if timeout and url.get_backend_name() == 'postgresql':
+            options['connect_args'] = {'options': f'-c statement_timeout={int(timeout)}'}
+
+    options.update(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    return options
+
+
+def sqlite_pragmas(config):
+    """(name, value) PRAGMAs run on every new SQLite connection; empty values are skipped"""
+    pragmas = []
+
+    journal_mode = config.get('SQLITE_JOURNAL_MODE')
+    if journal_mode:
+        journal_mode = journal_mode.upper()
+        if journal_mode not in JOURNAL_MODES:
+            raise ValueError(f'SQLITE_JOURNAL_MODE must be one of {sorted(JOURNAL_MODES)}')
+        pragmas.append(('journal_mode', journal_mode))
+
+    synchronous = config.get('SQLITE_SYNCHRONOUS')
+    if synchronous:
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f'SQLITE_SYNCHRONOUS must be one of {sorted(SYNCHRONOUS_MODES)}')
+        pragmas.append(('synchronous', synchronous))
+
+    # PRAGMA parametre almaz; sayılar int() ile doğrulanır
+    for name, key in (('busy_timeout', 'SQLITE_BUSY_TIMEOUT_MS'), ('mmap_size', 'SQLITE_MMAP_SIZE')):
+        value = config.get(key)
+        if value is not None:
+            pragmas.append((name, int(value)))
+    return pragmas
+
+
+def init_engine(app, db):
+    """Apply the SQLite PRAGMAs to every connection of the app's SQLite engines.
+
+    Call right after db.init_app(app), before the first connection is opened.
+    """
+    pragmas = sqlite_pragmas(app.config)
+    if not pragmas:
+        return
+    with app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        if engine.dialect.name == 'sqlite':
+            event.listen(engine, 'connect', partial(_apply_pragmas, pragmas))
+
+
+def _apply_pragmas(pragmas, dbapi_connection, connection_record):
+    # journal_mode=WAL dosyada kalıcıdır; bellek içi veritabanında 'memory' olarak kalır
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas:
+            cursor.execute(f'PRAGMA {name}={value}')
+    finally:
+        cursor.close()
@@ -0,0 +1,411 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from flask import current_app
+from sqlalchemy import event, inspect
+from services.sse import format_event, format_comment
+
+# tablo -> (olay tipi, birincil anahtar sütunu)
+ENTITIES = {
+    'tasks': ('task', 'task_id'),
+    'projects': ('project', 'project_id'),
+    'employees': ('employee', 'employee_id')
+}
+EVENT_TYPES = tuple(entity for entity, _ in ENTITIES.values())
+# Filtrelerde kullanılan, önceki değeri de bildirilen ilişki sütunları
+TRACKED_REFERENCES = ('project_id', 'assignee_id')
+# Daha büyük toplu yazımlar satır başına değil tek olay olarak bildirilir
+MAX_ROW_EVENTS = 1000
+
+
+def _key(event_id):
+    """Sort key of an event ID ('<ms>-<seq>', as in Redis streams)"""
+    first, _, second = event_id.partition('-')
+    return int(first), int(second)
+
+
+class EventBuffer:
+    """Ring buffer of the latest events shared by all subscribers of a process.
+
+    Publishing appends once and wakes the waiting streams; every stream keeps
+    only its position (number of events appended so far), so an idle
+    subscriber costs one waiting call and no per-client queue.
+    """
+
+    def __init__(self, size=1000):
+        self.size = size
+        self._events = deque(maxlen=size)
+        self._total = 0
+        self._condition = threading.Condition()
+
+    @property
+    def position(self):
+        return self._total
+
+    def __len__(self):
+        return len(self._events)
+
+    def append(self, event_id, entity, data):
+        with self._condition:
+            self._events.append((event_id, entity, data))
+            self._total += 1
+            self._condition.notify_all()
+
+    def _since(self, position):
+        missed = self._total - position
+        if missed > len(self._events):
+            return None
+        return list(self._events)[len(self._events) - missed:] if missed else []
+
+    def wait(self, position, timeout):
+        """Events appended after position, waiting up to timeout seconds for one.
+
+        Returns:
+            (events, new position); events is None when some were already
+            dropped from the buffer (the subscriber fell too far behind)
+        """
+        with self._condition:
+            if self._total == position:
+                self._condition.wait(timeout)
+            return self._since(position), self._total
+
+    def replay(self, last_event_id):
+        """(events after last_event_id, position), or None if that event is no longer buffered"""
+        with self._condition:
+            events = list(self._events)
+            for index in range(len(events) - 1, -1, -1):
+                if events[index][0] == last_event_id:
+                    return events[index + 1:], self._total
+            return None
+
+
+class MemoryEventBackend:
+    """Process-local feed: only clients connected to the same process see an event"""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        # Yeniden başlatmadan önceki ID'ler her zaman daha küçük kalır
+        self._epoch = int(time.time() * 1000)
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def start(self):
+        pass
+
+    def publish(self, events):
+        with self._lock:
+            for entity, data in events:
+                self._seq += 1
+                self.buffer.append(f'{self._epoch}-{self._seq}', entity, data)
+
+    def history(self, last_event_id, limit):
+        return None
+
+
+class RedisEventBackend:
+    """Feed shared by all workers on a Redis stream (optional `redis` package).
+
+    Every process runs one reader thread (XREAD BLOCK) that copies new stream
+    entries into its EventBuffer; replays older than the buffer are served
+    with XRANGE while the entries are still in the stream.
+    """
+
+    def __init__(self, url, buffer, stream='planllama:events', maxlen=10000):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("EVENTS_BACKEND='redis' requires the 'redis' package")
+        self._redis = redis.Redis.from_url(url, decode_responses=True)
+        self.buffer = buffer
+        self.stream = stream
+        self.maxlen = maxlen
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start this process's reader thread (lazily, so it runs in each forked worker)"""
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            # '$' yerine mevcut son ID: thread başlamadan yazılan olaylar kaçırılmaz
+            latest = self._redis.xrevrange(self.stream, count=1)
+            last_id = latest[0][0] if latest else '0-0'
+            threading.Thread(target=self._read, args=(last_id,), name='planllama-events', daemon=True).start()
+
+    def _read(self, last_id):
+        while True:
+            try:
+                for _, entries in self._redis.xread({self.stream: last_id}, block=5000) or []:
+                    for event_id, fields in entries:
+                        last_id = event_id
+                        self.buffer.append(event_id, fields['entity'], json.loads(fields['data']))
+            except Exception:  # bağlantı hatası: kısa bekleyip yeniden dene
+                time.sleep(1)
+
+    def publish(self, events):
+        self.start()
+        pipe = self._redis.pipeline(transaction=False)
+        for entity, data in events:
+            pipe.xadd(self.stream, {'entity': entity, 'data': json.dumps(data, default=str)},
+                      maxlen=self.maxlen, approximate=True)
+        pipe.execute()
+
+    def history(self, last_event_id, limit):
+        first = self._redis.xrange(self.stream, count=1)
+        if not first or _key(first[0][0]) > _key(last_event_id):
+            return None
+        entries = self._redis.xrange(self.stream, min=f'({last_event_id}', count=limit)
+        if len(entries) == limit:
+            return None
+        return [(event_id, fields['entity'], json.loads(fields['data'])) for event_id, fields in entries]
+
+
+def event_filter(types=None, project_ids=None, assignee_ids=None):
+    """Predicate for (entity, data); all given filters must match.
+
+    project_ids matches tasks in (or moved out of) those projects and the
+    projects themselves; assignee_ids matches tasks assigned to (or taken
+    from) those employees and the employees themselves. Bulk events (no
+    row IDs, only `count`) match every filter of their type.
+    """
+    def match(entity, data):
+        if types and entity not in types:
+            return False
+        if 'count' in data:
+            return True
+        if project_ids:
+            projects = {data.get('project_id'), data.get('previous', {}).get('project_id')}
+            if entity == 'employee' or not projects & project_ids:
+                return False
+        if assignee_ids:
+            if entity == 'employee':
+                assignees = {data.get('employee_id')}
+            else:
+                assignees = {data.get('assignee_id'), data.get('previous', {}).get('assignee_id')}
+            if entity == 'project' or not assignees & assignee_ids:
+                return False
+        return True
+    return match
+
+
+class ChangeFeed:
+    """Task/project/employee change events, published after commit.
+
+    Changes are collected from SQLAlchemy session events: ORM inserts,
+    updates (with the changed columns and previous project/assignee) and
+    deletes, plus session.execute(insert/update(Model), [rows]) by primary
+    key (statements over MAX_ROW_EVENTS rows become one event with a
+    `count`). Derived counter updates (project counters, employee load) are not
+    separate events; the task event names the project and assignee.
+    Handlers that write with other Core statements call record_change().
+    Events are hints to refetch, not full rows.
+    """
+
+    def __init__(self, app=None, db=None):
+        self.enabled = True
+        self.heartbeat = 15
+        self.max_stream_seconds = 50
+        self.retry_ms = 3000
+        self.buffer = EventBuffer()
+        self.backend = None
+        self._stats = {'published': 0, 'clients': 0}
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app, db):
+        self.enabled = app.config.get('EVENTS_ENABLED', self.enabled)
+        self.heartbeat = app.config.get('EVENTS_HEARTBEAT_SECONDS', self.heartbeat)
+        self.max_stream_seconds = app.config.get('EVENTS_MAX_STREAM_SECONDS', self.max_stream_seconds)
+        self.retry_ms = app.config.get('EVENTS_RETRY_MS', self.retry_ms)
+        self.buffer = EventBuffer(app.config.get('EVENTS_BUFFER_SIZE', 1000))
+        self._stats = {'published': 0, 'clients': 0}
+
+        if app.config.get('EVENTS_BACKEND', 'memory') == 'redis':
+            self.backend = RedisEventBackend(app.config['EVENTS_REDIS_URL'], self.buffer)
+        else:
+            if self.enabled and app.config.get('WORKER_PROCESSES', 1) > 1:
+                # Başka worker'da yayınlanan olay bu süreçteki istemcilere hiç ulaşmaz (reset de gelmez)
+                raise RuntimeError("EVENTS_BACKEND='memory' reaches only the clients of one process; "
+                                   "with several workers use 'redis' or set EVENTS_ENABLED=False")
+            self.backend = MemoryEventBackend(self.buffer)
+
+        # Aynı db için dinleyiciler bir kez kaydedilir
+        if not event.contains(db.session, 'after_commit', _after_commit):
+            event.listen(db.session, 'after_flush', _after_flush)
+            event.listen(db.session, 'do_orm_execute', _do_orm_execute)
+            event.listen(db.session, 'after_commit', _after_commit)
+            event.listen(db.session, 'after_rollback', _after_rollback)
+
+        app.extensions['events'] = self
+
+    def publish(self, events):
+        if not self.enabled or not events:
+            return
+        self.backend.publish(events)
+        with self._lock:
+            self._stats['published'] += len(events)
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, enabled=self.enabled, backend=type(self.backend).__name__,
+                        buffered=len(self.buffer), position=self.buffer.position)
+
+    def stream(self, match, last_event_id=None):
+        """SSE messages for one client until EVENTS_MAX_STREAM_SECONDS pass.
+
+        The stream then ends; EventSource reconnects with Last-Event-ID and
+        resumes without gaps. A `reset` event means events after the client's
+        ID are gone and it should refetch its lists.
+        """
+        deadline = time.monotonic() + self.max_stream_seconds
+        position = self.buffer.position
+        last_key = None
+        skipped_id = None
+
+        self.backend.start()
+        with self._lock:
+            self._stats['clients'] += 1
+        try:
+            yield format_comment('connected', retry=self.retry_ms)
+
+            if last_event_id:
+                try:
+                    _key(last_event_id)
+                    replay = self.buffer.replay(last_event_id)
+                    if replay is not None:
+                        events, position = replay
+                    else:
+                        events = self.backend.history(last_event_id, self.buffer.size)
+                except ValueError:
+                    events = None
+                if events is None:
+                    yield format_event({'reason': 'Events after Last-Event-ID are no longer available'},
+                                       event='reset')
+                    events = []
+                for event_id, entity, data in events:
+                    last_key = _key(event_id)
+                    if match(entity, data):
+                        yield format_event(data, event=entity, event_id=event_id)
+                    else:
+                        skipped_id = event_id
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                events, position = self.buffer.wait(position, min(self.heartbeat, remaining))
+                if events is None:
+                    yield format_event({'reason': 'Client fell behind the event buffer'}, event='reset')
+                    continue
+                if not events:
+                    # Filtrelenen olayların ID'si de ilerletilir: yeniden bağlanınca tekrar taranmaz
+                    yield format_comment('keep-alive', event_id=skipped_id)
+                    skipped_id = None
+                    continue
+                for event_id, entity, data in events:
+                    if last_key is not None and _key(event_id) <= last_key:
+                        continue  # replay ile zaten gönderildi
+                    if match(entity, data):
+                        skipped_id = None
+                        yield format_event(data, event=entity, event_id=event_id)
+                    else:
+                        skipped_id = event_id
+        finally:
+            with self._lock:
+                self._stats['clients'] -= 1
+
+
+def record_change(session, entity, action, **fields):
+    """Queue a change event for the next commit of session (writes the hooks cannot see)"""
+    _pending(session).append((entity, dict(fields, action=action)))
+
+
+# --- SQLAlchemy session olayları: commit edilen satır değişikliklerini topla ---
+
+def _pending(session):
+    return session.info.setdefault('change_events', [])
+
+
+def _object_change(obj, table, action):
+    entity, key = ENTITIES[table]
+    state = inspect(obj)
+    data = {'action': action, key: getattr(obj, key)}
+    for name in TRACKED_REFERENCES:
+        if name in state.mapper.column_attrs and name != key:
+            data[name] = getattr(obj, name)
+
+    if action == 'updated':
+        changed, previous = [], {}
+        for attr in state.mapper.column_attrs:
+            history = state.attrs[attr.key].history
+            if history.has_changes():
+                changed.append(attr.key)
+                if attr.key in TRACKED_REFERENCES and history.deleted:
+                    previous[attr.key] = history.deleted[0]
+        if not changed:
+            return None
+        data['changed'] = changed
+        if previous:
+            data['previous'] = previous
+    return entity, data
+
+
+def _after_flush(session, flush_context):
+    pending = _pending(session)
+    for action, objects in (('created', session.new), ('updated', session.dirty), ('deleted', session.deleted)):
+        for obj in objects:
+            table = getattr(type(obj), '__tablename__', None)
+            if table in ENTITIES:
+                change = _object_change(obj, table, action)
+                if change is not None:
+                    pending.append(change)
+
+
+def _do_orm_execute(orm_execute_state):
+    # session.execute(insert/update(Model), [satırlar]) flush'ta görünmez; WHERE'li toplu
+    # güncellemeler (sayaçlar, iş yükü) görev olaylarından türetilir
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update):
+        return
+    mapper = orm_execute_state.bind_mapper
+    table = mapper.persist_selectable.name if mapper is not None else None
+    rows = orm_execute_state.parameters
+    if table not in ENTITIES or not isinstance(rows, list):
+        return
+
+    entity, key = ENTITIES[table]
+    action = 'created' if orm_execute_state.is_insert else 'updated'
+    pending = _pending(orm_execute_state.session)
+    if len(rows) > MAX_ROW_EVENTS:
+        pending.append((entity, {'action': action, 'count': len(rows)}))
+        return
+    for row in rows:
+        if key not in row:
+            continue
+        data = {'action': action, key: row[key]}
+        for name in TRACKED_REFERENCES:
+            if name in row and name != key:
+                data[name] = row[name]
+        if action == 'updated':
+            data['changed'] = sorted(name for name in row if name != key)
+        pending.append((entity, data))
+
+
+def _after_commit(session):
+    events = session.info.pop('change_events', None)
+    if not events:
+        return
+    try:
+        feed = current_app.extensions.get('events')
+    except RuntimeError:
+        # app context dışında commit (ör. script); yayın yok
+        return
+    if feed is not None:
+        feed.publish(events)
+
+
+def _after_rollback(session):
+    session.info.pop('change_events', None)
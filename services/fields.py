@@ -0,0 +1,34 @@
+from flask import request, jsonify
+
+
+def sparse_fields(model, *extra):
+    """Parse the `fields=a,b` query parameter for a model (sparse fieldset).
+
+    Args:
+        model: model class with FIELDS (see SparseFieldsMixin)
+        extra: additional keys the endpoint can output (e.g. enriched names)
+
+    Returns:
+        (fields, error) tuple: fields is a frozenset, or None when the
+        parameter is absent; error is a (response, 400) tuple for unknown keys
+    """
+    raw = request.args.get('fields')
+    if raw is None:
+        return None, None
+
+    fields = frozenset(name.strip() for name in raw.split(',') if name.strip())
+    allowed = set(model.FIELDS) | set(extra)
+    unknown = sorted(fields - allowed)
+    if not fields or unknown:
+        return None, (jsonify({
+            'error': f"Unknown field(s): {', '.join(unknown)}" if unknown else 'fields must not be empty',
+            'allowed': sorted(allowed)
+        }), 400)
+    return fields, None
+
+
+def with_fields(query, model, fields):
+    """Restrict the query's SELECT to the requested fields (no-op for the full representation)"""
+    if fields is None:
+        return query
+    return query.options(model.load_fields(fields))
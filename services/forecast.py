@@ -0,0 +1,100 @@
+from datetime import date, timedelta
+import numpy as np
+from sqlalchemy import select, func, cast, String
+from models import Employee, Task
+from extensions import db
+
+MAX_WEEKS = 52
+
+
+def week_start(day):
+    """Monday of the week containing `day`"""
+    return day - timedelta(days=day.weekday())
+
+
+def spread_hours(rows, hours, due_dates, start, weeks, n_employees):
+    """Spread each task's hours evenly over the weeks from `start` to its due week.
+
+    Overdue tasks (and tasks due in the first week) land entirely in week 0;
+    tasks due after the horizon only contribute the share that falls inside it.
+    Every task adds +h/span at its first week and -h/span after its last one,
+    so a cumulative sum over weeks gives the load without a per-task loop.
+
+    Args:
+        rows: employee row of each task (int array)
+        hours: estimated hours of each task
+        due_dates: due date of each task (datetime64[D] array)
+        start: Monday of week 0
+
+    Returns:
+        float array (n_employees x weeks) of hours per week
+    """
+    due_week = np.maximum((due_dates - np.datetime64(start, 'D')).astype(np.int64) // 7, 0)
+    per_week = hours / (due_week + 1)
+    end = np.minimum(due_week, weeks - 1) + 1
+
+    # Fark dizisi: (çalışan, hafta) hücrelerine tek bincount ile ekle
+    width = weeks + 1
+    diff = np.bincount(np.concatenate([rows * width, rows * width + end]),
+                       weights=np.concatenate([per_week, -per_week]),
+                       minlength=n_employees * width).reshape(n_employees, width)
+    return np.cumsum(diff, axis=1, dtype=np.float64)[:, :weeks]
+
+
+def capacity_forecast(weeks=12, start=None, role=None):
+    """Per-employee and team load for the next `weeks` weeks.
+
+    Open (not Completed) tasks are read in one query; their estimated_hours
+    are spread up to their due_date with spread_hours.
+
+    Returns:
+        response body dict
+    """
+    start = week_start(start or date.today())
+    connection = db.session.connection()
+
+    employees = select(Employee.employee_id, Employee.name, Employee.capacity_hours_per_week)
+    if role:
+        employees = employees.where(Employee.user_role == role)
+    employees = connection.execute(employees.order_by(Employee.employee_id)).all()
+    row_of = {employee_id: i for i, (employee_id, _, _) in enumerate(employees)}
+
+    # due_date metin olarak okunur (YYYY-MM-DD); date nesnesi yerine NumPy C tarafında ayrıştırır
+    tasks = connection.execute(
+        select(Task.assignee_id, func.coalesce(Task.estimated_hours, 0), cast(Task.due_date, String))
+        .where(Task.assignee_id.isnot(None), Task.status != 'Completed')
+    ).all()
+    assignees, hours, due_dates = zip(*tasks) if tasks else ([],) * 3
+    rows = np.fromiter((row_of.get(assignee_id, -1) for assignee_id in assignees), dtype=np.intp, count=len(tasks))
+    known = rows >= 0
+
+    load = spread_hours(rows[known], np.array(hours, dtype=np.float64)[known],
+                        np.array(due_dates, dtype='datetime64[D]')[known], start, weeks, len(employees))
+    capacity = np.array([hours or 0 for _, _, hours in employees], dtype=np.float64)
+    utilization = np.divide(load * 100, capacity[:, None], out=np.zeros_like(load), where=capacity[:, None] > 0)
+    overloaded = load > capacity[:, None]
+
+    team_capacity = capacity.sum()
+    team_load = load.sum(axis=0)
+
+    return {
+        'start': start,
+        'weeks': [start + timedelta(weeks=i) for i in range(weeks)],
+        'employees': [{
+            'employee_id': employee_id,
+            'name': name,
+            'capacity_hours_per_week': capacity_hours or 0,
+            'load_hours': week_hours,
+            'utilization_percentage': week_utilization,
+            'overloaded_weeks': overloaded_weeks
+        } for (employee_id, name, capacity_hours), week_hours, week_utilization, overloaded_weeks in zip(
+            employees, load.round(2).tolist(), utilization.round(2).tolist(), overloaded.sum(axis=1).tolist())],
+        'team': {
+            'employees': len(employees),
+            'capacity_hours_per_week': float(team_capacity),
+            'load_hours': team_load.round(2).tolist(),
+            'utilization_percentage': (team_load * 100 / team_capacity if team_capacity else
+                                       np.zeros(weeks)).round(2).tolist(),
+            'overloaded_employees': overloaded.sum(axis=0).tolist()
+        }
+    }
@@ -0,0 +1,391 @@
+import os
+import json
+import time
+import requests
+from datetime import datetime, date, timedelta
+from sqlalchemy import insert, delete
+from sqlalchemy.exc import IntegrityError
+from models import Project, Task, Employee, TaskState
+from extensions import db, ai_cache, ids
+from services.counters import apply_task_change
+from services.events import record_change
+from services.workload import load_deltas, apply_load_deltas
+from services.query_guard import budget_items
+
+AI_REQUEST_TIMEOUT = 120
+# Akış uç noktası AI_API_URL'e eklenir; servis NDJSON yerine tek JSON dönerse o da okunur
+AI_STREAM_PATH = '/api/generate/stream'
+
+
+class GenerationError(Exception):
+    """Raised when AI task generation cannot be completed"""
+
+    def __init__(self, message, details=None, status_code=500):
+        super().__init__(message)
+        self.message = message
+        self.details = details
+        self.status_code = status_code
+
+    def to_dict(self):
+        result = {'error': self.message}
+        if self.details is not None:
+            result['details'] = self.details
+        return result
+
+
+def prepare_generation(data):
+    """Validate a generate-tasks request and allocate a project ID.
+
+    Returns:
+        project_id for the new project
+
+    Raises:
+        GenerationError (400) for invalid input
+    """
+    if data is None:
+        raise GenerationError('Request body must be JSON', status_code=400)
+
+    required_fields = ['project_title', 'metadata', 'team']
+    for field in required_fields:
+        if field not in data:
+            raise GenerationError(f'Missing required field: {field}', status_code=400)
+
+    if Project.query.filter_by(name=data['project_title']).first():
+        raise GenerationError('Project name already exists.', status_code=400)
+
+    return ids.next_id('project')
+
+
+def build_payload(data):
+    """Payload sent to the AI service"""
+    return {
+        "json_input": data,
+        "project_key": data.get("project_key", "INSIGHT"),
+        "use_model": True
+    }
+
+
+def request_tasks_from_ai(data, use_cache=True):
+    """Send the project brief to the AI service and return its Jira tasks.
+
+    Identical payloads are answered from ai_cache unless use_cache is False;
+    a bypassed request still refreshes the cache.
+    """
+    payload = build_payload(data)
+
+    if use_cache:
+        cached = ai_cache.get(payload)
+        if cached is not None:
+            return extract_tasks(cached)
+    else:
+        ai_cache.record_bypass()
+
+    ai_api_url = ai_url("/api/generate")
+
+    try:
+        # --- LLM API’ye istek at ---
+        response = requests.post(ai_api_url, json=payload, timeout=AI_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        result = response.json()
+
+        # --- LOGLAMA NOKTASI 1: LLM API'den Gelen Ham Cevap ---
+        print("--- LLM API Ham Cevabı ---")
+        print(json.dumps(result, indent=2))
+        print("--------------------------")
+
+    except requests.exceptions.RequestException as e:
+        raise GenerationError('Failed to reach AI API', details=str(e))
+
+    tasks = extract_tasks(result)
+    # Sadece başarılı cevaplar cache'lenir
+    ai_cache.set(payload, result)
+    return tasks
+
+
+def ai_url(path):
+    """AI service URL for path; raises GenerationError when AI_API_URL is not set"""
+    # Ngrok URL veya sabit backend adresi
+    ai_api_url = os.getenv("AI_API_URL")
+    if not ai_api_url:
+        raise GenerationError('AI_API_URL is not configured')
+    return ai_api_url + path
+
+
+def stream_tasks_from_ai(data, use_cache=True):
+    """Yield the AI service's Jira tasks one by one as they are generated.
+
+    Reads NDJSON from AI_API_URL + AI_STREAM_PATH, one object per line:
+        {"type": "task", "task": {...}}     one Jira issue
+        {"type": "error", "message": ...}   generation failed
+        {"type": "done", "count": n}        end of stream
+    A plain JSON answer (service without streaming) is read in full instead.
+    Cached payloads are replayed from ai_cache; the completed task list is
+    cached like a regular response, so both endpoints share entries.
+    """
+    payload = build_payload(data)
+
+    if use_cache:
+        cached = ai_cache.get(payload)
+        if cached is not None:
+            yield from extract_tasks(cached)
+            return
+    else:
+        ai_cache.record_bypass()
+
+    tasks = []
+    try:
+        with requests.post(ai_url(os.getenv("AI_STREAM_PATH", AI_STREAM_PATH)), json=payload,
+                           stream=True, timeout=AI_REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+
+            if 'ndjson' not in response.headers.get('Content-Type', ''):
+                tasks = extract_tasks(response.json())
+                yield from tasks
+            else:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    message = json.loads(line)
+                    kind = message.get('type')
+                    if kind == 'task':
+                        tasks.append(message['task'])
+                        yield message['task']
+                    elif kind == 'error':
+                        raise GenerationError('Model processing failed', details=message)
+                    elif kind == 'done':
+                        break
+                else:
+                    raise GenerationError('AI stream ended before completion')
+    except requests.exceptions.RequestException as e:
+        raise GenerationError('Failed to reach AI API', details=str(e))
+    except (ValueError, KeyError) as e:
+        raise GenerationError('Invalid message in AI stream', details=str(e))
+
+    if not tasks:
+        raise GenerationError('No tasks found in response.')
+    # Sadece tamamlanan akışlar cache'lenir
+    ai_cache.set(payload, {"success": True, "jira_json": {"tasks": tasks}})
+
+
+def extract_tasks(result):
+    """Pull the task list out of an AI service response."""
+    if not result.get("success", True):
+        raise GenerationError('Model processing failed', details=result)
+
+    jira_json = result.get("jira_json")
+    if not jira_json or "tasks" not in jira_json:
+        raise GenerationError('No tasks found in response.')
+
+    return jira_json["tasks"]
+
+
+def parse_estimate(estimate_str):
+    """Convert a Jira estimate such as "4d" to hours"""
+    estimated_hours = 0
+    if "d" in estimate_str:
+        try:
+            estimated_hours = int(estimate_str.replace("d", "")) * 8
+        except ValueError:
+            estimated_hours = 0
+    return estimated_hours
+
+
+def task_row(project_id, task_id, t, now, index=0):
+    """Turn one AI service task into a row for tasks"""
+    f = t["fields"]
+
+    # Assignee bilgisi
+    assignee_id = f.get("assignee", {}).get("accountId")
+
+    # --- LOGLAMA NOKTASI 2: Her Görev İçin Atanan Kişi Verisi ---
+    print(f"Task {index+1} Başlık: {f.get('summary')}")
+    print(f"Task {index+1} 'assignee' alanı (tam): {f.get('assignee')}")
+    print(f"Task {index+1} Çıkarılan assignee_id: {assignee_id}")
+    print("--------------------------")
+
+    return {
+        'task_id': task_id,
+        'title': f.get("summary"),
+        'description': f.get("description", {}).get("content", [{}])[0].get("content", [{}])[0].get("text", ""),
+        # Estimated time (örnek: "4d" → saat cinsinden)
+        'estimated_hours': parse_estimate(f.get("timetracking", {}).get("originalEstimate", "0d")),
+        'priority': f.get("priority", {}).get("name", "Medium").lower(),
+        'status': "Pending",
+        'assignee_id': assignee_id,
+        'project_id': project_id,
+        'due_date': datetime.strptime(f.get("duedate"), "%Y-%m-%d").date() if f.get("duedate") else None,
+        'created_at': now,
+        'updated_at': now
+    }
+
+
+def build_task_rows(project_id, tasks_from_llm):
+    """Turn AI service tasks into rows for a bulk INSERT into tasks."""
+    task_ids = ids.allocate('task', len(tasks_from_llm))
+    now = datetime.utcnow()
+    return [task_row(project_id, task_ids[i], t, now, i) for i, t in enumerate(tasks_from_llm)]
+
+
+def add_assignee_load(task_rows):
+    """Add the new tasks' hours to their assignees' workload.
+
+    Fetches all referenced employees with one IN query and issues one atomic
+    UPDATE per employee with the aggregated delta.
+    """
+    deltas = load_deltas([(None, TaskState(row['project_id'], row['assignee_id'], row['status'],
+                                           row['estimated_hours'])) for row in task_rows])
+
+    existing = {row[0] for row in db.session.query(Employee.employee_id)
+                .filter(Employee.employee_id.in_(list(deltas)))}
+
+    for employee_id in set(deltas) - existing:
+        # --- EK LOGLAMA: Atanan ID Veritabanında Bulunamadı ---
+        print(f"UYARI: {employee_id} ID'li çalışan veritabanında bulunamadı!")
+        print("--------------------------")
+
+    apply_load_deltas({employee_id: delta for employee_id, delta in deltas.items() if employee_id in existing})
+
+
+def build_project(data, project_id, task_rows=()):
+    """New generated project with counters for task_rows"""
+    # --- Proje oluştur ---
+    due_date_obj = date.today() + timedelta(weeks=3)
+    return Project(
+        project_id=project_id,
+        name=data['project_title'],
+        description=data.get('metadata', {}).get('description', data.get('project_description', 'No description provided')),
+        status='Planning',
+        budget=data.get('budget', 0),
+        priority='high',
+        due_date=due_date_obj,
+        # Proje sayaçları: yeni projenin tüm görevleri 'Pending' durumunda
+        tasks_count=len(task_rows),
+        completed_tasks_count=0,
+        remaining_hours=sum(row['estimated_hours'] or 0 for row in task_rows)
+    )
+
+
+def create_project_with_tasks(data, project_id, tasks_from_llm):
+    """Create the project and its LLM-generated tasks, then commit.
+
+    Task IDs are allocated up front, assignees are resolved in one query and
+    tasks are written with a single bulk INSERT.
+
+    Returns:
+        response body for a successful generation
+    """
+    task_rows = build_task_rows(project_id, tasks_from_llm)
+    # generate-tasks route'unun sorgu bütçesi görev sayısıyla ölçeklenir
+    budget_items(len(task_rows))
+
+    project = build_project(data, project_id, task_rows)
+    db.session.add(project)
+
+    try:
+        # Görevlerin foreign key'i için proje önce yazılmalı
+        db.session.flush()
+
+        # --- Görevleri veritabanına kaydet ---
+        if task_rows:
+            db.session.execute(insert(Task), task_rows)
+
+        # Çalışanların yükünü güncelle
+        add_assignee_load(task_rows)
+
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        raise GenerationError('Failed to save generated project', details=str(e.orig), status_code=400)
+
+    return {
+        "message": "Project and tasks generated successfully from LLM response.",
+        "project_id": project_id,
+        "project": project.to_dict(),
+        "generated_tasks": [Task(**row).to_dict() for row in task_rows]
+    }
+
+
+def generate_project(data, project_id, use_cache=True):
+    """Full generation pipeline: AI request followed by DB ingestion."""
+    tasks_from_llm = request_tasks_from_ai(data, use_cache=use_cache)
+    return create_project_with_tasks(data, project_id, tasks_from_llm)
+
+
+def _discard_streamed_project(project_id, task_rows):
+    """Remove a partially streamed project and take its tasks' hours off the assignees"""
+    db.session.rollback()
+    # Core DELETE'ler oturum olaylarında görünmez; değişiklik akışına elle eklenir
+    for row in task_rows:
+        record_change(db.session, 'task', 'deleted', task_id=row['task_id'], project_id=project_id,
+                      assignee_id=row['assignee_id'])
+    record_change(db.session, 'project', 'deleted', project_id=project_id)
+    deltas = load_deltas([(TaskState(row['project_id'], row['assignee_id'], row['status'],
+                                     row['estimated_hours']), None) for row in task_rows])
+    apply_load_deltas(deltas)
+    db.session.execute(delete(Task).where(Task.project_id == project_id))
+    db.session.execute(delete(Project).where(Project.project_id == project_id))
+    db.session.commit()
+
+
+def stream_project_generation(data, project_id, use_cache=True):
+    """Create the project, then insert and commit each AI task as soon as it arrives.
+
+    Yields (event, payload) pairs for the client:
+        ('project', project dict)                  project row committed (no tasks yet)
+        ('task', {'index', 'elapsed_ms', 'task'})  one task committed
+        ('done', {...})                            all tasks stored
+        ('error', GenerationError.to_dict())       generation failed
+    As with the blocking endpoint the result is all or nothing: when the AI
+    service fails or the client disconnects, the tasks committed so far and
+    the project are deleted again.
+    """
+    started = time.perf_counter()
+
+    def elapsed_ms():
+        return round((time.perf_counter() - started) * 1000, 1)
+
+    project = build_project(data, project_id)
+    db.session.add(project)
+    try:
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        error = GenerationError('Failed to save generated project', details=str(e.orig), status_code=400)
+        yield 'error', error.to_dict()
+        return
+    yield 'project', project.to_dict()
+
+    task_rows = []
+    finished = False
+    try:
+        for index, t in enumerate(stream_tasks_from_ai(data, use_cache=use_cache)):
+            row = task_row(project_id, ids.next_id('task'), t, datetime.utcnow(), index)
+            db.session.execute(insert(Task), [row])
+            task_rows.append(row)
+            apply_task_change(None, TaskState(project_id, row['assignee_id'], row['status'],
+                                              row['estimated_hours']))
+            add_assignee_load([row])
+            db.session.commit()
+            yield 'task', {'index': index, 'elapsed_ms': elapsed_ms(), 'task': Task(**row).to_dict()}
+
+        db.session.refresh(project)
+        finished = True
+        yield 'done', {
+            "message": "Project and tasks generated successfully from LLM response.",
+            "project_id": project_id,
+            "project": project.to_dict(),
+            "tasks": len(task_rows),
+            "elapsed_ms": elapsed_ms()
+        }
+    except GenerationError as e:
+        _discard_streamed_project(project_id, task_rows)
+        finished = True
+        yield 'error', e.to_dict()
+    except IntegrityError as e:
+        _discard_streamed_project(project_id, task_rows)
+        finished = True
+        yield 'error', GenerationError('Failed to save generated project', details=str(e.orig)).to_dict()
+    finally:
+        # İstemci bağlantısı koptu (GeneratorExit) veya beklenmeyen hata
+        if not finished:
+            _discard_streamed_project(project_id, task_rows)
@@ -0,0 +1,94 @@
+import os
+import threading
+from collections import deque
+from sqlalchemy import select, update, insert
+from sqlalchemy.exc import IntegrityError
+
+# name -> (prefix, table, primary key column)
+SEQUENCES = {
+    'task': ('t', 'tasks', 'task_id'),
+    'project': ('p', 'projects', 'project_id')
+}
+
+# Eski rastgele ID'ler (t100-t999, p100-p999) ile çakışmamak için
+DEFAULT_START = 1000
+
+
+class IdAllocator:
+    """Sequence-backed ID allocator for projects and tasks.
+
+    Each process reserves blocks of `block_size` numbers from the id_sequences
+    table in a short transaction of its own, then hands them out from memory,
+    so allocation is O(1) per ID regardless of table size. Reserved blocks are
+    dropped after fork so worker processes never share a block.
+    """
+
+    def __init__(self, app=None):
+        self.block_size = 50
+        self._blocks = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.block_size = app.config.get('ID_BLOCK_SIZE', self.block_size)
+        app.extensions['ids'] = self
+
+    def next_id(self, name):
+        """Return one new ID for the sequence, e.g. 't1042'"""
+        return self.allocate(name, 1)[0]
+
+    def allocate(self, name, count):
+        """Return `count` new IDs for the sequence"""
+        if name not in SEQUENCES:
+            raise KeyError(f'Unknown ID sequence: {name}')
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._blocks = {}
+                self._pid = os.getpid()
+
+            block = self._blocks.setdefault(name, deque())
+            while len(block) < count:
+                block.extend(self._reserve(name, max(self.block_size, count - len(block))))
+            return [block.popleft() for _ in range(count)]
+
+    def _reserve(self, name, size):
+        """Reserve `size` numbers in the database and return the unused IDs among them."""
+        # extensions.py bu modülü import ettiği için db/modeller burada yükleniyor
+        from extensions import db
+        from models import IdSequence
+
+        prefix, table_name, column_name = SEQUENCES[name]
+        column = db.metadata.tables[table_name].c[column_name]
+        table = IdSequence.__table__
+
+        # İstek oturumundan bağımsız, kısa bir transaction: satır kilidi hemen bırakılır
+        with db.engine.begin() as conn:
+            result = conn.execute(
+                update(table)
+                .where(table.c.name == name)
+                .values(next_value=table.c.next_value + size)
+            )
+            if result.rowcount:
+                end = conn.execute(select(table.c.next_value).where(table.c.name == name)).scalar_one()
+                start = end - size
+            else:
+                start = None
+
+        if start is None:
+            try:
+                with db.engine.begin() as conn:
+                    conn.execute(insert(table).values(name=name, next_value=DEFAULT_START + size))
+                start = DEFAULT_START
+            except IntegrityError:
+                # Başka bir process satırı aynı anda oluşturdu
+                return self._reserve(name, size)
+
+        candidates = [f'{prefix}{n}' for n in range(start, start + size)]
+
+        # Elle verilmiş eski ID'lerle çakışanları atla (blok başına tek sorgu)
+        with db.engine.connect() as conn:
+            taken = set(conn.execute(select(column).where(column.in_(candidates))).scalars())
+        return [candidate for candidate in candidates if candidate not in taken]
@@ -0,0 +1,143 @@
+import json
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from sqlalchemy import and_, delete, insert, or_, select, update
+
+
+class JobQueueFull(Exception):
+    """Raised when the background pool already has max_pending unfinished jobs"""
+
+
+class JobManager:
+    """Bounded background worker pool for long-running requests.
+
+    Jobs run inside an application context on a ThreadPoolExecutor of the
+    process that accepted them. Job state is stored in the generation_jobs
+    table, so any worker process can answer a status poll and finished
+    results survive restarts. A job still unfinished after retention_seconds
+    is reported as failed (its process stopped before finishing it).
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self.max_workers = 4
+        self.max_pending = 32
+        self.retention_seconds = 3600
+        self._executor = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.max_workers = app.config.get('JOB_WORKERS', self.max_workers)
+        self.max_pending = app.config.get('JOB_MAX_PENDING', self.max_pending)
+        self.retention_seconds = app.config.get('JOB_RETENTION_SECONDS', self.retention_seconds)
+        app.extensions['jobs'] = self
+
+    def _get_executor(self):
+        # Thread'ler ilk işte başlatılır (fork öncesi thread oluşturmamak için)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix='planllama-job')
+        return self._executor
+
+    @staticmethod
+    def _table():
+        # extensions.py bu modülü import ettiği için db/modeller burada yükleniyor
+        from extensions import db
+        from models import GenerationJob
+        return db, GenerationJob.__table__
+
+    def _prune(self, conn, table):
+        retention = timedelta(seconds=self.retention_seconds)
+        cutoff = datetime.utcnow() - retention
+        # Yarım kalanlar 'failed' olarak bir saklama süresi daha görünür, sonra silinir
+        conn.execute(delete(table).where(or_(
+            table.c.finished_at < cutoff,
+            and_(table.c.finished_at.is_(None), table.c.created_at < cutoff - retention)
+        )))
+
+    def submit(self, kind, func, *args, **kwargs):
+        """Queue func(*args, **kwargs) and return the new job's public dict.
+
+        func's return value becomes the job result. Exceptions with a to_dict()
+        method (e.g. GenerationError) are stored as the job error.
+        max_pending bounds the unfinished jobs of this process.
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise JobQueueFull(f'Too many pending jobs ({self._pending})')
+            self._pending += 1
+
+        job = {
+            'job_id': uuid.uuid4().hex,
+            'kind': kind,
+            'status': 'queued',
+            'created_at': datetime.utcnow(),
+            'started_at': None,
+            'finished_at': None,
+            'result': None,
+            'error': None
+        }
+        db, table = self._table()
+        try:
+            # İstek oturumundan bağımsız, kısa bir transaction
+            with db.engine.begin() as conn:
+                self._prune(conn, table)
+                conn.execute(insert(table).values(**job))
+            self._get_executor().submit(self._run, job['job_id'], func, args, kwargs)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+        return self._public(job)
+
+    def _run(self, job_id, func, args, kwargs):
+        try:
+            with self.app.app_context():
+                self._update(job_id, status='running', started_at=datetime.utcnow())
+                try:
+                    # Sonuç jsonify ile aynı biçimde saklanır (tarihler vb. JSON sütununa sığar)
+                    result = json.loads(self.app.json.dumps(func(*args, **kwargs)))
+                except Exception as e:
+                    error = e.to_dict() if hasattr(e, 'to_dict') else {'error': str(e)}
+                    self._update(job_id, status='failed', error=error, finished_at=datetime.utcnow())
+                else:
+                    self._update(job_id, status='succeeded', result=result, finished_at=datetime.utcnow())
+        except Exception:
+            self.app.logger.exception('Could not store the state of job %s', job_id)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _update(self, job_id, **fields):
+        db, table = self._table()
+        with db.engine.begin() as conn:
+            conn.execute(update(table).where(table.c.job_id == job_id).values(**fields))
+
+    def get(self, job_id):
+        """Return the public dict of a job, or None if unknown/expired"""
+        db, table = self._table()
+        with db.engine.connect() as conn:
+            row = conn.execute(select(table).where(table.c.job_id == job_id)).mappings().first()
+        if row is None:
+            return None
+        job = dict(row)
+        lost_before = datetime.utcnow() - timedelta(seconds=self.retention_seconds)
+        if job['finished_at'] is None and job['created_at'] < lost_before:
+            job.update(status='failed', error={'error': 'Job was lost: its worker stopped before finishing'})
+        return self._public(job)
+
+    @staticmethod
+    def _public(job):
+        return {key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in job.items()}
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
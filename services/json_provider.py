@@ -0,0 +1,73 @@
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # opsiyonel bağımlılık; yoksa stdlib json kullanılır
+    orjson = None
+
+
+def _default(o):
+    """Types the encoders do not handle natively; dates as ISO 8601 (not HTTP dates)"""
+    if isinstance(o, date):
+        return o.isoformat()
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    raise TypeError(f'Object of type {type(o).__name__} is not JSON serializable')
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson when it is installed.
+
+    date/datetime values are written as ISO 8601 by both orjson and the
+    stdlib fallback, so models can return them without calling isoformat().
+    Responses are indented only when `compact` is False, or when it is None
+    and the app runs in debug mode (same rule as Flask's default provider).
+    """
+
+    use_orjson = orjson is not None
+
+    def _orjson_options(self, indent=False):
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _pretty(self):
+        return self.compact is False or (self.compact is None and self._app.debug)
+
+    def dumps(self, obj, **kwargs):
+        if self.use_orjson and not kwargs:
+            return orjson.dumps(obj, default=_default, option=self._orjson_options()).decode('utf-8')
+        kwargs.setdefault('default', _default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if self.use_orjson and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = self._pretty()
+
+        if self.use_orjson:
+            # str'e çevirmeden doğrudan bytes gövde
+            body = orjson.dumps(obj, default=_default, option=self._orjson_options(indent=pretty))
+        elif pretty:
+            body = self.dumps(obj, indent=2)
+        else:
+            body = self.dumps(obj, separators=(',', ':'))
+        return self._app.response_class(body, mimetype=self.mimetype)
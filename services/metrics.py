@@ -0,0 +1,203 @@
+import threading
+import time
+from collections import defaultdict
+from flask import g, request, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Prometheus istemcisinin varsayılan kovaları (saniye)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label set"""
+
+    def __init__(self, name, documentation, labelnames, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets) + (float('inf'),)
+        self._series = {}
+
+    def observe(self, labels, value):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series['buckets'][i] += 1
+                break
+        series['sum'] += value
+        series['count'] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series['buckets']):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, [('le', _number(bound))])} "
+                             f"{cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(series['sum'])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {series['count']}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter per label set"""
+
+    def __init__(self, name, documentation, labelnames):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values = defaultdict(int)
+
+    def inc(self, labels, amount=1):
+        self._values[labels] += amount
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        lines += [f'{self.name}{_labels(self.labelnames, labels)} {_number(value)}'
+                  for labels, value in sorted(self._values.items())]
+        return lines
+
+
+class RequestMetrics:
+    """Per-route request metrics in Prometheus text format.
+
+    Records, per request: latency, SQL statement count and total time spent
+    in the database (SQLAlchemy engine events), plus the number of requests in
+    flight. Optionally adds a Server-Timing header (`app` and `db` durations)
+    so the browser dev tools show where the time went.
+
+    Values are kept in process memory, so with several workers each process
+    exposes its own series (scrape every worker, or sum them by instance).
+    """
+
+    def __init__(self, app=None):
+        self.server_timing = False
+        self._lock = threading.Lock()
+        self._reset()
+        if app is not None:
+            self.init_app(app)
+
+    def _reset(self):
+        labels = ('method', 'route')
+        self.requests = Counter('planllama_http_requests_total', 'HTTP requests by route and status code',
+                                labels + ('status',))
+        self.latency = Histogram('planllama_http_request_duration_seconds', 'HTTP request latency',
+                                 labels, LATENCY_BUCKETS)
+        self.statements = Histogram('planllama_db_statements_per_request', 'SQL statements executed per request',
+                                    labels, STATEMENT_BUCKETS)
+        self.db_time = Histogram('planllama_db_duration_seconds', 'Time spent executing SQL per request',
+                                 labels, LATENCY_BUCKETS)
+        self.in_flight = 0
+
+    def init_app(self, app):
+        self.server_timing = app.config.get('METRICS_SERVER_TIMING', self.server_timing)
+        with self._lock:
+            self._reset()
+
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+
+        # Tüm engine'ler için bir kez; sayaçlar yalnızca istek içindeyken tutulur
+        if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+            event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+            event.listen(Engine, 'handle_error', _handle_error)
+
+        app.extensions['metrics'] = self
+
+    def reset(self):
+        """Drop all recorded series (e.g. after warm-up requests)"""
+        with self._lock:
+            in_flight = self.in_flight
+            self._reset()
+            self.in_flight = in_flight
+
+    def _before_request(self):
+        g.metrics_start = time.perf_counter()
+        g.sql_statements = 0
+        g.sql_seconds = 0.0
+        with self._lock:
+            self.in_flight += 1
+
+    def _after_request(self, response):
+        g.metrics_status = response.status_code
+        if self.server_timing and 'metrics_start' in g:
+            elapsed = (time.perf_counter() - g.metrics_start) * 1000
+            response.headers.add('Server-Timing', f'app;dur={elapsed:.2f}')
+            response.headers.add('Server-Timing',
+                                 f'db;dur={g.sql_seconds * 1000:.2f};desc="{g.sql_statements} queries"')
+        return response
+
+    def _teardown_request(self, error=None):
+        start = g.pop('metrics_start', None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        # Akış (stream) cevaplarında teardown gövde bitince çalışır; süre tüm akışı kapsar
+        status = 500 if error is not None else g.get('metrics_status', 500)
+        labels = (request.method, request.url_rule.rule if request.url_rule else 'unmatched')
+
+        with self._lock:
+            self.in_flight -= 1
+            self.requests.inc(labels + (str(status),))
+            self.latency.observe(labels, elapsed)
+            self.statements.observe(labels, g.get('sql_statements', 0))
+            self.db_time.observe(labels, g.get('sql_seconds', 0.0))
+
+    def render(self):
+        """All metrics in Prometheus text exposition format"""
+        with self._lock:
+            lines = ['# HELP planllama_http_requests_in_flight Requests currently being served',
+                     '# TYPE planllama_http_requests_in_flight gauge',
+                     f'planllama_http_requests_in_flight {self.in_flight}']
+            for metric in (self.requests, self.latency, self.statements, self.db_time):
+                lines += metric.render()
+        return '\n'.join(lines) + '\n'
+
+
+# --- SQLAlchemy engine olayları: istek başına SQL sayısı ve süresi ---
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('metrics_query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get('metrics_query_start')
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    if has_request_context() and 'sql_statements' in g:
+        g.sql_statements += 1
+        g.sql_seconds += elapsed
+
+
+def _handle_error(exception_context):
+    # Hata veren sorgunun başlangıç zamanı yığında kalmasın
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('metrics_query_start'):
+        connection.info['metrics_query_start'].pop()
@@ -0,0 +1,103 @@
+import base64
+from flask import request, jsonify, current_app, Response, stream_with_context
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+STREAM_BATCH_SIZE = 500
+
+
+def encode_cursor(key):
+    """Encode the last primary key of a page as an opaque cursor"""
+    return base64.urlsafe_b64encode(str(key).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor produced by encode_cursor. Raises ValueError if malformed."""
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        return base64.b64decode(padded.encode('ascii'), altchars=b'-_', validate=True).decode('utf-8')
+    except (ValueError, UnicodeError):
+        raise ValueError('Invalid cursor')
+
+
+def insertion_order(key_column):
+    """ORDER BY for lists without paging parameters: creation time, then primary key.
+
+    String keys do not sort in creation order ('t1000' < 't101'), so plain
+    lists keep the order rows were added in, as before explicit ordering.
+    """
+    return key_column.class_.created_at, key_column
+
+
+def keyset_page(query, key_column, limit, cursor=None):
+    """Fetch one page ordered by key_column, starting after cursor.
+
+    Returns:
+        (items, next_cursor) - next_cursor is None on the last page
+    """
+    query = query.order_by(key_column)
+    if cursor:
+        query = query.filter(key_column > decode_cursor(cursor))
+
+    # Bir fazla satır çekerek sonraki sayfanın varlığını anlıyoruz
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor(getattr(rows[-1], key_column.key))
+    return rows, next_cursor
+
+
+def stream_json_array(query, serialize, batch_size=STREAM_BATCH_SIZE):
+    """Stream query results as a JSON array without materializing the full list.
+
+    Rows are fetched from a server-side cursor in batches of batch_size.
+    """
+    dumps = current_app.json.dumps
+
+    def generate():
+        yield '['
+        first = True
+        for row in query.yield_per(batch_size):
+            if not first:
+                yield ','
+            first = False
+            yield dumps(serialize(row))
+        yield ']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+def list_response(query, key_column, serialize):
+    """Build the response for a list endpoint.
+
+    Query parameters:
+        stream=true   stream the full result set as a JSON array
+        limit/cursor  keyset pagination; returns {'items': [...], 'next_cursor': ...}
+        (none)        plain JSON array, as before
+    """
+    if request.args.get('stream', 'false').lower() == 'true':
+        return stream_json_array(query.order_by(key_column), serialize)
+
+    if 'limit' not in request.args and 'cursor' not in request.args:
+        # Filtre indeksleri kullanılınca satır sırası değişebilir; eklenme sırası açıkça istenir
+        return jsonify([serialize(row) for row in query.order_by(*insertion_order(key_column)).all()])
+
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        return jsonify({'error': f'limit must be between 1 and {MAX_PAGE_SIZE}'}), 400
+
+    try:
+        items, next_cursor = keyset_page(query, key_column, limit, request.args.get('cursor'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify({
+        'items': [serialize(row) for row in items],
+        'next_cursor': next_cursor
+    })
@@ -0,0 +1,145 @@
+import os
+import re
+import sys
+from collections import Counter
+from flask import current_app, g, request, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Genişletilmiş IN listeleri tek biçime indirgenir: IN (?, ?, ?) -> IN (?)
+_PARAM_LIST = re.compile(r'\(\s*(?:\?|%\(\w+\)s|:\w+|\$\d+)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+|\$\d+))+\s*\)')
+_SPACES = re.compile(r'\s+')
+
+
+class QueryBudgetExceeded(Exception):
+    """A request ran more SQL statements than its budget, or repeated one SELECT (N+1)"""
+
+
+def query_budget(max_queries, per_item=0):
+    """Declare the SQL statement budget of a route.
+
+    Put it directly under the route decorator. Bulk routes can add
+    `per_item` statements for every item they report with budget_items().
+
+        @tasks_bp.route('/<task_id>', methods=['GET'])
+        @query_budget(2)
+        @cached('tasks')
+        def get_task(task_id): ...
+    """
+    def decorator(view):
+        view.query_budget = (max_queries, per_item)
+        return view
+    return decorator
+
+
+def budget_items(count):
+    """Number of items in a bulk request, for per_item budgets"""
+    if has_request_context():
+        g.query_budget_items = count
+
+
+def statement_shape(statement):
+    """SQL text with whitespace and expanded IN lists normalized"""
+    return _PARAM_LIST.sub('(?)', _SPACES.sub(' ', statement).strip())
+
+
+class QueryGuard:
+    """Counts SQL statements per request and enforces per-route query budgets.
+
+    Two checks run after every request:
+        budget  more statements than the route's @query_budget
+                (or QUERY_GUARD_DEFAULT_BUDGET for undeclared routes)
+        N+1     the same SELECT shape QUERY_GUARD_REPEAT_THRESHOLD or more
+                times in one request - typically a lazy load in a loop
+
+    Violations raise QueryBudgetExceeded (QUERY_GUARD_ACTION='raise', the
+    TestingConfig default) or are logged with the source location of the
+    offending statement ('log'). Responses served from the response cache run
+    no SQL, so each distinct request is checked on its first (miss) call.
+    """
+
+    def __init__(self, app=None):
+        self.action = 'log'
+        self.repeat_threshold = 5
+        self.default_budget = None
+        self.root_path = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.action = app.config.get('QUERY_GUARD_ACTION', self.action)
+        self.repeat_threshold = app.config.get('QUERY_GUARD_REPEAT_THRESHOLD', self.repeat_threshold)
+        self.default_budget = app.config.get('QUERY_GUARD_DEFAULT_BUDGET', self.default_budget)
+        self.root_path = app.root_path
+
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+
+        if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+            event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+
+        app.extensions['query_guard'] = self
+
+    def _before_request(self):
+        g.query_guard = {'count': 0, 'shapes': Counter(), 'locations': {}}
+
+    def budget(self):
+        """Statement budget of the current request, or None"""
+        view = current_app.view_functions.get(request.endpoint)
+        declared = getattr(view, 'query_budget', None)
+        if declared is None:
+            return self.default_budget
+        max_queries, per_item = declared
+        return max_queries + per_item * g.get('query_budget_items', 0)
+
+    def record(self, statement):
+        stats = g.query_guard
+        shape = statement_shape(statement)
+        stats['count'] += 1
+        stats['shapes'][shape] += 1
+        # Konum ilk görülüşte ve N+1 eşiğinde alınır (her sorguda stack yürütmemek için)
+        if shape not in stats['locations'] or stats['shapes'][shape] == self.repeat_threshold:
+            stats['locations'][shape] = self._location()
+
+    def _location(self):
+        """file:line (function) of the innermost frame in application code"""
+        here = os.path.abspath(__file__)
+        frame = sys._getframe(2)
+        while frame is not None:
+            filename = os.path.abspath(frame.f_code.co_filename)
+            if (filename.startswith(self.root_path) and filename != here
+                    and 'site-packages' not in filename):
+                return f'{os.path.relpath(filename, self.root_path)}:{frame.f_lineno} ({frame.f_code.co_name})'
+            frame = frame.f_back
+        return 'unknown'
+
+    def violations(self):
+        """Messages for the current request's budget / N+1 violations"""
+        stats = g.get('query_guard')
+        if stats is None:
+            return []
+
+        messages = []
+        budget = self.budget()
+        if budget is not None and stats['count'] > budget:
+            top = ', '.join(f'{count}x {shape[:80]} at {stats["locations"][shape]}'
+                            for shape, count in stats['shapes'].most_common(3))
+            messages.append(f'{stats["count"]} SQL statements, budget is {budget} (most frequent: {top})')
+        for shape, count in stats['shapes'].items():
+            if count >= self.repeat_threshold and shape.upper().startswith('SELECT'):
+                messages.append(f'possible N+1: same SELECT {count}x at {stats["locations"][shape]}: {shape[:160]}')
+        return messages
+
+    def _after_request(self, response):
+        messages = self.violations()
+        if messages:
+            message = f'{request.method} {request.path} [{request.endpoint}]: ' + '; '.join(messages)
+            if self.action == 'raise':
+                raise QueryBudgetExceeded(message)
+            current_app.logger.warning('Query guard: %s', message)
+        return response
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and 'query_guard' in g:
+        current_app.extensions['query_guard'].record(statement)
@@ -0,0 +1,302 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from collections import namedtuple
+import numpy as np
+
+# Skor bileşenlerinin ağırlıkları; istekte olmayan bileşenler (dil, saat dilimi) hesaba katılmaz
+WEIGHTS = {'skills': 0.6, 'availability': 0.3, 'language': 0.07, 'timezone': 0.03}
+MAX_TOP_K = 100
+REFRESH_OVERLAP = timedelta(minutes=5)
+# Matris seviyeleri uint8 tutar; aralık dışı seviyeler sınırlanır (aksi halde OverflowError)
+MAX_SKILL_LEVEL = 255
+
+# Source tables of the matrix; their generations tell when it is stale
+MATRIX_TABLES = ('employees', 'employee_skills', 'employee_languages')
+
+EmployeeMatrix = namedtuple('EmployeeMatrix', [
+    'employee_ids', 'names', 'roles', 'timezones',   # numpy object arrays, one row per employee
+    'capacity', 'load',                              # float32 hours per week
+    'skill_index', 'levels',                         # skill name -> column, uint8 (employees x skills)
+    'language_index', 'languages',                   # language -> column, bool (employees x languages)
+    'row_of', 'loaded_at'                            # employee_id -> row, utc time the employees were read
+])
+
+
+def _rows(stmt):
+    # ORM satır nesneleri olmadan Core üzerinden çalıştır (büyük sonuçlarda ~2 kat hızlı)
+    from extensions import db
+    return db.session.connection().execute(stmt).all()
+
+
+def _employee_select():
+    from sqlalchemy import select
+    from models import Employee
+
+    return select(Employee.employee_id, Employee.name, Employee.user_role, Employee.timezone,
+                  Employee.capacity_hours_per_week, Employee.current_load_hours)
+
+
+def _dense(row_of, rows, dtype):
+    """(employee_id, key, value) rows -> (key -> column, employees x keys array)"""
+    index = {}
+    cells = [(row_of[e], index.setdefault(key, len(index)), value) for e, key, value in rows if e in row_of]
+    matrix = np.zeros((len(row_of), len(index)), dtype=dtype)
+    if cells:
+        r, c, v = zip(*cells)
+        matrix[np.array(r, dtype=np.intp), np.array(c, dtype=np.intp)] = v
+    return index, matrix
+
+
+def _matrix_level(level):
+    # 0 seviyeli yetenekler seviye 1 sayılır, 0 "yetenek yok" demek; skill_rows sınırlamadan
+    # önce yazılmış indeks satırları aralık dışında olabilir
+    return min(max(level, 1), MAX_SKILL_LEVEL)
+
+
+def build_matrix():
+    """Load employees and the skill/language index into an EmployeeMatrix (3 queries)"""
+    from sqlalchemy import select
+    from models import Employee, EmployeeSkill, EmployeeLanguage
+
+    loaded_at = datetime.utcnow()
+    rows = _rows(_employee_select().order_by(Employee.employee_id))
+    ids, names, roles, timezones, capacity, load = zip(*rows) if rows else ([],) * 6
+    row_of = {employee_id: i for i, employee_id in enumerate(ids)}
+
+    skill_index, levels = _dense(
+        row_of, ((e, name, _matrix_level(level)) for e, name, level in
+                 _rows(select(EmployeeSkill.employee_id, EmployeeSkill.name, EmployeeSkill.level))), np.uint8)
+    language_index, languages = _dense(
+        row_of, ((e, code, True) for e, code in
+                 _rows(select(EmployeeLanguage.employee_id, EmployeeLanguage.language))), bool)
+
+    return EmployeeMatrix(np.array(ids, dtype=object), np.array(names, dtype=object),
+                          np.array(roles, dtype=object), np.array(timezones, dtype=object),
+                          np.array([c or 0 for c in capacity], dtype=np.float32),
+                          np.array([h or 0 for h in load], dtype=np.float32),
+                          skill_index, levels, language_index, languages,
+                          row_of, loaded_at)
+
+
+def refresh_employee_columns(matrix):
+    """Re-read employees changed since the matrix was loaded.
+
+    Task writes change current_load_hours (and so updated_at) of a few
+    employees; only rows with updated_at >= loaded_at - REFRESH_OVERLAP are
+    fetched, together with their skill and language rows. The overlap covers
+    transactions that were still open (or clocks of other workers that were
+    behind) when the matrix was read.
+
+    Returns:
+        updated EmployeeMatrix, or None when employees were added or deleted
+        or a changed employee has a skill/language the matrix has no column for
+    """
+    from sqlalchemy import select, func
+    from models import Employee, EmployeeSkill, EmployeeLanguage
+
+    loaded_at = datetime.utcnow()
+    count = _rows(select(func.count()).select_from(Employee))[0][0]
+    if count != len(matrix.employee_ids):
+        return None
+
+    rows = _rows(_employee_select().where(Employee.updated_at >= matrix.loaded_at - REFRESH_OVERLAP))
+    if any(row[0] not in matrix.row_of for row in rows):
+        return None
+
+    names, roles, timezones = matrix.names.copy(), matrix.roles.copy(), matrix.timezones.copy()
+    capacity, load = matrix.capacity.copy(), matrix.load.copy()
+    for employee_id, name, role, timezone, hours, current in rows:
+        i = matrix.row_of[employee_id]
+        names[i], roles[i], timezones[i] = name, role, timezone
+        capacity[i], load[i] = hours or 0, current or 0
+
+    levels, languages = matrix.levels, matrix.languages
+    if rows:
+        # Yetenekleri başka bir worker'da değişen çalışanlar için satırlar yeniden yazılır
+        changed = [row[0] for row in rows]
+        skills = _rows(select(EmployeeSkill.employee_id, EmployeeSkill.name, EmployeeSkill.level)
+                       .where(EmployeeSkill.employee_id.in_(changed)))
+        codes = _rows(select(EmployeeLanguage.employee_id, EmployeeLanguage.language)
+                      .where(EmployeeLanguage.employee_id.in_(changed)))
+        if any(name not in matrix.skill_index for _, name, _ in skills) or \
+                any(code not in matrix.language_index for _, code in codes):
+            return None
+        changed_rows = np.array([matrix.row_of[e] for e in changed], dtype=np.intp)
+        levels, languages = levels.copy(), languages.copy()
+        levels[changed_rows] = 0
+        languages[changed_rows] = False
+        for e, name, level in skills:
+            levels[matrix.row_of[e], matrix.skill_index[name]] = _matrix_level(level)
+        for e, code in codes:
+            languages[matrix.row_of[e], matrix.language_index[code]] = True
+    return matrix._replace(names=names, roles=roles, timezones=timezones, capacity=capacity, load=load,
+                           levels=levels, languages=languages, loaded_at=loaded_at)
+
+
+def database_version():
+    """Cheap fingerprint of the matrix source tables as seen by every worker:
+    (employee count, last employee update, skill rows, language rows)"""
+    from sqlalchemy import select, func
+    from models import Employee, EmployeeSkill, EmployeeLanguage
+
+    return tuple(_rows(select(
+        select(func.count()).select_from(Employee).scalar_subquery(),
+        select(func.max(Employee.updated_at)).scalar_subquery(),
+        select(func.count()).select_from(EmployeeSkill).scalar_subquery(),
+        select(func.count()).select_from(EmployeeLanguage).scalar_subquery()
+    ))[0])
+
+
+def score_employees(matrix, requirements, estimated_hours=0, language=None, timezone=None,
+                    user_role=None, exclude=(), only_available=False, top_k=5):
+    """Score every employee at once and return the top_k as dicts.
+
+    Components (each 0..1), weighted by WEIGHTS over the ones that apply:
+        skills        mean over required skills of min(level / required level, 1)
+        availability  free hours left after the task, relative to weekly capacity
+        language      speaks the requested language
+        timezone      same timezone as requested
+    """
+    n = len(matrix.employee_ids)
+    candidates = np.ones(n, dtype=bool)
+    if user_role:
+        candidates &= matrix.roles == user_role
+    if exclude:
+        candidates &= ~np.isin(matrix.employee_ids, list(exclude))
+
+    components = {}
+
+    names = list(requirements)
+    if names:
+        needed = np.array([max(requirements[name], 1) for name in names], dtype=np.float32)
+        have = np.zeros((n, len(names)), dtype=np.float32)
+        known = [i for i, name in enumerate(names) if name in matrix.skill_index]
+        if known:
+            have[:, known] = matrix.levels[:, [matrix.skill_index[names[i]] for i in known]]
+        coverage = np.minimum(have / needed, 1.0)
+        components['skills'] = coverage.mean(axis=1)
+
+    free_hours = matrix.capacity - matrix.load
+    safe_capacity = np.where(matrix.capacity > 0, matrix.capacity, 1)
+    components['availability'] = np.clip((free_hours - estimated_hours) / safe_capacity, 0, 1)
+    fits = free_hours >= estimated_hours
+    if only_available:
+        candidates &= fits
+
+    if language:
+        column = matrix.language_index.get(language)
+        components['language'] = (matrix.languages[:, column] if column is not None
+                                  else np.zeros(n, dtype=bool)).astype(np.float32)
+    if timezone:
+        components['timezone'] = (matrix.timezones == timezone).astype(np.float32)
+
+    total_weight = sum(WEIGHTS[name] for name in components)
+    scores = sum(WEIGHTS[name] * values for name, values in components.items()) / total_weight
+    scores = np.where(candidates, scores, -np.inf)
+
+    k = min(top_k, int(candidates.sum()))
+    if k == 0:
+        return [], 0
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.lexsort((matrix.employee_ids[top].astype(str), -scores[top]))]
+
+    results = []
+    for i in top:
+        result = {
+            'employee_id': matrix.employee_ids[i],
+            'name': matrix.names[i],
+            'score': round(float(scores[i]), 4),
+            'availability': round(float(components['availability'][i]), 4),
+            'available_hours': float(free_hours[i]),
+            'fits': bool(fits[i])
+        }
+        if names:
+            result['skill_match'] = round(float(components['skills'][i]), 4)
+            result['missing_skills'] = [name for j, name in enumerate(names) if coverage[i, j] < 1]
+        results.append(result)
+    return results, int(candidates.sum())
+
+
+class AssigneeRecommender:
+    """Keeps the EmployeeMatrix in memory and answers recommendation requests.
+
+    The matrix is rebuilt when the generation of one of MATRIX_TABLES changes
+    (bumped after commits in this process, see services/cache.py). Writes made
+    by other worker processes are found by comparing database_version() at
+    most every check_seconds, and every matrix is rebuilt after ttl seconds
+    at the latest. When only employee rows changed - e.g. current_load_hours
+    after a task write - only the recently updated employees are re-read.
+    """
+
+    def __init__(self, app=None):
+        self.check_seconds = 5
+        self.ttl = 300
+        self._matrix = None
+        self._version = None
+        self._db_version = None
+        self._built_at = 0.0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'builds': 0, 'refreshes': 0}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.check_seconds = app.config.get('RECOMMEND_CHECK_SECONDS', self.check_seconds)
+        self.ttl = app.config.get('RECOMMEND_MATRIX_TTL', self.ttl)
+        # Yeni uygulama (ör. başka veritabanı) eski matrisi kullanmamalı
+        self._matrix = None
+        self._version = None
+        self._db_version = None
+        self._stats = {'builds': 0, 'refreshes': 0}
+        app.extensions['recommender'] = self
+
+    def matrix(self):
+        from extensions import response_cache
+
+        # Sürüm yüklemeden önce okunur; arada commit olursa sonraki istek yeniden yükler
+        version = response_cache.generations(*MATRIX_TABLES)
+        now = time.monotonic()
+        if self._matrix is not None and self._version == version and now - self._checked_at < self.check_seconds:
+            return self._matrix
+
+        with self._lock:
+            now = time.monotonic()
+            current = self._matrix is not None and now - self._built_at < self.ttl
+            if current and self._version == version and now - self._checked_at < self.check_seconds:
+                return self._matrix
+
+            db_version = database_version()
+            self._checked_at = now
+            if current and self._version == version and self._db_version == db_version:
+                return self._matrix
+
+            matrix = None
+            # Yalnızca çalışan satırları değiştiyse (yük, ad, yetenek seviyesi) kısmi yenileme yeterli
+            if current and self._version[1:] == version[1:] and self._db_version[2:] == db_version[2:]:
+                matrix = refresh_employee_columns(self._matrix)
+                self._stats['refreshes'] += matrix is not None
+            if matrix is None:
+                matrix = build_matrix()
+                self._built_at = now
+                self._stats['builds'] += 1
+
+            self._matrix, self._version, self._db_version = matrix, version, db_version
+            return matrix
+
+    def recommend(self, requirements, **options):
+        """Top-k employees for a task, see score_employees for options"""
+        matrix = self.matrix()
+        recommendations, candidates = score_employees(matrix, requirements, **options)
+        return {
+            'recommendations': recommendations,
+            'candidates': candidates,
+            'skills_known': [name for name in requirements if name in matrix.skill_index]
+        }
+
+    def stats(self):
+        matrix = self._matrix
+        return dict(self._stats,
+                    employees=len(matrix.employee_ids) if matrix is not None else 0,
+                    skills=len(matrix.skill_index) if matrix is not None else 0)
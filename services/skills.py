@@ -0,0 +1,135 @@
+from sqlalchemy import and_, delete, func, insert, or_, select
+from sqlalchemy.orm import load_only
+from extensions import db
+from models import Employee, EmployeeSkill, EmployeeLanguage
+from services.recommend import MAX_SKILL_LEVEL
+
+INDEX_BATCH_SIZE = 5000
+
+
+def skill_rows(employee_id, skills):
+    """employee_skills rows for an Employee.skills list; names lower-cased, levels clamped to
+    0..MAX_SKILL_LEVEL, highest level wins"""
+    levels = {}
+    for skill in skills or []:
+        if isinstance(skill, dict):
+            name, level = skill.get('name'), skill.get('level', 0)
+        else:
+            name, level = skill, 0
+        if not name:
+            continue
+        try:
+            level = int(level or 0)
+        except (TypeError, ValueError):
+            level = 0
+        level = min(max(level, 0), MAX_SKILL_LEVEL)
+        name = str(name).strip().lower()
+        levels[name] = max(level, levels.get(name, level))
+    return [{'employee_id': employee_id, 'name': name, 'level': level} for name, level in levels.items()]
+
+
+def language_rows(employee_id, languages):
+    """employee_languages rows for an Employee.languages list"""
+    codes = {str(code).strip().lower() for code in languages or [] if code}
+    return [{'employee_id': employee_id, 'language': code} for code in sorted(codes)]
+
+
+def _insert_rows(skills, languages):
+    if skills:
+        db.session.execute(insert(EmployeeSkill), skills)
+    if languages:
+        db.session.execute(insert(EmployeeLanguage), languages)
+
+
+def delete_employee_index(employee_id):
+    """Remove an employee's rows from the skill/language index"""
+    for model in (EmployeeSkill, EmployeeLanguage):
+        db.session.execute(delete(model).where(model.employee_id == employee_id))
+
+
+def sync_employee_index(employee):
+    """Replace an employee's index rows with its current skills/languages (caller commits).
+
+    Pending changes are flushed first so the employee row exists for the foreign key.
+    """
+    db.session.flush()
+    delete_employee_index(employee.employee_id)
+    _insert_rows(skill_rows(employee.employee_id, employee.skills),
+                 language_rows(employee.employee_id, employee.languages))
+
+
+def rebuild_skill_index():
+    """Rebuild both index tables from all employees (after bulk loads), caller commits.
+
+    Returns:
+        {'employees': n, 'skills': n, 'languages': n}
+    """
+    db.session.execute(delete(EmployeeSkill))
+    db.session.execute(delete(EmployeeLanguage))
+
+    counts = {'employees': 0, 'skills': 0, 'languages': 0}
+    skills, languages = [], []
+    query = Employee.query.options(load_only(Employee.employee_id, Employee.skills, Employee.languages))
+    for employee in query.yield_per(INDEX_BATCH_SIZE):
+        counts['employees'] += 1
+        skills += skill_rows(employee.employee_id, employee.skills)
+        languages += language_rows(employee.employee_id, employee.languages)
+        if len(skills) + len(languages) >= INDEX_BATCH_SIZE:
+            counts['skills'] += len(skills)
+            counts['languages'] += len(languages)
+            _insert_rows(skills, languages)
+            skills, languages = [], []
+
+    counts['skills'] += len(skills)
+    counts['languages'] += len(languages)
+    _insert_rows(skills, languages)
+    return counts
+
+
+def parse_skill_filters(values):
+    """Parse `skill` query values such as 'python:4' or 'docker' (any level).
+
+    Returns:
+        {name: min_level}; repeated names keep the highest minimum
+
+    Raises:
+        ValueError for a malformed value
+    """
+    requirements = {}
+    for value in values:
+        name, _, level = value.partition(':')
+        name = name.strip().lower()
+        if not name:
+            raise ValueError(f"Invalid skill filter '{value}', expected name or name:level")
+        try:
+            min_level = int(level) if level else 0
+        except ValueError:
+            raise ValueError(f"Invalid skill level in '{value}', expected an integer")
+        requirements[name] = max(min_level, requirements.get(name, min_level))
+    return requirements
+
+
+def search_query(requirements, languages):
+    """Employee query matching every skill requirement and every language, answered from the index.
+
+    Each filter is one grouped IN subquery over the (name, level) / language
+    indexes, so the whole search is a single SELECT.
+    """
+    query = Employee.query
+
+    if requirements:
+        matched = (select(EmployeeSkill.employee_id)
+                   .where(or_(*(and_(EmployeeSkill.name == name, EmployeeSkill.level >= level)
+                                for name, level in requirements.items())))
+                   .group_by(EmployeeSkill.employee_id)
+                   .having(func.count() == len(requirements)))
+        query = query.filter(Employee.employee_id.in_(matched))
+
+    if languages:
+        spoken = (select(EmployeeLanguage.employee_id)
+                  .where(EmployeeLanguage.language.in_(languages))
+                  .group_by(EmployeeLanguage.employee_id)
+                  .having(func.count() == len(languages)))
+        query = query.filter(Employee.employee_id.in_(spoken))
+
+    return query
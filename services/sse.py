@@ -0,0 +1,45 @@
+from flask import Response, current_app, stream_with_context
+
+MIMETYPE = 'text/event-stream'
+
+
+def format_event(data, event=None, event_id=None, retry=None):
+    """One Server-Sent Events message; data is JSON-encoded unless it is a str"""
+    lines = []
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    if event:
+        lines.append(f'event: {event}')
+    if retry is not None:
+        lines.append(f'retry: {int(retry)}')
+    body = data if isinstance(data, str) else current_app.json.dumps(data)
+    lines += [f'data: {line}' for line in body.split('\n')]
+    return '\n'.join(lines) + '\n\n'
+
+
+def format_comment(text='', event_id=None, retry=None):
+    """SSE comment; EventSource fires no event for it, but proxies see traffic.
+
+    event_id still becomes the client's Last-Event-ID and retry its
+    reconnection delay in milliseconds.
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    if retry is not None:
+        lines.append(f'retry: {int(retry)}')
+    lines.append(f': {text}')
+    return '\n'.join(lines) + '\n\n'
+
+
+def sse_response(messages):
+    """Stream an iterable of formatted messages as text/event-stream.
+
+    The request context stays available while the generator runs, and the
+    generator is closed (GeneratorExit) when the client disconnects.
+    """
+    response = Response(stream_with_context(messages), mimetype=MIMETYPE)
+    response.headers['Cache-Control'] = 'no-cache'
+    # nginx gibi ters proxy'ler olayları tamponlamasın
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,60 @@
+from sqlalchemy import func, case
+from models import Task
+from extensions import db
+
+TASK_STATUSES = {
+    'pending': 'Pending',
+    'in_progress': 'In Progress',
+    'completed': 'Completed',
+    'blocked': 'Blocked'
+}
+
+TASK_PRIORITIES = ['critical', 'high', 'medium', 'low']
+
+
+def _count_where(condition):
+    """SUM(CASE WHEN condition THEN 1 ELSE 0 END)"""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _hours_where(condition=None):
+    """SUM of estimated_hours, optionally restricted by a condition"""
+    if condition is None:
+        return func.coalesce(func.sum(Task.estimated_hours), 0)
+    return func.coalesce(func.sum(case((condition, Task.estimated_hours), else_=0)), 0)
+
+
+def task_aggregates(*criteria):
+    """Compute task counts and hour sums in a single SQL round trip.
+
+    Uses conditional aggregation so no Task rows are loaded into the session.
+
+    Args:
+        criteria: Optional SQLAlchemy filter expressions (e.g. Task.project_id == 'p01')
+
+    Returns:
+        dict with 'total', 'by_status', 'by_priority' and 'estimated_hours'
+    """
+    columns = [func.count(Task.task_id).label('total')]
+    columns += [_count_where(Task.status == value).label(f'status_{key}')
+                for key, value in TASK_STATUSES.items()]
+    columns += [_count_where(Task.priority == value).label(f'priority_{value}')
+                for value in TASK_PRIORITIES]
+    columns += [
+        _hours_where().label('hours_total'),
+        _hours_where(Task.status == 'Completed').label('hours_completed'),
+        _hours_where(Task.status != 'Completed').label('hours_remaining')
+    ]
+
+    row = db.session.query(*columns).filter(*criteria).one()
+
+    return {
+        'total': row.total,
+        'by_status': {key: getattr(row, f'status_{key}') for key in TASK_STATUSES},
+        'by_priority': {value: getattr(row, f'priority_{value}') for value in TASK_PRIORITIES},
+        'estimated_hours': {
+            'total': row.hours_total,
+            'completed': row.hours_completed,
+            'remaining': row.hours_remaining
+        }
+    }
@@ -0,0 +1,90 @@
+import gc
+import time
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import configure_mappers
+
+
+class SchemaMismatch(Exception):
+    """Tables defined by the models are missing from the database (migrations not applied)"""
+
+
+def _elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def check_schema(db):
+    """Reflect the database and fail fast when model tables are missing"""
+    existing = set(inspect(db.engine).get_table_names())
+    missing = sorted(set(db.metadata.tables) - existing)
+    if missing:
+        raise SchemaMismatch(f"Missing tables: {', '.join(missing)} (run 'flask db upgrade')")
+    return len(existing)
+
+
+def warm_up(app, db):
+    """Do the first-request work once, before the server forks its workers.
+
+    Configures the mappers, reflects the schema and calls WARMUP_PATHS to
+    compile their SQL into the engine's statement cache, then freezes the heap
+    for the garbage collector. Workers forked afterwards inherit all of it.
+    The pool is disposed at the end so no connection is shared across the
+    fork; each worker opens its own in init_worker().
+
+    Per-process caches (response cache, assignee matrix) are left empty:
+    filled here, every worker would start with a copy whose invalidation
+    counters then drift apart from the other workers.
+
+    Warm-up requests must be read-only: anything that reserves IDs or writes
+    would be duplicated in every worker.
+
+    Returns:
+        dict of step durations in milliseconds
+    """
+    from extensions import metrics, response_cache
+
+    timings = {}
+    start = time.perf_counter()
+    configure_mappers()
+    timings['mappers_ms'] = _elapsed_ms(start)
+
+    with app.app_context():
+        start = time.perf_counter()
+        timings['tables'] = check_schema(db)
+        timings['reflection_ms'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        client = app.test_client()
+        # İstekler önbelleğe yazılmadan çalışır; yalnızca SQL derlemesi kalıcı
+        cache_enabled, response_cache.enabled = response_cache.enabled, False
+        try:
+            for path in app.config['WARMUP_PATHS']:
+                response = client.get(path)
+                if response.status_code != 200:
+                    app.logger.warning('Warm-up: GET %s returned %s', path, response.status_code)
+        finally:
+            response_cache.enabled = cache_enabled
+        timings['requests_ms'] = _elapsed_ms(start)
+
+        db.session.remove()
+        db.engine.dispose()
+
+    # Isınma istekleri gerçek trafik gibi sayılmasın
+    if 'metrics' in app.extensions:
+        metrics.reset()
+
+    # Kalan nesneler kalıcı nesle alınır: worker'larda GC bunları taramaz,
+    # copy-on-write sayfaları da referans sayacı yazımları dışında paylaşılır
+    gc.collect()
+    gc.freeze()
+    return timings
+
+
+def init_worker(app, db):
+    """Per-worker setup after fork: a fresh connection pool, validated with one round trip"""
+    with app.app_context():
+        # Üst süreçten kalan bağlantılar kapatılmadan bırakılır (soket ebeveyne ait)
+        db.engine.dispose(close=False)
+        start = time.perf_counter()
+        with db.engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
+        return {'connect_ms': _elapsed_ms(start)}
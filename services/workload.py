@@ -0,0 +1,89 @@
+from collections import defaultdict
+from sqlalchemy import func, case, update
+from models import Employee, Task
+from extensions import db
+
+
+def load_deltas(changes):
+    """Net current_load_hours change per employee for a list of (old, new) TaskStates.
+
+    Only tasks that are not Completed count towards an employee's load.
+    """
+    deltas = defaultdict(float)
+    for old, new in changes:
+        for state, sign in ((old, -1), (new, 1)):
+            if state is None or not state.assignee_id or state.status == 'Completed':
+                continue
+            deltas[state.assignee_id] += sign * (state.estimated_hours or 0)
+    return {employee_id: delta for employee_id, delta in deltas.items() if delta}
+
+
+def apply_load_deltas(deltas):
+    """Apply per-employee load deltas with one atomic UPDATE each.
+
+    current_load_hours = current_load_hours + :delta, clamped at 0, so
+    concurrent requests for the same employee never lose an increment.
+    """
+    for employee_id, delta in deltas.items():
+        new_load = func.coalesce(Employee.current_load_hours, 0) + delta
+        db.session.execute(
+            update(Employee)
+            .where(Employee.employee_id == employee_id)
+            .values(current_load_hours=case((new_load < 0, 0), else_=new_load))
+            .execution_options(synchronize_session='evaluate')
+        )
+
+
+def apply_workload_change(old=None, new=None):
+    """Adjust assignee workload for one task change (TaskState before/after)."""
+    apply_load_deltas(load_deltas([(old, new)]))
+
+
+def apply_workload_changes(changes):
+    """Batch version of apply_workload_change: one UPDATE per affected employee."""
+    apply_load_deltas(load_deltas(changes))
+
+
+def reconcile_workload(dry_run=False):
+    """Recompute every employee's current_load_hours from non-completed tasks.
+
+    Current values and the grouped task sums are read in one query; only
+    drifted employees are written back. Does not commit.
+
+    Returns:
+        list of {'employee_id', 'before', 'after', 'drift'} dicts
+    """
+    open_hours = (
+        db.session.query(
+            Task.assignee_id.label('assignee_id'),
+            func.sum(func.coalesce(Task.estimated_hours, 0)).label('hours')
+        )
+        .filter(Task.assignee_id.isnot(None), Task.status != 'Completed')
+        .group_by(Task.assignee_id)
+        .subquery()
+    )
+
+    rows = (
+        db.session.query(
+            Employee.employee_id,
+            Employee.current_load_hours,
+            func.coalesce(open_hours.c.hours, 0)
+        )
+        .outerjoin(open_hours, open_hours.c.assignee_id == Employee.employee_id)
+        .all()
+    )
+
+    drift = [{
+        'employee_id': employee_id,
+        'before': before or 0,
+        'after': after,
+        'drift': (before or 0) - after
+    } for employee_id, before, after in rows if (before or 0) != after]
+
+    if drift and not dry_run:
+        db.session.execute(update(Employee), [
+            {'employee_id': item['employee_id'], 'current_load_hours': item['after']}
+            for item in drift
+        ])
+
+    return drift
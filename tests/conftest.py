@@ -0,0 +1,43 @@
+"""
+Shared fixtures: the testing app on a throwaway database
+In-memory SQLite by default; set TEST_DATABASE_URL to run against another
+database (all its tables are dropped and recreated).
+"""
+import os
+import pytest
+
+# Config sınıfları import anında okunur; uygulama import edilmeden önce ayarlanmalı
+os.environ.setdefault('TEST_DATABASE_URL', 'sqlite://')
+
+
+def make_app():
+    """Testing app with empty tables created from the models"""
+    from app import create_app
+    from extensions import db
+
+    app = create_app('testing')
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    return app
+
+
+def drop_app(app):
+    from extensions import db
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def app():
+    app = make_app()
+    yield app
+    drop_app(app)
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
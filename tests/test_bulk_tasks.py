@@ -0,0 +1,49 @@
+"""Bulk task routes report malformed IDs per item instead of failing the request"""
+import pytest
+
+
+TASK = {'project_id': 'p1', 'due_date': '2030-01-31'}
+
+
+@pytest.fixture
+def seeded(client):
+    assert client.post('/api/projects', json={'project_id': 'p1', 'name': 'Project',
+                                              'dueDate': '2030-01-31'}).status_code == 201
+    assert client.post('/api/tasks/bulk', json={'tasks': [
+        {**TASK, 'task_id': 't1', 'title': 'Existing'}]}).status_code == 201
+    return client
+
+
+@pytest.mark.parametrize('bad', [['x'], {}, {'a': 1}, 5])
+def test_bulk_create_rejects_non_string_ids(seeded, bad):
+    response = seeded.post('/api/tasks/bulk', json={'tasks': [
+        {**TASK, 'task_id': bad, 'title': 'Bad id'},
+        {**TASK, 'title': 'Bad project', 'project_id': bad},
+        {**TASK, 'title': 'Bad assignee', 'assignee_id': bad},
+        {**TASK, 'task_id': 't2', 'title': 'Fine'},
+    ]})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['succeeded'] == 1 and body['failed'] == 3
+    assert [result.get('error') for result in body['results']] == [
+        'task_id must be a string', 'project_id must be a string', 'assignee_id must be a string', None]
+
+
+@pytest.mark.parametrize('bad', [['x'], {}])
+def test_bulk_update_rejects_non_string_ids(seeded, bad):
+    response = seeded.patch('/api/tasks/bulk', json={'tasks': [
+        {'task_id': bad, 'title': 'Bad id'},
+        {'task_id': 't1', 'assignee_id': bad},
+        {'task_id': 't1', 'title': 'Renamed'},
+    ]})
+    assert response.status_code == 200
+    assert [result.get('error') for result in response.get_json()['results']] == [
+        'task_id must be a string', 'assignee_id must be a string', None]
+
+
+def test_bulk_status_rejects_non_string_ids(seeded):
+    response = seeded.patch('/api/tasks/bulk-status', json={'task_ids': [['x'], {}, 't1'],
+                                                            'status': 'Completed'})
+    assert response.status_code == 200
+    assert [result.get('error') for result in response.get_json()['results']] == [
+        'task_id must be a string', 'task_id must be a string', None]
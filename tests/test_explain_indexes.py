@@ -0,0 +1,99 @@
+"""
+EXPLAIN check for the filter and skill search indexes
+The schema is built with `flask db upgrade`, so a migration that drops or
+renames an index fails here. On SQLite the test asserts the planner picks
+the index. On PostgreSQL sequential scans are forced off (enable_seqscan)
+before EXPLAIN: the test then checks that the index is usable for the
+filter, not that the planner would choose it on a table this small.
+"""
+import pytest
+from sqlalchemy import text
+from benchmarks.common import populate
+from conftest import make_app, drop_app
+
+N_TASKS = 20000
+
+
+def _task(**filters):
+    from models import Task
+    return Task.query.filter_by(**filters)
+
+
+def _employee(**filters):
+    from models import Employee
+    return Employee.query.filter_by(**filters)
+
+
+def _project(**filters):
+    from models import Project
+    return Project.query.filter_by(**filters)
+
+
+def _search(skills, languages):
+    from services.skills import search_query
+    return search_query(skills, languages)
+
+
+# (description, query builder, expected index); sorgular app context içinde kurulur
+HOT_QUERIES = [
+    ('tasks ?status=&priority=', lambda: _task(status='Pending', priority='high'),
+     'ix_tasks_status_priority'),
+    ('tasks ?status=', lambda: _task(status='Blocked'), 'ix_tasks_status_priority'),
+    ('tasks ?assignee_id=&status=', lambda: _task(assignee_id='e1', status='Pending'),
+     'ix_tasks_assignee_status'),
+    ('employee workload / by-assignee', lambda: _task(assignee_id='e1'), 'ix_tasks_assignee_status'),
+    ('tasks ?project_id=&status=', lambda: _task(project_id='p1', status='Completed'),
+     'ix_tasks_project_status'),
+    ('project tasks / stats', lambda: _task(project_id='p1'), 'ix_tasks_project_status'),
+    ('employees ?role=', lambda: _employee(user_role='pm'), 'ix_employees_user_role'),
+    ('projects ?status=', lambda: _project(status='On Hold'), 'ix_projects_status'),
+    ('employees/search ?skill=', lambda: _search({'python': 4, 'docker': 2}, []),
+     'ix_employee_skills_name_level'),
+    ('employees/search ?language=', lambda: _search({}, ['en']), 'ix_employee_languages_language'),
+]
+
+
+def explain(db, query):
+    """Plan text of a query for the current dialect"""
+    dialect = db.engine.dialect
+    sql = str(query.statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+    if dialect.name == 'sqlite':
+        rows = db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}')).fetchall()
+        return '\n'.join(str(row[-1]) for row in rows)
+    # Düşük kardinaliteli filtrelerde (ör. 4 durum) PostgreSQL bu veri boyutunda haklı olarak
+    # seq scan seçebilir; seq scan kapatılınca indeksin predicate ile eşleştiği doğrulanır
+    db.session.execute(text('SET enable_seqscan = off'))
+    return '\n'.join(row[0] for row in db.session.execute(text(f'EXPLAIN {sql}')))
+
+
+@pytest.fixture(scope='module')
+def migrated_app():
+    """App whose schema comes from the migrations, filled with synthetic data"""
+    from flask_migrate import upgrade
+    from extensions import db
+
+    app = make_app()
+    with app.app_context():
+        db.drop_all()
+        db.session.execute(text('DROP TABLE IF EXISTS alembic_version'))
+        db.session.commit()
+        upgrade()
+
+        populate(N_TASKS)
+        db.session.execute(text('ANALYZE'))
+        db.session.commit()
+    yield app
+    with app.app_context():
+        db.session.execute(text('DROP TABLE IF EXISTS alembic_version'))
+        db.session.commit()
+    drop_app(app)
+
+
+@pytest.mark.parametrize('name, build, index', HOT_QUERIES, ids=[q[0] for q in HOT_QUERIES])
+def test_filter_uses_index(migrated_app, name, build, index):
+    from extensions import db
+
+    with migrated_app.app_context():
+        plan = explain(db, build())
+        db.session.rollback()
+    assert index in plan, f'{name}: {index} not in plan\n{plan}'
@@ -0,0 +1,31 @@
+"""Assignee recommendation with skill levels outside the matrix range"""
+
+
+def _employee(employee_id, skills):
+    return {'employee_id': employee_id, 'name': employee_id, 'role': 'Developer',
+            'user_role': 'executor', 'avatar': '', 'skills': skills}
+
+
+def _recommend(client):
+    response = client.post('/api/tasks/recommend-assignee',
+                           json={'required_skills': [{'name': 'python', 'level': 4}], 'top_k': 5})
+    assert response.status_code == 200, response.get_json()
+    return {r['employee_id']: r for r in response.get_json()['recommendations']}
+
+
+def test_out_of_range_levels_are_clamped(client):
+    assert client.post('/api/employees', json=_employee(
+        'e1', [{'name': 'python', 'level': 300}, {'name': 'go', 'level': -5}])).status_code == 201
+    assert client.post('/api/employees', json=_employee(
+        'e2', [{'name': 'python', 'level': 2}])).status_code == 201
+
+    ranked = _recommend(client)
+    assert list(ranked) == ['e1', 'e2']
+
+    # Kısmi yenileme yolu: matris kurulduktan sonra değişen çalışan
+    response = client.put('/api/employees/e2', json={'skills': [{'name': 'python', 'level': 1000}]})
+    assert response.status_code == 200
+    assert set(_recommend(client)) == {'e1', 'e2'}
+
+    response = client.get('/api/employees/search?skill=python:300')
+    assert response.status_code == 200
@@ -0,0 +1,68 @@
+"""
+SQL statements per request of the task listings must not grow with the
+number of tasks (no N+1 for the enriched assignee/project names)
+"""
+import pytest
+from sqlalchemy import event
+from benchmarks.common import populate
+from conftest import make_app, drop_app
+
+SIZES = (500, 5000)
+PATHS = [
+    '/api/tasks',
+    '/api/tasks?enrich=false',
+    '/api/tasks?limit=100',
+    '/api/tasks/by-assignee/e1',
+    '/api/tasks/by-project/p1',
+    '/api/projects/p1/tasks',
+]
+
+
+def count_statements(app, client, path):
+    """Number of SQL statements executed while serving GET path"""
+    from extensions import db
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = client.get(path)
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    assert response.status_code == 200, (path, response.status_code)
+    return len(statements)
+
+
+@pytest.fixture(scope='module')
+def counts():
+    """{(path, task count): statements} measured on a fresh database per size"""
+    from extensions import db, response_cache
+
+    app = make_app()
+    # Her istek veritabanına gitmeli
+    response_cache.enabled = False
+    client = app.test_client()
+    result = {}
+    try:
+        for n_tasks in SIZES:
+            with app.app_context():
+                db.drop_all()
+                db.create_all()
+                populate(n_tasks)
+            for path in PATHS:
+                result[path, n_tasks] = count_statements(app, client, path)
+    finally:
+        response_cache.enabled = True
+        drop_app(app)
+    return result
+
+
+@pytest.mark.parametrize('path', PATHS)
+def test_statement_count_does_not_grow_with_tasks(counts, path):
+    per_size = {n_tasks: counts[path, n_tasks] for n_tasks in SIZES}
+    assert len(set(per_size.values())) == 1, f'GET {path}: statements per task count {per_size}'
@@ -0,0 +1,30 @@
+"""
+Production WSGI entry point
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+The app is created and warmed up once at import (services/warmup.py). With
+preload_app (gunicorn.conf.py) that happens in the master process, so forked
+workers start with mappers configured and the warm-up paths' SQL compiled.
+Per-process caches (responses, recommendation matrix) start empty; each worker
+fills its own and opens its own connection pool (post_fork -> init_worker).
+"""
+import os
+import time
+
+_started = time.perf_counter()
+
+from app import create_app
+from extensions import db
+from services.warmup import warm_up
+
+app = create_app(os.environ.get('FLASK_ENV', 'production'))
+startup = {'create_app_ms': round((time.perf_counter() - _started) * 1000, 1)}
+
+if app.config['WARMUP_ENABLED']:
+    startup.update(warm_up(app, db))
+
+# Modül importu (Flask, SQLAlchemy, NumPy) dahil toplam soğuk başlangıç süresi
+startup['total_ms'] = round((time.perf_counter() - _started) * 1000, 1)
+app.extensions['startup'] = startup
+app.logger.info('Startup: %s', startup)